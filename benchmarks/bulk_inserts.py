@@ -0,0 +1,77 @@
+"""Inserting 10k account transactions, row by row against executemany.
+
+The row by row path is the one TransactionSQLRepository used before bulk writes,
+one execute per transaction with a timestamp taken for each of them.
+
+    python benchmarks/bulk_inserts.py [--rows 10000] [--runs 5]
+"""
+
+import argparse
+from datetime import datetime
+
+from common import account_txs, best_of, open_database
+from dateutil.tz import tzlocal
+from domain.transactions import Transactions
+from infrastructure.repository.transaction.transaction_repository import (
+    TransactionSQLRepository,
+)
+
+
+def insert_per_row(client, txs):
+    with client.tx() as cursor:
+        for tx in txs:
+            cursor.execute(
+                """
+                INSERT INTO account_transactions (id, ref, name, amount, currency, type, date,
+                                                  entity_id, is_real, created_at,
+                                                  fees, retentions, interest_rate, avg_balance)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    str(tx.id),
+                    tx.ref,
+                    tx.name,
+                    str(tx.amount),
+                    tx.currency,
+                    tx.type.value,
+                    tx.date.isoformat(),
+                    str(tx.entity.id),
+                    tx.is_real,
+                    datetime.now(tzlocal()).isoformat(),
+                    str(tx.fees),
+                    str(tx.retentions),
+                    str(tx.interest_rate) if tx.interest_rate else None,
+                    str(tx.avg_balance) if tx.avg_balance else None,
+                ),
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    txs = account_txs(args.rows)
+
+    with open_database() as client:
+        repository = TransactionSQLRepository(client)
+
+        def clear():
+            with client.tx() as cursor:
+                cursor.execute("DELETE FROM account_transactions")
+
+        def bulk():
+            repository.save(Transactions(account=txs))
+
+        # Each run starts from an empty table
+        per_row_time = best_of(args.runs, lambda: insert_per_row(client, txs), clear)
+        bulk_time = best_of(args.runs, bulk, clear)
+
+    print(f"{args.rows} rows, best of {args.runs}")
+    print(f"execute per row  {per_row_time * 1000:>9.1f} ms")
+    print(f"executemany      {bulk_time * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import sys
+import tempfile
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "finanze"))
+
+from dateutil.tz import tzlocal
+from domain.data_init import DatasourceInitParams
+from domain.dezimal import Dezimal
+from domain.global_position import ProductType
+from domain.native_entities import MY_INVESTOR, TRADE_REPUBLIC
+from domain.transactions import AccountTx, TxType
+from domain.user import User
+from infrastructure.repository.db.client import DBClient
+from infrastructure.repository.db.manager import DBManager
+
+PASSWORD = "benchmark"
+ENTITIES = [MY_INVESTOR, TRADE_REPUBLIC]
+
+
+@contextmanager
+def open_database() -> Generator[DBClient, None, None]:
+    # Fresh SQLCipher database with the full schema, opened like the app does
+    with tempfile.TemporaryDirectory() as path:
+        client = DBClient()
+        manager = DBManager(client)
+        user = User(id=uuid4(), username="benchmark", path=Path(path), last_login=None)
+        manager.initialize(DatasourceInitParams(user=user, password=PASSWORD))
+        try:
+            yield client
+        finally:
+            manager.lock()
+
+
+def account_txs(count: int, prefix: str = "") -> list[AccountTx]:
+    start = datetime(2015, 1, 1, tzinfo=tzlocal())
+    return [
+        AccountTx(
+            id=uuid4(),
+            ref=f"{prefix}{i}",
+            name=f"Interest {i}",
+            amount=Dezimal(i % 1000) / 100,
+            currency="EUR",
+            type=TxType.INTEREST,
+            date=start + timedelta(minutes=17 * i),
+            entity=ENTITIES[i % len(ENTITIES)],
+            is_real=True,
+            product_type=ProductType.ACCOUNT,
+            fees=Dezimal(0),
+            retentions=Dezimal(i % 100) / 1000,
+        )
+        for i in range(count)
+    ]
+
+
+def best_of(
+    runs: int, func: Callable[[], None], setup: Callable[[], None] | None = None
+) -> float:
+    timings = []
+    for _ in range(runs):
+        if setup:
+            setup()
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return min(timings)
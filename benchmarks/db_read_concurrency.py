@@ -0,0 +1,92 @@
+"""Read throughput of DBClient while a writer keeps transactions open.
+
+Compares reads served by the reader pool against reads serialized on the writer
+connection, the behavior before WAL and the pool.
+
+    python benchmarks/db_read_concurrency.py [--readers 4] [--seconds 5]
+"""
+
+import argparse
+import statistics
+import threading
+import time
+
+from common import account_txs, open_database
+from domain.transactions import TransactionQueryRequest, Transactions
+from infrastructure.repository.transaction.transaction_repository import (
+    TransactionSQLRepository,
+)
+
+SEED_TXS = 20_000
+WRITE_BATCH = 500
+# Time a fetch typically keeps its commit transaction open
+WRITE_HOLD_SECONDS = 0.05
+
+
+def run(client, repository, readers: int, seconds: float) -> list[float]:
+    stop = threading.Event()
+    latencies: list[float] = []
+    latencies_lock = threading.Lock()
+
+    def writer():
+        batch = 0
+        while not stop.is_set():
+            with client.tx():
+                txs = account_txs(WRITE_BATCH, prefix=f"w{time.time_ns()}-{batch}-")
+                repository.save(Transactions(account=txs))
+                time.sleep(WRITE_HOLD_SECONDS)
+            batch += 1
+
+    def reader():
+        own = []
+        query = TransactionQueryRequest(limit=50)
+        while not stop.is_set():
+            start = time.perf_counter()
+            repository.get_by_filters(query)
+            own.append(time.perf_counter() - start)
+        with latencies_lock:
+            latencies.extend(own)
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return latencies
+
+
+def report(name: str, latencies: list[float], seconds: float):
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else 0
+    print(
+        f"{name:<12} {len(latencies) / seconds:>10.1f} reads/s"
+        f"   p50 {statistics.median(latencies) * 1000:>8.2f} ms"
+        f"   p95 {p95 * 1000:>8.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    with open_database() as client:
+        repository = TransactionSQLRepository(client)
+        repository.save(Transactions(account=account_txs(SEED_TXS)))
+
+        pooled = run(client, repository, args.readers, args.seconds)
+
+        # Without readers every read() waits for the writer lock
+        client.close_readers()
+        serialized = run(client, repository, args.readers, args.seconds)
+
+    report("reader pool", pooled, args.seconds)
+    report("serialized", serialized, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
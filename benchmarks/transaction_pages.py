@@ -0,0 +1,90 @@
+"""Loading deep pages of GET /transactions over a large history.
+
+Compares the UNION ALL with LIMIT/OFFSET query used before the transaction
+index, offset pages over the index and keyset (cursor) pages over the index.
+
+    python benchmarks/transaction_pages.py [--rows 100000] [--limit 50] [--runs 5]
+"""
+
+import argparse
+from functools import partial
+
+from common import account_txs, best_of, open_database
+from domain.transactions import (
+    TransactionCursor,
+    TransactionQueryRequest,
+    Transactions,
+)
+from infrastructure.repository.transaction.transaction_repository import (
+    TransactionSQLRepository,
+)
+
+UNION_PAGE_SQL = """
+    SELECT tx.*, e.name AS entity_name, e.type as entity_type, e.is_real AS entity_is_real
+    FROM (SELECT id, ref, name, amount, currency, type, date, entity_id, is_real,
+                 product_type, fees, retentions,
+                 NULL AS interest_rate, NULL AS avg_balance,
+                 isin, ticker, market, shares, price, net_amount, order_date, linked_tx,
+                 interests
+          FROM investment_transactions
+          UNION ALL
+          SELECT id, ref, name, amount, currency, type, date, entity_id, is_real,
+                 'ACCOUNT' AS product_type, fees, retentions, interest_rate, avg_balance,
+                 NULL AS isin, NULL AS ticker, NULL AS market, NULL AS shares,
+                 NULL AS price, NULL AS net_amount, NULL AS order_date,
+                 NULL AS linked_tx, NULL AS interests
+          FROM account_transactions) tx
+             JOIN entities e ON tx.entity_id = e.id
+    ORDER BY tx.date DESC
+    LIMIT ? OFFSET ?
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with open_database() as client:
+        repository = TransactionSQLRepository(client)
+        repository.save(Transactions(account=account_txs(args.rows)))
+
+        def union_page(page: int):
+            with client.read() as cursor:
+                cursor.execute(UNION_PAGE_SQL, (args.limit, (page - 1) * args.limit))
+                cursor.fetchall()
+
+        def offset_page(page: int):
+            repository.get_by_filters(
+                TransactionQueryRequest(page=page, limit=args.limit)
+            )
+
+        last_page = args.rows // args.limit
+        pages = sorted({1, 10, 100, last_page // 2, last_page})
+
+        print(f"{args.rows} transactions, {args.limit} per page, best of {args.runs}")
+        print(
+            f"{'page':>8} {'union+offset':>14} {'index+offset':>14} {'index+cursor':>14}"
+        )
+        for page in pages:
+            # Cursor pages start after the last transaction of the previous page
+            cursor = None
+            if page > 1:
+                previous = repository.get_by_filters(
+                    TransactionQueryRequest(page=page - 1, limit=args.limit)
+                )[-1]
+                cursor = TransactionCursor(date=previous.date, id=previous.id)
+            cursor_query = TransactionQueryRequest(limit=args.limit, cursor=cursor)
+
+            timings = [
+                best_of(args.runs, partial(union_page, page)),
+                best_of(args.runs, partial(offset_page, page)),
+                best_of(args.runs, partial(repository.get_by_filters, cursor_query)),
+            ]
+            print(f"{page:>8}" + "".join(f"{t * 1000:>11.2f} ms" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
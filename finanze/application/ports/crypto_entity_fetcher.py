@@ -9,3 +9,11 @@ class CryptoEntityFetcher(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def fetch(self, request: CryptoFetchRequest) -> CryptoCurrencyWallet:
         raise FeatureNotSupported
+
+    def supports_multiple_addresses(self) -> bool:
+        return False
+
+    def fetch_multiple(
+        self, requests: list[CryptoFetchRequest]
+    ) -> list[CryptoCurrencyWallet]:
+        raise FeatureNotSupported
@@ -0,0 +1,7 @@
+import abc
+
+
+class DBMaintenancePort(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def optimize(self):
+        raise NotImplementedError
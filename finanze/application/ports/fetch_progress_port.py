@@ -0,0 +1,9 @@
+import abc
+
+from domain.fetch_progress import FetchProgressEvent
+
+
+class FetchProgressPort(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def publish(self, event: FetchProgressEvent):
+        raise NotImplementedError
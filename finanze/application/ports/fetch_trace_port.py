@@ -0,0 +1,28 @@
+import abc
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from domain.fetch_trace import FetchRun, FetchRunQuery
+
+
+class FetchTracePort(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def save(self, run: FetchRun):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_by_id(self, run_id: UUID) -> Optional[FetchRun]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_slowest(self, query: FetchRunQuery) -> list[FetchRun]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_all(self, query: FetchRunQuery) -> list[FetchRun]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete_before(self, date: datetime):
+        raise NotImplementedError
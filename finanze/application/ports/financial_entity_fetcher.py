@@ -1,6 +1,8 @@
 import abc
+from typing import Container
 
 from domain.auto_contributions import AutoContributions
+from domain.entity import Feature
 from domain.entity_login import EntityLoginParams, EntityLoginResult
 from domain.exception.exceptions import FeatureNotSupported
 from domain.fetch_result import FetchOptions
@@ -9,6 +11,9 @@ from domain.transactions import Transactions
 
 
 class FinancialEntityFetcher(metaclass=abc.ABCMeta):
+    def concurrent_features(self) -> set[Feature]:
+        return set()
+
     async def login(self, login_params: EntityLoginParams) -> EntityLoginResult:
         raise NotImplementedError
 
@@ -19,7 +24,7 @@ class FinancialEntityFetcher(metaclass=abc.ABCMeta):
         raise FeatureNotSupported
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self, registered_txs: Container[str], options: FetchOptions
     ) -> Transactions:
         raise FeatureNotSupported
 
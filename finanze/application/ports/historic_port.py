@@ -16,3 +16,15 @@ class HistoricPort(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def delete_by_entity(self, entity_id: UUID):
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_by_entity(self, entity_id: UUID) -> list[BaseHistoricEntry]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def upsert(self, entries: list[BaseHistoricEntry]):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, entry_ids: list[UUID]):
+        raise NotImplementedError
@@ -0,0 +1,10 @@
+import abc
+from typing import Any, Coroutine
+
+from domain.job import Job
+
+
+class JobPort(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def submit(self, job_type: str, coro: Coroutine[Any, Any, Any]) -> Job:
+        raise NotImplementedError
@@ -0,0 +1,18 @@
+import abc
+from uuid import UUID
+
+
+class MovementCachePort(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def get(self, entity_id: UUID) -> list[dict]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def append(
+        self,
+        entity_id: UUID,
+        scope: str,
+        movements: list[tuple[str, dict]],
+        clear: bool = False,
+    ):
+        raise NotImplementedError
@@ -4,7 +4,8 @@ from typing import Optional
 from uuid import UUID
 
 from domain.entity import Entity
-from domain.global_position import GlobalPosition, PositionQueryRequest
+from domain.global_position import GlobalPosition, PositionQueryRequest, PositionTotal
+from domain.position_history import PositionAggregate, PositionHistoryQuery
 
 
 class PositionPort(metaclass=abc.ABCMeta):
@@ -23,3 +24,32 @@ class PositionPort(metaclass=abc.ABCMeta):
         self, entity_id: UUID, date: datetime.date, is_real: bool
     ):
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_compactable(
+        self,
+        keep_all_from: datetime.datetime,
+        keep_daily_from: datetime.datetime,
+        limit: int,
+    ) -> list[UUID]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete_positions(self, global_position_ids: list[UUID]):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_latest_totals(
+        self, query: Optional[PositionQueryRequest] = None
+    ) -> list[PositionTotal]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_daily_aggregates(
+        self, query: PositionHistoryQuery
+    ) -> list[PositionAggregate]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def rebuild_latest(self):
+        raise NotImplementedError
@@ -0,0 +1,17 @@
+import abc
+from typing import Optional
+from uuid import UUID
+
+
+class SyncCursorPort(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def get(self, entity_id: UUID, scope: str) -> Optional[str]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def save(self, entity_id: UUID, scope: str, cursor: str):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, entity_id: UUID, scope: str):
+        raise NotImplementedError
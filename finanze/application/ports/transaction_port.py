@@ -1,8 +1,13 @@
 import abc
-from typing import Optional
+from typing import Container, Optional
 from uuid import UUID
 
-from domain.transactions import BaseTx, TransactionQueryRequest, Transactions
+from domain.transactions import (
+    BaseInvestmentTx,
+    BaseTx,
+    TransactionQueryRequest,
+    Transactions,
+)
 
 
 class TransactionPort(metaclass=abc.ABCMeta):
@@ -15,13 +20,19 @@ class TransactionPort(metaclass=abc.ABCMeta):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def get_refs_by_entity(self, entity_id: UUID) -> set[str]:
+    def get_refs_by_entity(self, entity_id: UUID) -> Container[str]:
         raise NotImplementedError
 
     @abc.abstractmethod
     def get_by_entity(self, entity_id: UUID) -> Transactions:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def get_investment_by_names(
+        self, entity_id: UUID, names: list[str]
+    ) -> list[BaseInvestmentTx]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get_refs_by_source_type(self, real: bool) -> set[str]:
         raise NotImplementedError
@@ -35,5 +46,5 @@ class TransactionPort(metaclass=abc.ABCMeta):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def delete_for_real_entity(self, entity_id: UUID):
+    def delete_stale_for_real_entity(self, entity_id: UUID, fetched: Transactions):
         raise NotImplementedError
@@ -0,0 +1,53 @@
+import logging
+from datetime import datetime, timedelta
+
+from application.ports.config_port import ConfigPort
+from application.ports.db_maintenance_port import DBMaintenancePort
+from application.ports.position_port import PositionPort
+from dateutil.tz import tzlocal
+from domain.use_cases.compact_positions import CompactPositions
+
+
+class CompactPositionsImpl(CompactPositions):
+    def __init__(
+        self,
+        position_port: PositionPort,
+        db_maintenance_port: DBMaintenancePort,
+        config_port: ConfigPort,
+    ):
+        self._position_port = position_port
+        self._db_maintenance_port = db_maintenance_port
+        self._config_port = config_port
+
+        self._log = logging.getLogger(__name__)
+
+    def execute(self) -> int:
+        retention = self._config_port.load().data.positionRetention
+        if not retention.enabled:
+            return 0
+
+        now = datetime.now(tzlocal())
+        keep_all_from = now - timedelta(days=retention.keepAllDays)
+        keep_daily_from = now - timedelta(
+            days=max(retention.keepDailyDays, retention.keepAllDays)
+        )
+
+        deleted = 0
+        while True:
+            compactable = self._position_port.get_compactable(
+                keep_all_from, keep_daily_from, retention.batchSize
+            )
+            if not compactable:
+                break
+
+            self._position_port.delete_positions(compactable)
+            deleted += len(compactable)
+
+            if len(compactable) < retention.batchSize:
+                break
+
+        if deleted:
+            self._log.info(f"Compacted {deleted} historical positions")
+            self._db_maintenance_port.optimize()
+
+        return deleted
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+from typing import AsyncIterator
+
+from application.ports.config_port import ConfigPort
+from application.ports.fetch_progress_port import FetchProgressPort
+from domain import native_entities
+from domain.entity import Entity, EntityType
+from domain.exception.exceptions import EntityNotFound, ExecutionConflict
+from domain.fetch_progress import (
+    FetchProgress,
+    FetchSource,
+    FetchStage,
+    FetchStageStatus,
+)
+from domain.fetch_result import (
+    EntityFetchResult,
+    FetchAllRequest,
+    FetchRequest,
+    FetchResult,
+    FetchResultCode,
+)
+from domain.use_cases.fetch_all_financial_data import FetchAllFinancialData
+from domain.use_cases.fetch_financial_data import FetchFinancialData
+
+
+class FetchAllFinancialDataImpl(FetchAllFinancialData):
+    def __init__(
+        self,
+        fetch_financial_data: FetchFinancialData,
+        config_port: ConfigPort,
+        fetch_progress_port: FetchProgressPort,
+    ):
+        self._fetch_financial_data = fetch_financial_data
+        self._config_port = config_port
+        self._fetch_progress_port = fetch_progress_port
+
+        self._log = logging.getLogger(__name__)
+
+    async def execute(
+        self, fetch_request: FetchAllRequest
+    ) -> AsyncIterator[EntityFetchResult]:
+        entities = []
+        for entity_id in dict.fromkeys(fetch_request.entities):
+            entity = native_entities.get_native_by_id(
+                entity_id, EntityType.FINANCIAL_INSTITUTION
+            )
+            if not entity:
+                raise EntityNotFound(entity_id)
+            entities.append(entity)
+
+        max_concurrency = self._config_port.load().fetch.maxConcurrency
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+        tasks = [
+            asyncio.create_task(self._fetch(semaphore, entity, fetch_request))
+            for entity in entities
+        ]
+        # One FETCH event per entity as soon as it finishes, whatever its result,
+        # so event stream clients can follow the run without waiting for all
+        progress = FetchProgress(
+            self._fetch_progress_port.publish, FetchSource.FINANCIAL
+        )
+        try:
+            for task in asyncio.as_completed(tasks):
+                entity_result = await task
+                progress.emit(
+                    FetchStage.FETCH,
+                    FetchStageStatus.FINISHED,
+                    entity_result.entity_id,
+                    details={"code": entity_result.result.code},
+                )
+                yield entity_result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch(
+        self,
+        semaphore: asyncio.Semaphore,
+        entity: Entity,
+        fetch_request: FetchAllRequest,
+    ) -> EntityFetchResult:
+        # Features not supported by an entity are skipped instead of failing it
+        features = [f for f in fetch_request.features if f in entity.features]
+        if fetch_request.features and not features:
+            return EntityFetchResult(
+                entity_id=entity.id,
+                result=FetchResult(FetchResultCode.FEATURE_NOT_SUPPORTED),
+            )
+
+        request = FetchRequest(
+            entity_id=entity.id,
+            features=features,
+            login_options=fetch_request.login_options,
+            fetch_options=fetch_request.fetch_options,
+        )
+
+        async with semaphore:
+            try:
+                result = await self._fetch_financial_data.execute(request)
+            except ExecutionConflict:
+                result = FetchResult(FetchResultCode.ALREADY_EXECUTING)
+            except Exception as e:
+                self._log.exception(f"Unexpected error fetching {entity.name}")
+                result = FetchResult(
+                    FetchResultCode.UNEXPECTED_ERROR, details={"message": str(e)}
+                )
+
+        return EntityFetchResult(entity_id=entity.id, result=result)
@@ -1,16 +1,17 @@
 import asyncio
 import logging
 from asyncio import Lock
+from contextlib import AsyncExitStack
 from dataclasses import asdict
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from uuid import UUID, uuid4
 
-from application.mixins.atomic_use_case import AtomicUCMixin
 from application.ports.config_port import ConfigPort
 from application.ports.crypto_entity_fetcher import CryptoEntityFetcher
 from application.ports.crypto_price_provider import CryptoPriceProvider
 from application.ports.crypto_wallet_connection_port import CryptoWalletConnectionPort
+from application.ports.fetch_progress_port import FetchProgressPort
 from application.ports.last_fetches_port import LastFetchesPort
 from application.ports.position_port import PositionPort
 from application.ports.transaction_handler_port import TransactionHandlerPort
@@ -24,6 +25,12 @@ from domain.exception.exceptions import (
     ExecutionConflict,
     ExternalIntegrationRequired,
 )
+from domain.fetch_progress import (
+    FetchProgress,
+    FetchSource,
+    FetchStage,
+    count_items,
+)
 from domain.fetch_record import FetchRecord
 from domain.fetch_result import (
     FetchedData,
@@ -45,7 +52,7 @@ from domain.use_cases.fetch_crypto_data import FetchCryptoData
 TARGET_FIAT = "EUR"
 
 
-class FetchCryptoDataImpl(AtomicUCMixin, FetchCryptoData):
+class FetchCryptoDataImpl(FetchCryptoData):
     def __init__(
         self,
         position_port: PositionPort,
@@ -55,15 +62,16 @@ class FetchCryptoDataImpl(AtomicUCMixin, FetchCryptoData):
         config_port: ConfigPort,
         last_fetches_port: LastFetchesPort,
         transaction_handler_port: TransactionHandlerPort,
+        fetch_progress_port: FetchProgressPort,
     ):
-        AtomicUCMixin.__init__(self, transaction_handler_port)
-
         self._position_port = position_port
         self._entity_fetchers = entity_fetchers
         self._crypto_wallet_connection_port = crypto_wallet_connection_port
         self._crypto_price_provider = crypto_price_provider
         self._last_fetches_port = last_fetches_port
         self._config_port = config_port
+        self._transaction_handler_port = transaction_handler_port
+        self._fetch_progress_port = fetch_progress_port
 
         self._locks: dict[UUID, Lock] = {}
 
@@ -99,33 +107,61 @@ class FetchCryptoDataImpl(AtomicUCMixin, FetchCryptoData):
             self._config_port.load().integrations
         )
 
-        fetched_data = []
-        for entity in entities:
-            lock = self._get_lock(entity.id)
+        locks = [self._get_lock(entity.id) for entity in entities]
+        if any(lock.locked() for lock in locks):
+            raise ExecutionConflict()
 
-            if lock.locked():
-                raise ExecutionConflict()
-
-            async with lock:
-                specific_fetcher = self._entity_fetchers[entity]
+        progress = FetchProgress(
+            self._fetch_progress_port.publish, FetchSource.CRYPTO, entity_id
+        )
+        with progress.stage(FetchStage.FETCH):
+            async with AsyncExitStack() as stack:
+                for lock in locks:
+                    await stack.enter_async_context(lock)
 
-                try:
-                    fetched_data.append(
-                        self.get_data(
-                            entity,
-                            specific_fetcher,
-                            fetch_request.fetch_options,
-                            integrations,
+                results = await asyncio.gather(
+                    *[
+                        self._fetch_entity(
+                            entity, fetch_request.fetch_options, integrations, progress
                         )
-                    )
+                        for entity in entities
+                    ]
+                )
 
-                    self._update_last_fetch(entity.id, [Feature.POSITION])
-                except ExternalIntegrationRequired:
-                    pass
+            fetched_data = [data for data in results if data is not None]
+
+            with progress.stage(FetchStage.COMMIT):
+                async with self._transaction_handler_port.start():
+                    for data in fetched_data:
+                        self._position_port.save(data.position)
+                        self._update_last_fetch(
+                            data.position.entity.id, [Feature.POSITION]
+                        )
 
         return FetchResult(FetchResultCode.COMPLETED, data=fetched_data)
 
-    def get_data(
+    async def _fetch_entity(
+        self,
+        entity: Entity,
+        options: FetchOptions,
+        integrations: CryptoFetchIntegrations,
+        progress: FetchProgress,
+    ) -> Optional[FetchedData]:
+        specific_fetcher = self._entity_fetchers[entity]
+        with progress.stage(
+            FetchStage.FEATURE, entity_id=entity.id, feature=Feature.POSITION
+        ) as feature_stage:
+            try:
+                data = await self.get_data(
+                    entity, specific_fetcher, options, integrations
+                )
+            except ExternalIntegrationRequired as e:
+                feature_stage.details["requiredIntegrations"] = e.required_integrations
+                return None
+            feature_stage.count = count_items(data.position)
+            return data
+
+    async def get_data(
         self,
         entity: Entity,
         specific_fetcher: CryptoEntityFetcher,
@@ -136,19 +172,30 @@ class FetchCryptoDataImpl(AtomicUCMixin, FetchCryptoData):
             entity.id
         )
 
-        wallets = []
-        for connection in existing_connections:
-            wallet = specific_fetcher.fetch(
-                CryptoFetchRequest(
-                    connection_id=connection.id,
-                    address=connection.address,
-                    integrations=integrations,
-                )
+        requests = [
+            CryptoFetchRequest(
+                connection_id=connection.id,
+                address=connection.address,
+                integrations=integrations,
+            )
+            for connection in existing_connections
+        ]
+
+        if not requests:
+            wallets = []
+        elif specific_fetcher.supports_multiple_addresses():
+            wallets = await asyncio.to_thread(
+                self._fetch_wallets, specific_fetcher, requests
+            )
+        else:
+            wallets = await asyncio.gather(
+                *[
+                    asyncio.to_thread(self._fetch_wallet, specific_fetcher, request)
+                    for request in requests
+                ]
             )
-            wallet = self._update_market_value(wallet)
-            wallets.append(wallet)
 
-        products = {ProductType.CRYPTO: CryptoCurrencies(wallets)}
+        products = {ProductType.CRYPTO: CryptoCurrencies(list(wallets))}
 
         position = GlobalPosition(
             id=uuid4(),
@@ -156,13 +203,25 @@ class FetchCryptoDataImpl(AtomicUCMixin, FetchCryptoData):
             products=products,
         )
 
-        self._position_port.save(position)
-
         fetched_data = FetchedData(
             position=position,
         )
         return fetched_data
 
+    def _fetch_wallet(
+        self, specific_fetcher: CryptoEntityFetcher, request: CryptoFetchRequest
+    ) -> CryptoCurrencyWallet:
+        wallet = specific_fetcher.fetch(request)
+        return self._update_market_value(wallet)
+
+    def _fetch_wallets(
+        self,
+        specific_fetcher: CryptoEntityFetcher,
+        requests: list[CryptoFetchRequest],
+    ) -> list[CryptoCurrencyWallet]:
+        wallets = specific_fetcher.fetch_multiple(requests)
+        return [self._update_market_value(wallet) for wallet in wallets]
+
     def _update_market_value(
         self, wallet: CryptoCurrencyWallet
     ) -> CryptoCurrencyWallet:
@@ -3,13 +3,14 @@ import logging
 from asyncio import Lock
 from dataclasses import asdict
 from datetime import datetime
-from typing import List, Optional
+from functools import partial
+from typing import Any, Awaitable, Callable, List, Optional
 from uuid import UUID, uuid4
 
-from application.mixins.atomic_use_case import AtomicUCMixin
 from application.ports.auto_contributions_port import AutoContributionsPort
 from application.ports.config_port import ConfigPort
 from application.ports.credentials_port import CredentialsPort
+from application.ports.fetch_progress_port import FetchProgressPort
 from application.ports.financial_entity_fetcher import FinancialEntityFetcher
 from application.ports.historic_port import HistoricPort
 from application.ports.last_fetches_port import LastFetchesPort
@@ -21,8 +22,14 @@ from dateutil.tz import tzlocal
 from domain import native_entities
 from domain.dezimal import Dezimal
 from domain.entity import CredentialType, Entity, EntityType, Feature
-from domain.entity_login import EntityLoginParams, LoginResultCode
+from domain.entity_login import EntityLoginParams, EntityLoginResult, LoginResultCode
 from domain.exception.exceptions import EntityNotFound, ExecutionConflict
+from domain.fetch_progress import (
+    FetchProgress,
+    FetchSource,
+    FetchStage,
+    count_items,
+)
 from domain.fetch_record import FetchRecord
 from domain.fetch_result import (
     FETCH_BAD_LOGIN_CODES,
@@ -32,9 +39,14 @@ from domain.fetch_result import (
     FetchResult,
     FetchResultCode,
 )
-from domain.global_position import FactoringDetail, ProductType, RealEstateCFDetail
+from domain.global_position import (
+    FactoringDetail,
+    HistoricalPosition,
+    ProductType,
+    RealEstateCFDetail,
+)
 from domain.historic import BaseHistoricEntry, FactoringEntry, RealEstateCFEntry
-from domain.transactions import TxType
+from domain.transactions import BaseInvestmentTx, Transactions, TxType
 from domain.use_cases.fetch_financial_data import FetchFinancialData
 
 DEFAULT_FEATURES = [Feature.POSITION]
@@ -121,7 +133,62 @@ def _historic_inv_by_name(historical_position):
     return investments_by_name
 
 
-class FetchFinancialDataImpl(AtomicUCMixin, FetchFinancialData):
+# Historic entry fields copied from the position detail they are built from
+HISTORIC_POSITION_FIELDS = {
+    "invested": "amount",
+    "currency": "currency",
+    "last_invest_date": "last_invest_date",
+    "state": "state",
+    "interest_rate": "interest_rate",
+    "gross_interest_rate": "gross_interest_rate",
+    "maturity": "maturity",
+    "extended_maturity": "extended_maturity",
+    "type": "type",
+    "business_type": "business_type",
+}
+
+
+def _tx_content(tx: BaseInvestmentTx) -> dict:
+    content = asdict(tx)
+    del content["id"], content["entity"]
+    return content
+
+
+def _changed_tx_names(
+    stored: list[BaseInvestmentTx], fetched: list[BaseInvestmentTx]
+) -> set[str]:
+    stored_by_ref = {tx.ref: tx for tx in stored if tx.is_real}
+    fetched_refs = {tx.ref for tx in fetched}
+
+    names = set()
+    for tx in fetched:
+        stored_tx = stored_by_ref.get(tx.ref)
+        if stored_tx is None or _tx_content(stored_tx) != _tx_content(tx):
+            names.add(tx.name)
+            if stored_tx is not None:
+                names.add(stored_tx.name)
+
+    # Stored txs missing from a deep fetch are deleted as stale
+    names.update(
+        tx.name for ref, tx in stored_by_ref.items() if ref not in fetched_refs
+    )
+    return names
+
+
+def _historic_position_changed(inv: dict, entry: BaseHistoricEntry) -> bool:
+    for entry_field, inv_field in HISTORIC_POSITION_FIELDS.items():
+        if not hasattr(entry, entry_field):
+            continue
+        value = inv.get(inv_field)
+        stored = getattr(entry, entry_field)
+        if isinstance(stored, Dezimal) and value is not None:
+            value = Dezimal(value)
+        if value != stored:
+            return True
+    return False
+
+
+class FetchFinancialDataImpl(FetchFinancialData):
     def __init__(
         self,
         position_port: PositionPort,
@@ -134,9 +201,8 @@ class FetchFinancialDataImpl(AtomicUCMixin, FetchFinancialData):
         sessions_port: SessionsPort,
         last_fetches_port: LastFetchesPort,
         transaction_handler_port: TransactionHandlerPort,
+        fetch_progress_port: FetchProgressPort,
     ):
-        AtomicUCMixin.__init__(self, transaction_handler_port)
-
         self._position_port = position_port
         self._auto_contr_repository = auto_contr_port
         self._transaction_port = transaction_port
@@ -146,6 +212,8 @@ class FetchFinancialDataImpl(AtomicUCMixin, FetchFinancialData):
         self._credentials_port = credentials_port
         self._sessions_port = sessions_port
         self._last_fetches_port = last_fetches_port
+        self._transaction_handler_port = transaction_handler_port
+        self._fetch_progress_port = fetch_progress_port
 
         self._locks: dict[UUID, Lock] = {}
 
@@ -176,109 +244,131 @@ class FetchFinancialDataImpl(AtomicUCMixin, FetchFinancialData):
             raise ExecutionConflict()
 
         async with lock:
-            if Feature.POSITION in features:
-                update_cooldown = self._get_position_update_cooldown()
-                last_fetch = self._last_fetches_port.get_by_entity_id(entity_id)
-                last_fetch = next(
-                    (
-                        record
-                        for record in last_fetch
-                        if record.feature == Feature.POSITION
-                    ),
-                    None,
-                )
-                if last_fetch:
-                    last_fetch = last_fetch.date
-                if (
-                    last_fetch
-                    and (datetime.now(tzlocal()) - last_fetch).seconds < update_cooldown
-                ):
-                    remaining_seconds = (
-                        update_cooldown - (datetime.now(tzlocal()) - last_fetch).seconds
-                    )
-                    details = {
-                        "lastUpdate": last_fetch.astimezone(tzlocal()).isoformat(),
-                        "wait": remaining_seconds,
-                    }
-                    return FetchResult(FetchResultCode.COOLDOWN, details=details)
-
-            credentials = self._credentials_port.get(entity.id)
-            if not credentials:
-                return FetchResult(FetchResultCode.NO_CREDENTIALS_AVAILABLE)
-
-            for cred_name, cred_type in entity.credentials_template.items():
-                if (
-                    cred_type != CredentialType.INTERNAL
-                    and cred_type != CredentialType.INTERNAL_TEMP
-                    and cred_name not in credentials
-                ):
-                    return FetchResult(FetchResultCode.INVALID_CREDENTIALS)
-
-            specific_fetcher = self._entity_fetchers[entity]
-
-            stored_session = self._sessions_port.get(entity.id)
-            login_request = EntityLoginParams(
-                credentials=credentials,
-                two_factor=fetch_request.two_factor,
-                options=fetch_request.login_options,
-                session=stored_session,
+            progress = FetchProgress(
+                self._fetch_progress_port.publish, FetchSource.FINANCIAL, entity_id
             )
-            login_result = await specific_fetcher.login(login_request)
-            login_result_code = login_result.code
-            login_message = login_result.message
-
-            if login_result_code == LoginResultCode.CODE_REQUESTED:
-                return FetchResult(
-                    FetchResultCode.CODE_REQUESTED,
-                    details={
-                        "message": login_message,
-                        "processId": login_result.process_id,
-                    },
+            with progress.stage(FetchStage.FETCH) as fetch_stage:
+                # Fetchers block on I/O inside their coroutines, so the fetch runs
+                # in its own thread and event loop, keeping the shared one responsive
+                result = await asyncio.to_thread(
+                    asyncio.run,
+                    self._fetch(entity, features, fetch_request, progress),
                 )
+                fetch_stage.details["code"] = result.code
+            return result
 
-            elif login_result_code == LoginResultCode.MANUAL_LOGIN:
-                return FetchResult(
-                    FETCH_BAD_LOGIN_CODES[login_result_code],
-                    details={"credentials": login_result.details},
-                )
+    async def _fetch(
+        self,
+        entity: Entity,
+        features: List[Feature],
+        fetch_request: FetchRequest,
+        progress: FetchProgress,
+    ) -> FetchResult:
+        entity_id = entity.id
 
-            elif login_result_code == LoginResultCode.LOGIN_REQUIRED:
-                self._credentials_port.update_expiration(
-                    entity.id, datetime.now(tzlocal())
-                )
-                return FetchResult(
-                    FETCH_BAD_LOGIN_CODES[login_result_code],
-                    details={"message": login_message},
+        if Feature.POSITION in features:
+            update_cooldown = self._get_position_update_cooldown()
+            last_fetch = self._last_fetches_port.get_by_entity_id(entity_id)
+            last_fetch = next(
+                (record for record in last_fetch if record.feature == Feature.POSITION),
+                None,
+            )
+            if last_fetch:
+                last_fetch = last_fetch.date
+            if (
+                last_fetch
+                and (datetime.now(tzlocal()) - last_fetch).seconds < update_cooldown
+            ):
+                remaining_seconds = (
+                    update_cooldown - (datetime.now(tzlocal()) - last_fetch).seconds
                 )
+                details = {
+                    "lastUpdate": last_fetch.astimezone(tzlocal()).isoformat(),
+                    "wait": remaining_seconds,
+                }
+                return FetchResult(FetchResultCode.COOLDOWN, details=details)
+
+        credentials = self._credentials_port.get(entity.id)
+        if not credentials:
+            return FetchResult(FetchResultCode.NO_CREDENTIALS_AVAILABLE)
+
+        for cred_name, cred_type in entity.credentials_template.items():
+            if (
+                cred_type != CredentialType.INTERNAL
+                and cred_type != CredentialType.INTERNAL_TEMP
+                and cred_name not in credentials
+            ):
+                return FetchResult(FetchResultCode.INVALID_CREDENTIALS)
+
+        specific_fetcher = self._entity_fetchers[entity]
+
+        stored_session = self._sessions_port.get(entity.id)
+        login_request = EntityLoginParams(
+            credentials=credentials,
+            two_factor=fetch_request.two_factor,
+            options=fetch_request.login_options,
+            session=stored_session,
+        )
+        with progress.stage(FetchStage.LOGIN) as login_stage:
+            login_result = await specific_fetcher.login(login_request)
+            login_stage.details["code"] = login_result.code
+        login_result_code = login_result.code
+        login_message = login_result.message
+
+        if login_result_code == LoginResultCode.CODE_REQUESTED:
+            return FetchResult(
+                FetchResultCode.CODE_REQUESTED,
+                details={
+                    "message": login_message,
+                    "processId": login_result.process_id,
+                },
+            )
 
-            elif login_result_code not in [
-                LoginResultCode.CREATED,
-                LoginResultCode.RESUMED,
-            ]:
-                return FetchResult(
-                    FETCH_BAD_LOGIN_CODES[login_result_code],
-                    details={"message": login_message},
-                )
+        elif login_result_code == LoginResultCode.MANUAL_LOGIN:
+            return FetchResult(
+                FETCH_BAD_LOGIN_CODES[login_result_code],
+                details={"credentials": login_result.details},
+            )
+
+        elif login_result_code == LoginResultCode.LOGIN_REQUIRED:
+            self._credentials_port.update_expiration(entity.id, datetime.now(tzlocal()))
+            return FetchResult(
+                FETCH_BAD_LOGIN_CODES[login_result_code],
+                details={"message": login_message},
+            )
 
-            elif login_result_code == LoginResultCode.CREATED:
-                self._credentials_port.update_last_usage(entity.id)
-                self._credentials_port.update_expiration(entity.id, None)
+        elif login_result_code not in [
+            LoginResultCode.CREATED,
+            LoginResultCode.RESUMED,
+        ]:
+            return FetchResult(
+                FETCH_BAD_LOGIN_CODES[login_result_code],
+                details={"message": login_message},
+            )
 
-                session = login_result.session
-                if session:
-                    self._sessions_port.delete(entity.id)
-                    self._sessions_port.save(entity.id, session)
+        if not features:
+            features = DEFAULT_FEATURES
 
-            if not features:
-                features = DEFAULT_FEATURES
+        fetched_data, historical_position = await self.get_data(
+            entity, features, specific_fetcher, fetch_request.fetch_options, progress
+        )
 
-            fetched_data = await self.get_data(
-                entity, features, specific_fetcher, fetch_request.fetch_options
-            )
+        with progress.stage(FetchStage.COMMIT):
+            async with self._transaction_handler_port.start():
+                if login_result_code == LoginResultCode.CREATED:
+                    self._save_login(entity, login_result)
+
+                self._save_data(
+                    entity,
+                    features,
+                    fetched_data,
+                    historical_position,
+                    fetch_request.fetch_options,
+                )
 
-            self._update_last_fetch(entity_id, features)
+                self._update_last_fetch(entity_id, features)
 
-            return FetchResult(FetchResultCode.COMPLETED, data=fetched_data)
+        return FetchResult(FetchResultCode.COMPLETED, data=fetched_data)
 
     async def get_data(
         self,
@@ -286,50 +376,129 @@ class FetchFinancialDataImpl(AtomicUCMixin, FetchFinancialData):
         features: List[Feature],
         specific_fetcher: FinancialEntityFetcher,
         options: FetchOptions,
-    ) -> FetchedData:
-        position = None
+        progress: FetchProgress,
+    ) -> tuple[FetchedData, Optional[HistoricalPosition]]:
+        feature_fetches = {}
         if Feature.POSITION in features:
-            position = await specific_fetcher.global_position()
+            feature_fetches[Feature.POSITION] = specific_fetcher.global_position
 
-        auto_contributions = None
         if Feature.AUTO_CONTRIBUTIONS in features:
-            auto_contributions = await specific_fetcher.auto_contributions()
+            feature_fetches[Feature.AUTO_CONTRIBUTIONS] = (
+                specific_fetcher.auto_contributions
+            )
 
-        transactions = None
         if Feature.TRANSACTIONS in features:
-            registered_txs = {}
-            if options.deep:
-                self._transaction_port.delete_for_real_entity(entity.id)
-            else:
+            registered_txs = set()
+            if not options.deep:
                 registered_txs = self._transaction_port.get_refs_by_entity(entity.id)
-            transactions = await specific_fetcher.transactions(registered_txs, options)
-
-        if position:
-            self._position_port.save(position)
+            feature_fetches[Feature.TRANSACTIONS] = partial(
+                specific_fetcher.transactions, registered_txs, options
+            )
 
-        if auto_contributions:
-            self._auto_contr_repository.save(entity.id, auto_contributions)
+        concurrent_features = specific_fetcher.concurrent_features()
+        results = {}
+        for feature, fetch in feature_fetches.items():
+            if feature not in concurrent_features:
+                results[feature] = await self._fetch_feature(progress, feature, fetch)
 
-        historic = None
-        if transactions:
-            self._transaction_port.save(transactions)
+        concurrent_fetches = {
+            feature: fetch
+            for feature, fetch in feature_fetches.items()
+            if feature in concurrent_features
+        }
+        if concurrent_fetches:
+            # Fetchers block on I/O inside their coroutines, so each concurrent
+            # feature is run in its own thread and event loop
+            concurrent_results = await asyncio.gather(
+                *[
+                    asyncio.to_thread(
+                        asyncio.run, self._fetch_feature(progress, feature, fetch)
+                    )
+                    for feature, fetch in concurrent_fetches.items()
+                ]
+            )
+            results.update(zip(concurrent_fetches.keys(), concurrent_results))
 
-            if Feature.HISTORIC in features:
-                entries = await self.build_historic(entity, specific_fetcher)
+        position = results.get(Feature.POSITION)
+        auto_contributions = results.get(Feature.AUTO_CONTRIBUTIONS)
+        transactions = results.get(Feature.TRANSACTIONS)
 
-                self._historic_port.delete_by_entity(entity.id)
-                self._historic_port.save(entries)
+        historical_position = None
+        if transactions and Feature.HISTORIC in features:
+            historical_position = await self._fetch_feature(
+                progress, Feature.HISTORIC, specific_fetcher.historical_position
+            )
 
         fetched_data = FetchedData(
             position=position,
             auto_contributions=auto_contributions,
             transactions=transactions,
-            historic=historic,
         )
-        return fetched_data
+        return fetched_data, historical_position
+
+    async def _fetch_feature(
+        self,
+        progress: FetchProgress,
+        feature: Feature,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        with progress.stage(FetchStage.FEATURE, feature=feature) as feature_stage:
+            result = await fetch()
+            feature_stage.count = count_items(result)
+        return result
+
+    def _save_login(self, entity: Entity, login_result: EntityLoginResult):
+        self._credentials_port.update_last_usage(entity.id)
+        self._credentials_port.update_expiration(entity.id, None)
+
+        session = login_result.session
+        if session:
+            self._sessions_port.delete(entity.id)
+            self._sessions_port.save(entity.id, session)
+
+    def _save_data(
+        self,
+        entity: Entity,
+        features: List[Feature],
+        fetched_data: FetchedData,
+        historical_position: Optional[HistoricalPosition],
+        options: FetchOptions,
+    ):
+        if fetched_data.position:
+            self._position_port.save(fetched_data.position)
+
+        if fetched_data.auto_contributions:
+            self._auto_contr_repository.save(entity.id, fetched_data.auto_contributions)
+
+        refresh_historic = fetched_data.transactions and historical_position
+        stored_investment_txs = []
+        if refresh_historic and options.deep:
+            # Compared with the fetched ones, so only the investments whose txs
+            # the deep refresh adds, changes or deletes get their entry rebuilt
+            stored_investment_txs = self._transaction_port.get_by_entity(
+                entity.id
+            ).investment
+
+        if fetched_data.transactions:
+            self._transaction_port.save(fetched_data.transactions)
+
+        if Feature.TRANSACTIONS in features and options.deep:
+            self._transaction_port.delete_stale_for_real_entity(
+                entity.id, fetched_data.transactions or Transactions()
+            )
+
+        if refresh_historic:
+            fetched_investment_txs = fetched_data.transactions.investment or []
+            if options.deep:
+                changed_names = _changed_tx_names(
+                    stored_investment_txs, fetched_investment_txs
+                )
+            else:
+                changed_names = {tx.name for tx in fetched_investment_txs}
+            self._update_historic(entity, historical_position, changed_names)
 
     def _compute_historic_entry(
-        self, entity, inv, txs_by_name
+        self, entity, inv, txs_by_name, entry_id: Optional[UUID] = None
     ) -> Optional[BaseHistoricEntry]:
         inv_name = inv["name"]
         related_inv_txs = txs_by_name[inv_name]
@@ -354,7 +523,7 @@ class FetchFinancialDataImpl(AtomicUCMixin, FetchFinancialData):
         last_tx_date = max(related_inv_txs, key=lambda txx: txx.date).date
 
         historic_entry_base = {
-            "id": uuid4(),
+            "id": entry_id or uuid4(),
             "name": inv_name,
             "invested": inv.amount,
             "repaid": repaid,
@@ -394,18 +563,62 @@ class FetchFinancialDataImpl(AtomicUCMixin, FetchFinancialData):
 
         return None
 
-    async def build_historic(
-        self, entity: Entity, specific_fetcher: FinancialEntityFetcher
-    ) -> list[BaseHistoricEntry]:
-        historical_position = await specific_fetcher.historical_position()
-
+    def _update_historic(
+        self,
+        entity: Entity,
+        historical_position: HistoricalPosition,
+        changed_names: set[str],
+    ):
         investments_by_name = _historic_inv_by_name(historical_position)
+        existing = {
+            entry.name: entry for entry in self._historic_port.get_by_entity(entity.id)
+        }
+        existing_ids = {name: entry.id for name, entry in existing.items()}
+
+        # Only investments whose txs changed in this fetch, whose position details
+        # (amount, state, maturity...) differ from the stored entry, or that have
+        # no entry yet, are recomputed, the rest keep their entries and related txs
+        changed_names = set(changed_names)
+        changed_names.update(
+            name
+            for name, inv in investments_by_name.items()
+            if name in existing and _historic_position_changed(inv, existing[name])
+        )
+        investments = [
+            inv
+            for name, inv in investments_by_name.items()
+            if name in changed_names or name not in existing_ids
+        ]
+
+        related_txs = self._transaction_port.get_investment_by_names(
+            entity.id, [inv["name"] for inv in investments]
+        )
+        entries = self._build_historic_entries(
+            entity, investments, related_txs, existing_ids
+        )
+
+        updated_names = {entry.name for entry in entries}
+        removed_ids = [
+            entry_id
+            for name, entry_id in existing_ids.items()
+            if name not in investments_by_name
+            or (name in changed_names and name not in updated_names)
+        ]
+
+        self._historic_port.delete(removed_ids)
+        self._historic_port.upsert(entries)
 
-        investments = list(investments_by_name.values())
+    def _build_historic_entries(
+        self,
+        entity: Entity,
+        investments: list[dict],
+        related_txs: list[BaseInvestmentTx],
+        existing_ids: Optional[dict[str, UUID]] = None,
+    ) -> list[BaseHistoricEntry]:
+        existing_ids = existing_ids or {}
 
-        related_txs = self._transaction_port.get_by_entity(entity.id)
         txs_by_name = {}
-        for tx in related_txs.investment:
+        for tx in related_txs:
             if tx.name in txs_by_name:
                 txs_by_name[tx.name].append(tx)
             else:
@@ -418,7 +631,9 @@ class FetchFinancialDataImpl(AtomicUCMixin, FetchFinancialData):
                 self._log.warning(f"No txs for investment {inv_name}")
                 continue
 
-            historic_entry = self._compute_historic_entry(entity, inv, txs_by_name)
+            historic_entry = self._compute_historic_entry(
+                entity, inv, txs_by_name, existing_ids.get(inv_name)
+            )
             if historic_entry is None:
                 continue
 
@@ -4,7 +4,6 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from application.ports.crypto_price_provider import CryptoPriceProvider
 from application.ports.exchange_rate_provider import ExchangeRateProvider
 from application.ports.metal_price_provider import MetalPriceProvider
-from cachetools import TTLCache, cached
 from domain.commodity import COMMODITY_SYMBOLS
 from domain.exchange_rate import ExchangeRates
 from domain.global_position import (
@@ -27,9 +26,14 @@ class GetExchangeRatesImpl(GetExchangeRates):
         self._metal_price_provider = metal_price_provider
         self._log = logging.getLogger(__name__)
 
-    @cached(TTLCache(maxsize=1, ttl=600))
+    # Prices are cached by each provider, with their hits and misses in /metrics,
+    # so only the matrix is built here. It is copied, as the provider's one is
+    # shared with everyone reading rates
     def execute(self) -> ExchangeRates:
-        fiat_matrix = self._exchange_rates_provider.get_matrix()
+        fiat_matrix = {
+            base: dict(rates)
+            for base, rates in self._exchange_rates_provider.get_matrix().items()
+        }
 
         commodity_rates, crypto_rates = self._fetch_all_rates_parallel()
         self._apply_rates_to_matrix(fiat_matrix, commodity_rates, crypto_rates)
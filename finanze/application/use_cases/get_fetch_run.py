@@ -0,0 +1,14 @@
+from typing import Optional
+from uuid import UUID
+
+from application.ports.fetch_trace_port import FetchTracePort
+from domain.fetch_trace import FetchRun
+from domain.use_cases.get_fetch_run import GetFetchRun
+
+
+class GetFetchRunImpl(GetFetchRun):
+    def __init__(self, fetch_trace_port: FetchTracePort):
+        self._fetch_trace_port = fetch_trace_port
+
+    def execute(self, run_id: UUID) -> Optional[FetchRun]:
+        return self._fetch_trace_port.get_by_id(run_id)
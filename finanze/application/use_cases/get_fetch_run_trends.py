@@ -0,0 +1,61 @@
+from itertools import groupby
+
+from application.ports.fetch_trace_port import FetchTracePort
+from dateutil.tz import tzlocal
+from domain.fetch_trace import (
+    FetchDurationStats,
+    FetchRun,
+    FetchRunQuery,
+    FetchRunTrend,
+)
+from domain.use_cases.get_fetch_run_trends import GetFetchRunTrends
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    values = sorted(values)
+    rank = (len(values) - 1) * percentile
+    lower = int(rank)
+    upper = min(lower + 1, len(values) - 1)
+    return round(values[lower] + (values[upper] - values[lower]) * (rank - lower), 3)
+
+
+def _stats(values: list[float]) -> FetchDurationStats:
+    return FetchDurationStats(
+        p50=_percentile(values, 0.5), p95=_percentile(values, 0.95)
+    )
+
+
+def _trend_key(run: FetchRun) -> tuple:
+    return (
+        str(run.entity_id or ""),
+        run.source.value,
+        run.started_at.astimezone(tzlocal()).date().isoformat(),
+    )
+
+
+class GetFetchRunTrendsImpl(GetFetchRunTrends):
+    def __init__(self, fetch_trace_port: FetchTracePort):
+        self._fetch_trace_port = fetch_trace_port
+
+    def execute(self, query: FetchRunQuery) -> list[FetchRunTrend]:
+        runs = sorted(self._fetch_trace_port.get_all(query), key=_trend_key)
+
+        trends = []
+        for (_, _, day), group in groupby(runs, key=_trend_key):
+            group = list(group)
+            breakdowns = [run.breakdown for run in group]
+            trends.append(
+                FetchRunTrend(
+                    entity_id=group[0].entity_id,
+                    source=group[0].source,
+                    date=day,
+                    runs=len(group),
+                    duration=_stats([run.duration for run in group]),
+                    login=_stats([b.login for b in breakdowns]),
+                    http=_stats([b.http for b in breakdowns]),
+                    mapping=_stats([b.mapping for b in breakdowns]),
+                    commit=_stats([b.commit for b in breakdowns]),
+                )
+            )
+
+        return trends
@@ -0,0 +1,156 @@
+import logging
+from datetime import date, timedelta
+from itertools import groupby
+from typing import Optional
+from uuid import UUID
+
+from application.ports.exchange_rate_provider import ExchangeRateProvider
+from application.ports.position_port import PositionPort
+from dateutil.relativedelta import relativedelta
+from domain.dezimal import Dezimal
+from domain.exception.exceptions import UnsupportedCurrency
+from domain.exchange_rate import ExchangeRates
+from domain.global_position import ProductType
+from domain.position_history import (
+    HistoryGranularity,
+    PositionAggregate,
+    PositionHistory,
+    PositionHistoryPoint,
+    PositionHistoryQuery,
+)
+from domain.use_cases.get_position_history import GetPositionHistory
+
+LIABILITY_PRODUCTS = {ProductType.LOAN}
+
+
+def _bucket_start(day: date, granularity: HistoryGranularity) -> date:
+    if granularity == HistoryGranularity.WEEKLY:
+        return day - timedelta(days=day.weekday())
+    if granularity == HistoryGranularity.MONTHLY:
+        return day.replace(day=1)
+    return day
+
+
+def _next_bucket(start: date, granularity: HistoryGranularity) -> date:
+    if granularity == HistoryGranularity.WEEKLY:
+        return start + timedelta(days=7)
+    if granularity == HistoryGranularity.MONTHLY:
+        return start + relativedelta(months=1)
+    return start + timedelta(days=1)
+
+
+class GetPositionHistoryImpl(GetPositionHistory):
+    def __init__(
+        self,
+        position_port: PositionPort,
+        exchange_rate_provider: ExchangeRateProvider,
+    ):
+        self._position_port = position_port
+        self._exchange_rate_provider = exchange_rate_provider
+        self._log = logging.getLogger(__name__)
+
+    def execute(self, query: PositionHistoryQuery) -> PositionHistory:
+        currency = query.currency.upper()
+        granularity = query.granularity
+        history = PositionHistory(currency=currency, granularity=granularity, points=[])
+
+        rates = self._exchange_rate_provider.get_matrix()
+        if currency not in rates:
+            raise UnsupportedCurrency(currency)
+
+        aggregates = self._position_port.get_daily_aggregates(query)
+        if not aggregates:
+            return history
+
+        first_day = aggregates[0].date
+        if query.from_date and query.from_date > first_day:
+            first_day = query.from_date
+        last_day = query.to_date or date.today()
+
+        days = [
+            (day, list(day_aggregates))
+            for day, day_aggregates in groupby(aggregates, key=lambda a: a.date)
+        ]
+
+        # Each aggregated day holds the whole value of an entity, which is carried
+        # forward until a later day replaces it
+        values_by_source: dict[tuple[UUID, bool], dict[ProductType, Dezimal]] = {}
+        missing_rates: set[str] = set()
+        day_index = 0
+        bucket = _bucket_start(first_day, granularity)
+        while bucket <= last_day:
+            next_bucket = _next_bucket(bucket, granularity)
+            while day_index < len(days) and days[day_index][0] < next_bucket:
+                self._apply_day(
+                    values_by_source,
+                    days[day_index][1],
+                    currency,
+                    rates,
+                    missing_rates,
+                )
+                day_index += 1
+
+            history.points.append(self._point(bucket, values_by_source))
+            bucket = next_bucket
+
+        if missing_rates:
+            self._log.warning(
+                f"Missing exchange rates to {currency} from {', '.join(sorted(missing_rates))}"
+            )
+
+        return history
+
+    def _apply_day(
+        self,
+        values_by_source: dict[tuple[UUID, bool], dict[ProductType, Dezimal]],
+        aggregates: list[PositionAggregate],
+        currency: str,
+        rates: ExchangeRates,
+        missing_rates: set[str],
+    ):
+        day_values = {}
+        for aggregate in aggregates:
+            source = (aggregate.entity_id, aggregate.is_real)
+            products = day_values.setdefault(source, {})
+            amount = self._convert(
+                aggregate.amount, aggregate.currency, currency, rates
+            )
+            if amount is None:
+                missing_rates.add(aggregate.currency)
+                continue
+            products[aggregate.product_type] = (
+                products.get(aggregate.product_type, Dezimal(0)) + amount
+            )
+
+        values_by_source.update(day_values)
+
+    def _convert(
+        self, amount: Dezimal, currency: str, target: str, rates: ExchangeRates
+    ) -> Optional[Dezimal]:
+        if currency == target:
+            return amount
+
+        rate = rates[target].get(currency)
+        if not rate:
+            return None
+
+        return amount / rate
+
+    def _point(
+        self,
+        bucket: date,
+        values_by_source: dict[tuple[UUID, bool], dict[ProductType, Dezimal]],
+    ) -> PositionHistoryPoint:
+        products = {}
+        for source_products in values_by_source.values():
+            for product_type, amount in source_products.items():
+                products[product_type] = products.get(product_type, Dezimal(0)) + amount
+
+        total = Dezimal(0)
+        for product_type, amount in products.items():
+            if product_type in LIABILITY_PRODUCTS:
+                total -= amount
+            else:
+                total += amount
+
+        return PositionHistoryPoint(date=bucket, total=total, products=products)
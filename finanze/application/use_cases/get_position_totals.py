@@ -0,0 +1,11 @@
+from application.ports.position_port import PositionPort
+from domain.global_position import PositionQueryRequest, PositionTotal
+from domain.use_cases.get_position_totals import GetPositionTotals
+
+
+class GetPositionTotalsImpl(GetPositionTotals):
+    def __init__(self, position_port: PositionPort):
+        self._position_port = position_port
+
+    def execute(self, query: PositionQueryRequest) -> list[PositionTotal]:
+        return self._position_port.get_latest_totals(query)
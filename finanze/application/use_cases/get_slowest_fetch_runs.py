@@ -0,0 +1,11 @@
+from application.ports.fetch_trace_port import FetchTracePort
+from domain.fetch_trace import FetchRun, FetchRunQuery
+from domain.use_cases.get_slowest_fetch_runs import GetSlowestFetchRuns
+
+
+class GetSlowestFetchRunsImpl(GetSlowestFetchRuns):
+    def __init__(self, fetch_trace_port: FetchTracePort):
+        self._fetch_trace_port = fetch_trace_port
+
+    def execute(self, query: FetchRunQuery) -> list[FetchRun]:
+        return self._fetch_trace_port.get_slowest(query)
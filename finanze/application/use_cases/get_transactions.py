@@ -1,5 +1,9 @@
 from application.ports.transaction_port import TransactionPort
-from domain.transactions import TransactionQueryRequest, TransactionsResult
+from domain.transactions import (
+    TransactionCursor,
+    TransactionQueryRequest,
+    TransactionsResult,
+)
 from domain.use_cases.get_transactions import GetTransactions
 
 
@@ -9,4 +13,10 @@ class GetTransactionsImpl(GetTransactions):
 
     def execute(self, query: TransactionQueryRequest) -> TransactionsResult:
         txs = self._transaction_port.get_by_filters(query)
-        return TransactionsResult(transactions=txs)
+
+        next_cursor = None
+        if txs and len(txs) == query.limit:
+            last = txs[-1]
+            next_cursor = TransactionCursor(date=last.date, id=last.id).encode()
+
+        return TransactionsResult(transactions=txs, next_cursor=next_cursor)
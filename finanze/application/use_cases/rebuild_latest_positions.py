@@ -0,0 +1,10 @@
+from application.ports.position_port import PositionPort
+from domain.use_cases.rebuild_latest_positions import RebuildLatestPositions
+
+
+class RebuildLatestPositionsImpl(RebuildLatestPositions):
+    def __init__(self, position_port: PositionPort):
+        self._position_port = position_port
+
+    def execute(self):
+        self._position_port.rebuild_latest()
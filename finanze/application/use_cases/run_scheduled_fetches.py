@@ -0,0 +1,288 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, time
+from functools import partial
+from typing import Awaitable, Callable, Optional
+
+from application.ports.config_port import ConfigPort
+from application.ports.credentials_port import CredentialsPort
+from application.ports.crypto_wallet_connection_port import CryptoWalletConnectionPort
+from application.ports.job_port import JobPort
+from application.ports.last_fetches_port import LastFetchesPort
+from application.ports.position_port import PositionPort
+from dateutil.tz import tzlocal
+from domain import native_entities
+from domain.commodity import CommodityRegister, UpdateCommodityPosition
+from domain.entity import Entity, EntityType, Feature
+from domain.entity_login import LoginOptions
+from domain.exception.exceptions import ExecutionConflict
+from domain.fetch_result import FetchRequest, FetchResultCode
+from domain.global_position import PositionQueryRequest, ProductType
+from domain.native_entities import COMMODITIES
+from domain.settings import FetchScheduleConfig, QuietHoursConfig
+from domain.use_cases.fetch_crypto_data import FetchCryptoData
+from domain.use_cases.fetch_financial_data import FetchFinancialData
+from domain.use_cases.run_scheduled_fetches import RunScheduledFetches
+from domain.use_cases.save_commodities import SaveCommodities
+
+CRYPTO_KEY = "crypto"
+COMMODITIES_KEY = "commodities"
+
+
+def _in_quiet_hours(quiet_hours: Optional[QuietHoursConfig], now: datetime) -> bool:
+    if not quiet_hours:
+        return False
+
+    start = time.fromisoformat(quiet_hours.start)
+    end = time.fromisoformat(quiet_hours.end)
+    current = now.time()
+    if start <= end:
+        return start <= current < end
+    return current >= start or current < end
+
+
+class RunScheduledFetchesImpl(RunScheduledFetches):
+    def __init__(
+        self,
+        fetch_financial_data: FetchFinancialData,
+        fetch_crypto_data: FetchCryptoData,
+        save_commodities: SaveCommodities,
+        position_port: PositionPort,
+        credentials_port: CredentialsPort,
+        crypto_wallet_connection_port: CryptoWalletConnectionPort,
+        last_fetches_port: LastFetchesPort,
+        config_port: ConfigPort,
+        job_port: JobPort,
+    ):
+        self._fetch_financial_data = fetch_financial_data
+        self._fetch_crypto_data = fetch_crypto_data
+        self._save_commodities = save_commodities
+        self._position_port = position_port
+        self._credentials_port = credentials_port
+        self._crypto_wallet_connection_port = crypto_wallet_connection_port
+        self._last_fetches_port = last_fetches_port
+        self._config_port = config_port
+        self._job_port = job_port
+
+        self._in_flight: set = set()
+        self._last_attempts: dict = {}
+        self._jitter: dict = {}
+        self._scrape_slots: Optional[asyncio.Semaphore] = None
+        self._scrape_slots_size = 0
+
+        self._log = logging.getLogger(__name__)
+
+    async def execute(self):
+        logged_entities = self._credentials_port.get_available_entities()
+
+        fetch_config = self._config_port.load().fetch
+        schedule = fetch_config.schedule
+        if not schedule.enabled:
+            return
+
+        now = datetime.now(tzlocal())
+        if _in_quiet_hours(schedule.quietHours, now):
+            return
+
+        if self._scrape_slots_size != schedule.maxConcurrency:
+            self._scrape_slots = asyncio.Semaphore(max(schedule.maxConcurrency, 1))
+            self._scrape_slots_size = schedule.maxConcurrency
+
+        last_positions = {
+            entity.id: record.date
+            for entity, record in self._last_fetches_port.get_grouped_by_entity(
+                Feature.POSITION
+            ).items()
+        }
+
+        for credentials_entry in logged_entities:
+            # Entities that need a new login can't be fetched unattended
+            expiration = credentials_entry.expiration
+            if expiration and expiration < now:
+                continue
+
+            entity = native_entities.get_native_by_id(
+                credentials_entry.entity_id, EntityType.FINANCIAL_INSTITUTION
+            )
+            if not entity or entity.id in self._in_flight:
+                continue
+
+            features = self._due_features(
+                entity, schedule, fetch_config.updateCooldown, now
+            )
+            if features:
+                self._start(
+                    entity.id,
+                    partial(self._fetch_entity, entity, features),
+                    attempts=[(entity.id, feature) for feature in features],
+                    scrape=True,
+                )
+
+        connected_wallets = self._crypto_wallet_connection_port.get_connected_entities()
+        wallet_fetches = [last_positions.get(e) for e in connected_wallets]
+        if connected_wallets and self._is_due(
+            CRYPTO_KEY,
+            None if None in wallet_fetches else min(wallet_fetches),
+            schedule.cryptoInterval,
+            schedule,
+            now,
+        ):
+            self._start(CRYPTO_KEY, self._fetch_crypto)
+
+        if COMMODITIES.id in last_positions and self._is_due(
+            COMMODITIES_KEY,
+            last_positions[COMMODITIES.id],
+            schedule.commoditiesInterval,
+            schedule,
+            now,
+        ):
+            self._start(COMMODITIES_KEY, self._revalue_commodities)
+
+    def _due_features(
+        self,
+        entity: Entity,
+        schedule: FetchScheduleConfig,
+        update_cooldown: int,
+        now: datetime,
+    ) -> list[Feature]:
+        entity_config = next(
+            (e for e in schedule.entities or [] if e.entity == str(entity.id)), None
+        )
+        if entity_config and not entity_config.enabled:
+            return []
+
+        entity_interval = schedule.interval
+        feature_intervals = {}
+        if entity_config:
+            entity_interval = entity_config.interval or entity_interval
+            feature_intervals = {
+                f.feature: f.interval for f in entity_config.features or []
+            }
+
+        last_fetches = {
+            record.feature: record.date
+            for record in self._last_fetches_port.get_by_entity_id(entity.id)
+        }
+
+        due = []
+        for feature in entity.features:
+            interval = feature_intervals.get(feature.value, entity_interval)
+            if interval and feature == Feature.POSITION:
+                interval = max(interval, update_cooldown)
+
+            if self._is_due(
+                (entity.id, feature),
+                last_fetches.get(feature),
+                interval,
+                schedule,
+                now,
+            ):
+                due.append(feature)
+
+        # Historic entries are only built from the transactions of the same fetch
+        if (
+            Feature.HISTORIC in due
+            and Feature.TRANSACTIONS not in due
+            and Feature.TRANSACTIONS in entity.features
+        ):
+            due.append(Feature.TRANSACTIONS)
+
+        return due
+
+    def _is_due(
+        self,
+        key,
+        last_fetch: Optional[datetime],
+        interval: Optional[int],
+        schedule: FetchScheduleConfig,
+        now: datetime,
+    ) -> bool:
+        if not interval or key in self._in_flight:
+            return False
+
+        last_attempt = self._last_attempts.get(key)
+        last_run = max(filter(None, [last_fetch, last_attempt]), default=None)
+        if not last_run:
+            return True
+
+        if key not in self._jitter:
+            self._jitter[key] = random.uniform(0, max(schedule.jitter, 0))
+
+        return (now - last_run).total_seconds() >= interval + self._jitter[key]
+
+    def _start(
+        self,
+        key,
+        run: Callable[[], Awaitable],
+        attempts: Optional[list] = None,
+        scrape: bool = False,
+    ):
+        self._in_flight.add(key)
+        # Run as jobs, so they are listed, kept referenced while running and
+        # cancelled on logout like the requested ones
+        self._job_port.submit(
+            "scheduled_fetch", self._run(key, run, attempts or [key], scrape)
+        )
+
+    async def _run(self, key, run: Callable[[], Awaitable], attempts: list, scrape):
+        try:
+            if scrape:
+                async with self._scrape_slots:
+                    await run()
+            else:
+                await run()
+        except ExecutionConflict:
+            pass
+        except Exception:
+            self._log.exception(f"Scheduled fetch {key} failed")
+        finally:
+            now = datetime.now(tzlocal())
+            for attempt in attempts:
+                self._last_attempts[attempt] = now
+                self._jitter.pop(attempt, None)
+            self._in_flight.discard(key)
+
+    async def _fetch_entity(self, entity: Entity, features: list[Feature]):
+        self._log.info(
+            f"Running scheduled fetch of {entity.name} ({', '.join(features)})"
+        )
+        result = await self._fetch_financial_data.execute(
+            FetchRequest(
+                entity_id=entity.id,
+                features=features,
+                login_options=LoginOptions(avoid_new_login=True),
+            )
+        )
+        if result.code != FetchResultCode.COMPLETED:
+            self._log.warning(
+                f"Scheduled fetch of {entity.name} finished with {result.code.value}"
+            )
+
+    async def _fetch_crypto(self):
+        await self._fetch_crypto_data.execute(
+            FetchRequest(entity_id=None, features=[Feature.POSITION])
+        )
+
+    async def _revalue_commodities(self):
+        positions = self._position_port.get_last_grouped_by_entity(
+            PositionQueryRequest(entities=[COMMODITIES.id], real=True)
+        )
+        position = next(iter(positions.values()), None)
+        commodities = position.products.get(ProductType.COMMODITY) if position else None
+        if not commodities or not commodities.entries:
+            return
+
+        registers = [
+            CommodityRegister(
+                name=commodity.name,
+                type=commodity.type,
+                amount=commodity.amount,
+                unit=commodity.unit,
+                initial_investment=commodity.initial_investment,
+                average_buy_price=commodity.average_buy_price,
+                currency=commodity.currency,
+            )
+            for commodity in commodities.entries
+        ]
+        await self._save_commodities.execute(UpdateCommodityPosition(registers))
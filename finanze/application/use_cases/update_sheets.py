@@ -1,3 +1,4 @@
+import asyncio
 from asyncio import Lock
 from dataclasses import asdict
 from datetime import datetime
@@ -26,6 +27,8 @@ from domain.settings import (
     HistoricSheetConfig,
     PositionSheetConfig,
     ProductSheetConfig,
+    SheetsConfig,
+    SheetsIntegrationConfig,
     TransactionSheetConfig,
 )
 from domain.transactions import Transactions
@@ -98,61 +101,70 @@ class UpdateSheetsImpl(UpdateSheets):
             raise ExecutionConflict()
 
         async with self._lock:
-            sheet_credentials = sheet_config.credentials
+            # Sheets are written with blocking calls, keep them off the shared loop
+            await asyncio.to_thread(
+                self._export, request, sheets_export_config, sheet_config
+            )
 
-            config_globals = sheets_export_config.globals or {}
+    def _export(
+        self,
+        request: ExportRequest,
+        sheets_export_config: SheetsConfig,
+        sheet_config: SheetsIntegrationConfig,
+    ):
+        sheet_credentials = sheet_config.credentials
 
-            position_configs = sheets_export_config.position or []
-            contrib_configs = sheets_export_config.contributions or []
-            tx_configs = sheets_export_config.transactions or []
-            historic_configs = sheets_export_config.historic or []
-            position_configs = apply_global_config(config_globals, position_configs)
-            contrib_configs = apply_global_config(config_globals, contrib_configs)
-            tx_configs = apply_global_config(config_globals, tx_configs)
-            historic_configs = apply_global_config(config_globals, historic_configs)
+        config_globals = sheets_export_config.globals or {}
 
-            real = True if request.options.exclude_non_real else None
+        position_configs = sheets_export_config.position or []
+        contrib_configs = sheets_export_config.contributions or []
+        tx_configs = sheets_export_config.transactions or []
+        historic_configs = sheets_export_config.historic or []
+        position_configs = apply_global_config(config_globals, position_configs)
+        contrib_configs = apply_global_config(config_globals, contrib_configs)
+        tx_configs = apply_global_config(config_globals, tx_configs)
+        historic_configs = apply_global_config(config_globals, historic_configs)
 
-            global_position_by_entity = self._position_port.get_last_grouped_by_entity(
-                PositionQueryRequest(real=real)
-            )
-            last_position_fetches = _map_last_fetch(
-                self._last_fetches_port.get_grouped_by_entity(Feature.POSITION)
-            )
+        real = True if request.options.exclude_non_real else None
 
-            self.update_position_sheets(
-                global_position_by_entity,
-                position_configs,
-                last_position_fetches,
-                sheet_credentials,
-            )
+        global_position_by_entity = self._position_port.get_last_grouped_by_entity(
+            PositionQueryRequest(real=real)
+        )
+        last_position_fetches = _map_last_fetch(
+            self._last_fetches_port.get_grouped_by_entity(Feature.POSITION)
+        )
 
-            auto_contributions = self._auto_contr_port.get_all_grouped_by_entity(
-                ContributionQueryRequest(real=real)
-            )
-            last_contribution_fetches = _map_last_fetch(
-                self._last_fetches_port.get_grouped_by_entity(
-                    Feature.AUTO_CONTRIBUTIONS
-                )
-            )
+        self.update_position_sheets(
+            global_position_by_entity,
+            position_configs,
+            last_position_fetches,
+            sheet_credentials,
+        )
 
-            self.update_contributions(
-                auto_contributions,
-                contrib_configs,
-                last_contribution_fetches,
-                sheet_credentials,
-            )
+        auto_contributions = self._auto_contr_port.get_all_grouped_by_entity(
+            ContributionQueryRequest(real=real)
+        )
+        last_contribution_fetches = _map_last_fetch(
+            self._last_fetches_port.get_grouped_by_entity(Feature.AUTO_CONTRIBUTIONS)
+        )
 
-            transactions = self._transaction_port.get_all(real=real)
-            transactions_last_update = _map_last_fetch(
-                self._last_fetches_port.get_grouped_by_entity(Feature.TRANSACTIONS)
-            )
-            self.update_transactions(
-                transactions, tx_configs, transactions_last_update, sheet_credentials
-            )
+        self.update_contributions(
+            auto_contributions,
+            contrib_configs,
+            last_contribution_fetches,
+            sheet_credentials,
+        )
+
+        transactions = self._transaction_port.get_all(real=real)
+        transactions_last_update = _map_last_fetch(
+            self._last_fetches_port.get_grouped_by_entity(Feature.TRANSACTIONS)
+        )
+        self.update_transactions(
+            transactions, tx_configs, transactions_last_update, sheet_credentials
+        )
 
-            historic = self._historic_port.get_all()
-            self.update_historic(historic, historic_configs, sheet_credentials)
+        historic = self._historic_port.get_all()
+        self.update_historic(historic, historic_configs, sheet_credentials)
 
     def update_position_sheets(
         self,
@@ -1,11 +1,12 @@
+import asyncio
 from asyncio import Lock
 from datetime import datetime
 from uuid import uuid4
 
-from application.mixins.atomic_use_case import AtomicUCMixin
 from application.ports.config_port import ConfigPort
 from application.ports.entity_port import EntityPort
 from application.ports.external_integration_port import ExternalIntegrationPort
+from application.ports.fetch_progress_port import FetchProgressPort
 from application.ports.position_port import PositionPort
 from application.ports.transaction_handler_port import TransactionHandlerPort
 from application.ports.transaction_port import TransactionPort
@@ -16,16 +17,20 @@ from dateutil.tz import tzlocal
 from domain.entity import Feature
 from domain.exception.exceptions import ExecutionConflict, ExternalIntegrationRequired
 from domain.external_integration import ExternalIntegrationId
+from domain.fetch_progress import FetchProgress, FetchSource, FetchStage, count_items
+from domain.settings import SheetsIntegrationConfig, VirtualFetchConfig
 from domain.use_cases.virtual_fetch import VirtualFetch
 from domain.virtual_fetch import VirtualDataImport, VirtualDataSource
 from domain.virtual_fetch_result import (
     VirtualFetchResult,
     VirtualFetchResultCode,
+    VirtualPositionResult,
+    VirtualTransactionResult,
     VirtuallyFetchedData,
 )
 
 
-class VirtualFetchImpl(AtomicUCMixin, VirtualFetch):
+class VirtualFetchImpl(VirtualFetch):
     def __init__(
         self,
         position_port: PositionPort,
@@ -36,9 +41,8 @@ class VirtualFetchImpl(AtomicUCMixin, VirtualFetch):
         config_port: ConfigPort,
         virtual_import_registry: VirtualImportRegistry,
         transaction_handler_port: TransactionHandlerPort,
+        fetch_progress_port: FetchProgressPort,
     ):
-        AtomicUCMixin.__init__(self, transaction_handler_port)
-
         self._position_port = position_port
         self._transaction_port = transaction_port
         self._virtual_fetcher = virtual_fetcher
@@ -46,6 +50,8 @@ class VirtualFetchImpl(AtomicUCMixin, VirtualFetch):
         self._external_integration_port = external_integration_port
         self._config_port = config_port
         self._virtual_import_registry = virtual_import_registry
+        self._transaction_handler_port = transaction_handler_port
+        self._fetch_progress_port = fetch_progress_port
 
         self._lock = Lock()
 
@@ -72,97 +78,135 @@ class VirtualFetchImpl(AtomicUCMixin, VirtualFetch):
             raise ExecutionConflict()
 
         async with self._lock:
-            sheets_credentials = sheet_config.credentials
+            progress = FetchProgress(
+                self._fetch_progress_port.publish, FetchSource.VIRTUAL
+            )
+            with progress.stage(FetchStage.FETCH):
+                return await self._fetch(virtual_fetch_config, sheet_config, progress)
 
-            config_globals = virtual_fetch_config.globals
+    async def _fetch(
+        self,
+        virtual_fetch_config: VirtualFetchConfig,
+        sheet_config: SheetsIntegrationConfig,
+        progress: FetchProgress,
+    ) -> VirtualFetchResult:
+        sheets_credentials = sheet_config.credentials
+
+        config_globals = virtual_fetch_config.globals
+
+        investment_sheets = virtual_fetch_config.position or []
+        transaction_sheets = virtual_fetch_config.transactions or []
+        investment_sheets = apply_global_config(config_globals, investment_sheets)
+        transaction_sheets = apply_global_config(config_globals, transaction_sheets)
+
+        existing_entities = self._entity_port.get_all()
+        existing_entities_by_name = {
+            entity.name: entity for entity in existing_entities
+        }
+
+        # Sheets are read with blocking calls, keep them off the shared loop
+        with progress.stage(
+            FetchStage.FEATURE, feature=Feature.POSITION
+        ) as feature_stage:
+            virtual_position_result = await asyncio.to_thread(
+                asyncio.run,
+                self._virtual_fetcher.global_positions(
+                    sheets_credentials, investment_sheets, existing_entities_by_name
+                ),
+            )
+            feature_stage.count = len(virtual_position_result.positions or [])
+
+        if virtual_position_result.positions:
+            for entity in virtual_position_result.created_entities:
+                existing_entities_by_name[entity.name] = entity
+
+        with progress.stage(
+            FetchStage.FEATURE, feature=Feature.TRANSACTIONS
+        ) as feature_stage:
+            virtual_txs_result = await asyncio.to_thread(
+                asyncio.run,
+                self._virtual_fetcher.transactions(
+                    sheets_credentials,
+                    transaction_sheets,
+                    existing_entities_by_name,
+                ),
+            )
+            feature_stage.count = count_items(virtual_txs_result.transactions)
 
-            investment_sheets = virtual_fetch_config.position or []
-            transaction_sheets = virtual_fetch_config.transactions or []
-            investment_sheets = apply_global_config(config_globals, investment_sheets)
-            transaction_sheets = apply_global_config(config_globals, transaction_sheets)
+        with progress.stage(FetchStage.COMMIT):
+            async with self._transaction_handler_port.start():
+                self._save(virtual_position_result, virtual_txs_result)
 
-            existing_entities = self._entity_port.get_all()
-            existing_entities_by_name = {
-                entity.name: entity for entity in existing_entities
-            }
+        errors = virtual_position_result.errors + virtual_txs_result.errors
+        data = VirtuallyFetchedData(
+            positions=virtual_position_result.positions,
+            transactions=virtual_txs_result.transactions,
+        )
 
-            virtual_position_result = await self._virtual_fetcher.global_positions(
-                sheets_credentials, investment_sheets, existing_entities_by_name
-            )
+        return VirtualFetchResult(
+            VirtualFetchResultCode.COMPLETED,
+            data=data,
+            errors=errors,
+        )
 
-            now = datetime.now(tzlocal())
-            import_id = uuid4()
-            virtual_import_entries = []
-            if virtual_position_result.positions:
-                for entity in virtual_position_result.created_entities:
-                    self._entity_port.insert(entity)
-                    existing_entities_by_name[entity.name] = entity
-
-                for position in virtual_position_result.positions:
-                    self._position_port.save(position)
-                    virtual_import_entries.append(
-                        VirtualDataImport(
-                            import_id=import_id,
-                            global_position_id=position.id,
-                            source=VirtualDataSource.SHEETS,
-                            date=now,
-                            feature=Feature.POSITION,
-                            entity_id=position.entity.id,
-                        )
+    def _save(
+        self,
+        virtual_position_result: VirtualPositionResult,
+        virtual_txs_result: VirtualTransactionResult,
+    ):
+        now = datetime.now(tzlocal())
+        import_id = uuid4()
+        virtual_import_entries = []
+        if virtual_position_result.positions:
+            for entity in virtual_position_result.created_entities:
+                self._entity_port.insert(entity)
+
+            for position in virtual_position_result.positions:
+                self._position_port.save(position)
+                virtual_import_entries.append(
+                    VirtualDataImport(
+                        import_id=import_id,
+                        global_position_id=position.id,
+                        source=VirtualDataSource.SHEETS,
+                        date=now,
+                        feature=Feature.POSITION,
+                        entity_id=position.entity.id,
                     )
+                )
 
-            virtual_txs_result = await self._virtual_fetcher.transactions(
-                sheets_credentials,
-                transaction_sheets,
-                existing_entities_by_name,
-            )
+        self._transaction_port.delete_non_real()
+        transactions = virtual_txs_result.transactions
+        if transactions:
+            for entity in virtual_txs_result.created_entities:
+                self._entity_port.insert(entity)
 
-            self._transaction_port.delete_non_real()
-            transactions = virtual_txs_result.transactions
-            if transactions:
-                for entity in virtual_txs_result.created_entities:
-                    self._entity_port.insert(entity)
-
-                self._transaction_port.save(transactions)
-
-                tx_entities = {
-                    tx.entity.id
-                    for tx in transactions.investment + transactions.account
-                }
-                for entity_id in tx_entities:
-                    virtual_import_entries.append(
-                        VirtualDataImport(
-                            import_id=import_id,
-                            global_position_id=None,
-                            source=VirtualDataSource.SHEETS,
-                            date=now,
-                            feature=Feature.TRANSACTIONS,
-                            entity_id=entity_id,
-                        )
-                    )
+            self._transaction_port.save(transactions)
 
-            if not virtual_import_entries:
+            tx_entities = {
+                tx.entity.id for tx in transactions.investment + transactions.account
+            }
+            for entity_id in tx_entities:
                 virtual_import_entries.append(
                     VirtualDataImport(
                         import_id=import_id,
                         global_position_id=None,
                         source=VirtualDataSource.SHEETS,
                         date=now,
-                        feature=None,
-                        entity_id=None,
+                        feature=Feature.TRANSACTIONS,
+                        entity_id=entity_id,
                     )
                 )
 
-            self._virtual_import_registry.insert(virtual_import_entries)
-
-            errors = virtual_position_result.errors + virtual_txs_result.errors
-            data = VirtuallyFetchedData(
-                positions=virtual_position_result.positions,
-                transactions=transactions,
+        if not virtual_import_entries:
+            virtual_import_entries.append(
+                VirtualDataImport(
+                    import_id=import_id,
+                    global_position_id=None,
+                    source=VirtualDataSource.SHEETS,
+                    date=now,
+                    feature=None,
+                    entity_id=None,
+                )
             )
 
-            return VirtualFetchResult(
-                VirtualFetchResultCode.COMPLETED,
-                data=data,
-                errors=errors,
-            )
+        self._virtual_import_registry.insert(virtual_import_entries)
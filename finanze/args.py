@@ -29,6 +29,17 @@ def app_args() -> argparse.ArgumentParser:
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
         default="INFO",
     )
+    parser.add_argument(
+        "--db-instrumentation",
+        help="Record database statement and lock timings, exposed at /api/v1/debug/db.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--slow-query-ms",
+        help="Log statements slower than this, along with their query plan.",
+        type=int,
+        default=200,
+    )
 
     return parser
 
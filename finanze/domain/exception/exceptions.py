@@ -59,6 +59,10 @@ class TooManyRequests(Exception):
     pass
 
 
+class UnsupportedCurrency(Exception):
+    pass
+
+
 class IntegrationSetupError(Exception):
     pass
 
@@ -0,0 +1,159 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+from uuid import UUID, uuid4
+
+from dateutil.tz import tzlocal
+from pydantic.dataclasses import dataclass
+
+from domain.auto_contributions import AutoContributions
+from domain.entity import Feature
+from domain.global_position import GlobalPosition, HistoricalPosition
+from domain.transactions import Transactions
+
+
+class FetchSource(str, Enum):
+    FINANCIAL = "FINANCIAL"
+    CRYPTO = "CRYPTO"
+    VIRTUAL = "VIRTUAL"
+
+
+class FetchStage(str, Enum):
+    FETCH = "FETCH"
+    LOGIN = "LOGIN"
+    FEATURE = "FEATURE"
+    COMMIT = "COMMIT"
+
+
+class FetchStageStatus(str, Enum):
+    STARTED = "STARTED"
+    FINISHED = "FINISHED"
+    FAILED = "FAILED"
+
+
+@dataclass
+class FetchProgressEvent:
+    fetch_id: UUID
+    source: FetchSource
+    stage: FetchStage
+    status: FetchStageStatus
+    timestamp: datetime
+    entity_id: Optional[UUID] = None
+    feature: Optional[Feature] = None
+    duration: Optional[float] = None
+    count: Optional[int] = None
+    details: Optional[dict] = None
+    job_id: Optional[UUID] = None
+
+
+class ActiveStage(NamedTuple):
+    fetch_id: UUID
+    stage: FetchStage
+    entity_id: Optional[UUID]
+    feature: Optional[Feature]
+
+
+# Innermost stage running in the current context, so the work done inside it,
+# like outbound requests, can be attributed to it
+active_stage: ContextVar[Optional[ActiveStage]] = ContextVar(
+    "active_fetch_stage", default=None
+)
+
+
+@dataclass
+class FetchStageResult:
+    count: Optional[int] = None
+    details: dict = field(default_factory=dict)
+
+
+def count_items(data: Any) -> Optional[int]:
+    if data is None:
+        return None
+    if isinstance(data, (GlobalPosition, HistoricalPosition)):
+        products = data.products if isinstance(data, GlobalPosition) else data.positions
+        return sum(len(getattr(p, "entries", None) or []) for p in products.values())
+    if isinstance(data, Transactions):
+        return len(data.investment or []) + len(data.account or [])
+    if isinstance(data, AutoContributions):
+        return len(data.periodic)
+    return None
+
+
+class FetchProgress:
+    def __init__(
+        self,
+        publish: Callable[[FetchProgressEvent], None],
+        source: FetchSource,
+        entity_id: Optional[UUID] = None,
+    ):
+        self.id = uuid4()
+        self._publish = publish
+        self._source = source
+        self._entity_id = entity_id
+
+    def emit(
+        self,
+        stage: FetchStage,
+        status: FetchStageStatus,
+        entity_id: Optional[UUID] = None,
+        feature: Optional[Feature] = None,
+        duration: Optional[float] = None,
+        count: Optional[int] = None,
+        details: Optional[dict] = None,
+    ):
+        self._publish(
+            FetchProgressEvent(
+                fetch_id=self.id,
+                source=self._source,
+                stage=stage,
+                status=status,
+                timestamp=datetime.now(tzlocal()),
+                entity_id=entity_id or self._entity_id,
+                feature=feature,
+                duration=duration,
+                count=count,
+                details=details or None,
+            )
+        )
+
+    @contextmanager
+    def stage(
+        self,
+        stage: FetchStage,
+        entity_id: Optional[UUID] = None,
+        feature: Optional[Feature] = None,
+    ) -> Iterator[FetchStageResult]:
+        self.emit(stage, FetchStageStatus.STARTED, entity_id, feature)
+        result = FetchStageResult()
+        token = active_stage.set(
+            ActiveStage(self.id, stage, entity_id or self._entity_id, feature)
+        )
+        start = time.perf_counter()
+        try:
+            yield result
+        except BaseException as e:
+            active_stage.reset(token)
+            self.emit(
+                stage,
+                FetchStageStatus.FAILED,
+                entity_id,
+                feature,
+                duration=round(time.perf_counter() - start, 3),
+                details={"error": type(e).__name__, "message": str(e)},
+            )
+            raise
+
+        active_stage.reset(token)
+        self.emit(
+            stage,
+            FetchStageStatus.FINISHED,
+            entity_id,
+            feature,
+            duration=round(time.perf_counter() - start, 3),
+            count=result.count,
+            details=result.details,
+        )
@@ -33,6 +33,10 @@ class FetchResultCode(str, Enum):
     LOGIN_REQUIRED = "LOGIN_REQUIRED"
     UNEXPECTED_LOGIN_ERROR = "UNEXPECTED_LOGIN_ERROR"
 
+    # Execution related codes
+    ALREADY_EXECUTING = "ALREADY_EXECUTING"
+    UNEXPECTED_ERROR = "UNEXPECTED_ERROR"
+
 
 @dataclass
 class FetchOptions:
@@ -49,6 +53,14 @@ class FetchRequest:
 
 
 @dataclass
+class FetchAllRequest:
+    entities: list[UUID]
+    features: list[Feature]
+    login_options: Optional[LoginOptions] = field(default_factory=LoginOptions)
+    fetch_options: Optional[FetchOptions] = field(default_factory=FetchOptions)
+
+
+@dataclass(frozen=True)
 class FetchedData:
     position: Optional[GlobalPosition] = None
     auto_contributions: Optional[AutoContributions] = None
@@ -63,6 +75,12 @@ class FetchResult:
     details: Optional[dict] = None
 
 
+@dataclass
+class EntityFetchResult:
+    entity_id: UUID
+    result: FetchResult
+
+
 FETCH_BAD_LOGIN_CODES = {
     LoginResultCode.INVALID_CODE: FetchResultCode.INVALID_CODE,
     LoginResultCode.INVALID_CREDENTIALS: FetchResultCode.INVALID_CREDENTIALS,
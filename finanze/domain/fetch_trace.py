@@ -0,0 +1,123 @@
+from dataclasses import field
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic.dataclasses import dataclass
+
+from domain.entity import Feature
+from domain.fetch_progress import FetchSource, FetchStage, FetchStageStatus
+
+HTTP_SPAN = "HTTP"
+
+
+@dataclass
+class FetchSpan:
+    kind: str
+    offset: float
+    duration: float
+    stage: Optional[FetchStage] = None
+    entity_id: Optional[UUID] = None
+    feature: Optional[Feature] = None
+    method: Optional[str] = None
+    host: Optional[str] = None
+    path: Optional[str] = None
+    status: Optional[int] = None
+    bytes: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class FetchRunBreakdown:
+    login: float = 0
+    http: float = 0
+    mapping: float = 0
+    commit: float = 0
+
+
+@dataclass
+class FetchRun:
+    id: UUID
+    source: FetchSource
+    status: FetchStageStatus
+    started_at: datetime
+    duration: float
+    breakdown: FetchRunBreakdown
+    entity_id: Optional[UUID] = None
+    features: list[Feature] = field(default_factory=list)
+    code: Optional[str] = None
+    job_id: Optional[UUID] = None
+    spans: Optional[list[FetchSpan]] = None
+
+
+@dataclass
+class FetchRunQuery:
+    entity_id: Optional[UUID] = None
+    source: Optional[FetchSource] = None
+    since: Optional[datetime] = None
+    limit: Optional[int] = None
+
+
+@dataclass
+class FetchDurationStats:
+    p50: float
+    p95: float
+
+
+@dataclass
+class FetchRunTrend:
+    entity_id: Optional[UUID]
+    source: FetchSource
+    date: str
+    runs: int
+    duration: FetchDurationStats
+    login: FetchDurationStats
+    http: FetchDurationStats
+    mapping: FetchDurationStats
+    commit: FetchDurationStats
+
+
+def _covered(intervals: list[tuple[float, float]]) -> float:
+    covered = 0.0
+    end = None
+    for start, stop in sorted(intervals):
+        if end is None or start > end:
+            covered += stop - start
+            end = stop
+        elif stop > end:
+            covered += stop - end
+            end = stop
+    return covered
+
+
+def compute_breakdown(spans: list[FetchSpan]) -> FetchRunBreakdown:
+    # Mapping is the time a feature spent outside of its own HTTP requests,
+    # counting concurrent requests once
+    breakdown = FetchRunBreakdown()
+    http_spans = [s for s in spans if s.kind == HTTP_SPAN]
+
+    for span in spans:
+        if span.kind == FetchStage.LOGIN:
+            breakdown.login += span.duration
+        elif span.kind == FetchStage.COMMIT:
+            breakdown.commit += span.duration
+        elif span.kind == HTTP_SPAN:
+            breakdown.http += span.duration
+        elif span.kind == FetchStage.FEATURE:
+            start, stop = span.offset, span.offset + span.duration
+            requests = [
+                (max(r.offset, start), min(r.offset + r.duration, stop))
+                for r in http_spans
+                if r.stage == FetchStage.FEATURE
+                and r.feature == span.feature
+                and r.entity_id == span.entity_id
+                and r.offset < stop
+                and r.offset + r.duration > start
+            ]
+            breakdown.mapping += max(span.duration - _covered(requests), 0)
+
+    breakdown.login = round(breakdown.login, 3)
+    breakdown.http = round(breakdown.http, 3)
+    breakdown.mapping = round(breakdown.mapping, 3)
+    breakdown.commit = round(breakdown.commit, 3)
+    return breakdown
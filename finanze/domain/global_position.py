@@ -358,3 +358,12 @@ class PositionQueryRequest:
     entities: Optional[list[UUID]] = None
     excluded_entities: Optional[list[UUID]] = None
     real: Optional[bool] = None
+
+
+@dataclass
+class PositionTotal:
+    entity_id: UUID
+    is_real: bool
+    product_type: ProductType
+    currency: str
+    total: Dezimal
@@ -0,0 +1,49 @@
+from datetime import date
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from pydantic.dataclasses import dataclass
+
+from domain.dezimal import Dezimal
+from domain.global_position import ProductType
+
+
+class HistoryGranularity(str, Enum):
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
+
+
+@dataclass
+class PositionAggregate:
+    date: date
+    entity_id: UUID
+    is_real: bool
+    product_type: ProductType
+    currency: str
+    amount: Dezimal
+
+
+@dataclass
+class PositionHistoryQuery:
+    currency: str
+    granularity: HistoryGranularity = HistoryGranularity.DAILY
+    from_date: Optional[date] = None
+    to_date: Optional[date] = None
+    entities: Optional[list[UUID]] = None
+    excluded_entities: Optional[list[UUID]] = None
+
+
+@dataclass
+class PositionHistoryPoint:
+    date: date
+    total: Dezimal
+    products: dict[ProductType, Dezimal]
+
+
+@dataclass
+class PositionHistory:
+    currency: str
+    granularity: HistoryGranularity
+    points: list[PositionHistoryPoint]
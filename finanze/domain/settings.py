@@ -88,10 +88,44 @@ class VirtualFetchConfig:
     transactions: list[VirtualTransactionSheetConfig] | None = None
 
 
+@dataclass
+class ScheduledFeatureConfig:
+    feature: str
+    interval: int
+
+
+@dataclass
+class ScheduledEntityConfig:
+    entity: str
+    enabled: bool = True
+    interval: Optional[int] = None
+    features: list[ScheduledFeatureConfig] | None = None
+
+
+@dataclass
+class QuietHoursConfig:
+    start: str = "00:00"
+    end: str = "07:00"
+
+
+@dataclass
+class FetchScheduleConfig:
+    enabled: bool = False
+    interval: int = 21600
+    cryptoInterval: int = 900
+    commoditiesInterval: int = 3600
+    jitter: int = 600
+    maxConcurrency: int = 1
+    quietHours: QuietHoursConfig | None = None
+    entities: list[ScheduledEntityConfig] | None = None
+
+
 @dataclass
 class FetchConfig:
     virtual: VirtualFetchConfig
     updateCooldown: int
+    maxConcurrency: int = 4
+    schedule: FetchScheduleConfig = field(default_factory=FetchScheduleConfig)
 
 
 @dataclass
@@ -116,12 +150,29 @@ class GeneralConfig:
     defaultCommodityWeightUnit: str = WeightUnit.GRAM.value
 
 
+@dataclass
+class PositionRetentionConfig:
+    enabled: bool = False
+    keepAllDays: int = 30
+    keepDailyDays: int = 365
+    batchSize: int = 500
+    interval: int = 3600
+
+
+@dataclass
+class DataConfig:
+    positionRetention: PositionRetentionConfig = field(
+        default_factory=PositionRetentionConfig
+    )
+
+
 @dataclass
 class Settings:
     general: GeneralConfig = field(default_factory=GeneralConfig)
     integrations: IntegrationsConfig = field(default_factory=IntegrationsConfig)
     export: ExportConfig = field(default_factory=ExportConfig)
     fetch: FetchConfig = field(default_factory=FetchConfig)
+    data: DataConfig = field(default_factory=DataConfig)
 
 
 ProductSheetConfig = (
@@ -1,3 +1,4 @@
+import base64
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -114,9 +115,29 @@ class Transactions:
         return Transactions(investment=investment, account=account)
 
 
+@dataclass
+class TransactionCursor:
+    date: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.date.isoformat()}|{self.id}".encode("UTF-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def decode(token: str) -> "TransactionCursor":
+        try:
+            raw = base64.urlsafe_b64decode(token.encode("ascii")).decode("UTF-8")
+            date, tx_id = raw.split("|")
+            return TransactionCursor(date=datetime.fromisoformat(date), id=UUID(tx_id))
+        except Exception:
+            raise ValueError("Invalid transaction cursor")
+
+
 @dataclass
 class TransactionsResult:
     transactions: list[BaseTx]
+    next_cursor: Optional[str] = None
 
 
 @dataclass
@@ -129,3 +150,4 @@ class TransactionQueryRequest:
     from_date: Optional[datetime] = None
     to_date: Optional[datetime] = None
     types: Optional[list[TxType]] = None
+    cursor: Optional[TransactionCursor] = None
@@ -0,0 +1,7 @@
+import abc
+
+
+class CompactPositions(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def execute(self) -> int:
+        pass
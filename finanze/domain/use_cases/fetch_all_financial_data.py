@@ -0,0 +1,12 @@
+import abc
+from typing import AsyncIterator
+
+from domain.fetch_result import EntityFetchResult, FetchAllRequest
+
+
+class FetchAllFinancialData(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def execute(
+        self, fetch_request: FetchAllRequest
+    ) -> AsyncIterator[EntityFetchResult]:
+        raise NotImplementedError
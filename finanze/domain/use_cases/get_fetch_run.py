@@ -0,0 +1,11 @@
+import abc
+from typing import Optional
+from uuid import UUID
+
+from domain.fetch_trace import FetchRun
+
+
+class GetFetchRun(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def execute(self, run_id: UUID) -> Optional[FetchRun]:
+        pass
@@ -0,0 +1,9 @@
+import abc
+
+from domain.fetch_trace import FetchRunQuery, FetchRunTrend
+
+
+class GetFetchRunTrends(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def execute(self, query: FetchRunQuery) -> list[FetchRunTrend]:
+        pass
@@ -0,0 +1,9 @@
+import abc
+
+from domain.position_history import PositionHistory, PositionHistoryQuery
+
+
+class GetPositionHistory(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def execute(self, query: PositionHistoryQuery) -> PositionHistory:
+        pass
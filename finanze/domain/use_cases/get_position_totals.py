@@ -0,0 +1,9 @@
+import abc
+
+from domain.global_position import PositionQueryRequest, PositionTotal
+
+
+class GetPositionTotals(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def execute(self, query: PositionQueryRequest) -> list[PositionTotal]:
+        pass
@@ -0,0 +1,9 @@
+import abc
+
+from domain.fetch_trace import FetchRun, FetchRunQuery
+
+
+class GetSlowestFetchRuns(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def execute(self, query: FetchRunQuery) -> list[FetchRun]:
+        pass
@@ -0,0 +1,7 @@
+import abc
+
+
+class RebuildLatestPositions(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def execute(self):
+        pass
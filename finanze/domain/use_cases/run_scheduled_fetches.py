@@ -0,0 +1,7 @@
+import abc
+
+
+class RunScheduledFetches(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    async def execute(self):
+        pass
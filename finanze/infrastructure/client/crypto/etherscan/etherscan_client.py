@@ -1,12 +1,14 @@
 import logging
-import time
+from threading import Lock
 from typing import Optional
 
-import requests
 from application.ports.connectable_integration import ConnectableIntegration
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from domain.exception.exceptions import IntegrationSetupError, TooManyRequests
 from domain.external_integration import EtherscanIntegrationData
+from infrastructure.client.http.http_session import shared_session
+from infrastructure.client.http.rate_limiter import RateLimiter
+from infrastructure.metrics.cache_metrics import cached
 
 
 class EtherscanClient(ConnectableIntegration[EtherscanIntegrationData]):
@@ -15,6 +17,7 @@ class EtherscanClient(ConnectableIntegration[EtherscanIntegrationData]):
     COOLDOWN = 0.19
 
     def __init__(self):
+        self._rate_limiter = RateLimiter(1 / self.COOLDOWN)
         self._log = logging.getLogger(__name__)
 
     def setup(self, credentials: EtherscanIntegrationData):
@@ -56,9 +59,10 @@ class EtherscanClient(ConnectableIntegration[EtherscanIntegrationData]):
 
         return self._fetch(params)
 
-    @cached(cache=TTLCache(maxsize=50, ttl=TTL))
+    @cached(cache=TTLCache(maxsize=50, ttl=TTL), lock=Lock())
     def _fetch(self, path: str) -> any:
-        response = requests.get(self.BASE_URL + path)
+        self._rate_limiter.wait()
+        response = shared_session().get(self.BASE_URL + path)
 
         if not response.ok:
             if response.status_code == 429:
@@ -73,13 +77,13 @@ class EtherscanClient(ConnectableIntegration[EtherscanIntegrationData]):
         status = data["status"]
         result = data["result"]
         if status == "0":
-            if result and "Invalid API Key" in result:
+            if data.get("message") == "No transactions found":
+                return []
+            elif result and "Invalid API Key" in result:
                 raise IntegrationSetupError("Invalid API Key")
             elif result and "Max calls" in result:
                 raise TooManyRequests()
             else:
                 raise ValueError()
 
-        time.sleep(self.COOLDOWN)
-
         return result
@@ -1,9 +1,9 @@
 import logging
+from threading import Lock
 from uuid import uuid4
 
-import requests
 from application.ports.crypto_entity_fetcher import CryptoEntityFetcher
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from domain.crypto import CryptoFetchRequest
 from domain.dezimal import Dezimal
 from domain.exception.exceptions import AddressNotFound, TooManyRequests
@@ -11,39 +11,74 @@ from domain.global_position import (
     CryptoCurrency,
     CryptoCurrencyWallet,
 )
+from infrastructure.client.http.http_session import shared_session
 
 
 class BitcoinFetcher(CryptoEntityFetcher):
     TTL = 60
 
-    BASE_URL = "https://blockchain.info/q/addressbalance"
+    BASE_URL = "https://blockchain.info/multiaddr"
     SCALE = Dezimal("1e-8")
 
     def __init__(self):
+        self._balances = TTLCache(maxsize=50, ttl=self.TTL)
+        self._cache_lock = Lock()
         self._log = logging.getLogger(__name__)
 
     def fetch(self, request: CryptoFetchRequest) -> CryptoCurrencyWallet:
-        balance = self._fetch_address(request.address)
+        return self.fetch_multiple([request])[0]
 
-        return CryptoCurrencyWallet(
-            id=uuid4(),
-            wallet_connection_id=request.connection_id,
-            symbol="BTC",
-            crypto=CryptoCurrency.BITCOIN,
-            amount=balance,
-        )
+    def supports_multiple_addresses(self) -> bool:
+        return True
 
-    @cached(cache=TTLCache(maxsize=50, ttl=TTL))
-    def _fetch_address(self, address: str) -> Dezimal:
-        url = f"{self.BASE_URL}/{address}"
-        text = self._fetch(url)
+    def fetch_multiple(
+        self, requests: list[CryptoFetchRequest]
+    ) -> list[CryptoCurrencyWallet]:
+        balances = self._fetch_addresses([request.address for request in requests])
 
-        return Dezimal(text) * self.SCALE
+        return [
+            CryptoCurrencyWallet(
+                id=uuid4(),
+                wallet_connection_id=request.connection_id,
+                symbol="BTC",
+                crypto=CryptoCurrency.BITCOIN,
+                amount=balances[request.address],
+            )
+            for request in requests
+        ]
 
-    def _fetch(self, url: str) -> str:
-        response = requests.get(url)
+    def _fetch_addresses(self, addresses: list[str]) -> dict[str, Dezimal]:
+        with self._cache_lock:
+            balances = {
+                address: self._balances[address]
+                for address in addresses
+                if address in self._balances
+            }
+
+        missing = list(dict.fromkeys(a for a in addresses if a not in balances))
+        if not missing:
+            return balances
+
+        url = f"{self.BASE_URL}?active={'|'.join(missing)}&n=0"
+        fetched = {
+            entry["address"]: Dezimal(entry["final_balance"]) * self.SCALE
+            for entry in self._fetch(url)["addresses"]
+        }
+
+        for address in missing:
+            if address not in fetched:
+                raise AddressNotFound()
+
+        with self._cache_lock:
+            self._balances.update(fetched)
+
+        balances.update(fetched)
+        return balances
+
+    def _fetch(self, url: str) -> dict:
+        response = shared_session().get(url)
         if response.ok:
-            return response.text
+            return response.json()
 
         if response.status_code == 404:
             raise AddressNotFound()
@@ -53,4 +88,4 @@ class BitcoinFetcher(CryptoEntityFetcher):
 
         self._log.error("Error Response Body:" + response.text)
         response.raise_for_status()
-        return ""
+        return {}
@@ -1,7 +1,9 @@
+import json
 import logging
 from uuid import uuid4
 
 from application.ports.crypto_entity_fetcher import CryptoEntityFetcher
+from application.ports.sync_cursor_port import SyncCursorPort
 from domain.crypto import CryptoFetchIntegrations, CryptoFetchRequest
 from domain.dezimal import Dezimal
 from domain.exception.exceptions import ExternalIntegrationRequired
@@ -12,8 +14,13 @@ from domain.global_position import (
     CryptoCurrencyWallet,
     CryptoToken,
 )
+from domain.native_entities import BSC
 from infrastructure.client.crypto.etherscan.etherscan_client import EtherscanClient
 
+TOKENS_SCOPE = "tokens:{address}"
+TOKEN_TX_RESULT_LIMIT = 10000
+BALANCE_MULTI_LIMIT = 20
+
 
 class BSCFetcher(CryptoEntityFetcher):
     CHAIN_ID = 56
@@ -24,78 +31,131 @@ class BSCFetcher(CryptoEntityFetcher):
         contract_address: token for token, contract_address in TOKEN_CONTRACTS.items()
     }
 
-    def __init__(self, etherscan_client: EtherscanClient):
+    def __init__(
+        self, etherscan_client: EtherscanClient, sync_cursor_port: SyncCursorPort
+    ):
         self.etherscan_client = etherscan_client
+        self._sync_cursor_port = sync_cursor_port
 
         self._log = logging.getLogger(__name__)
 
     def fetch(self, request: CryptoFetchRequest) -> CryptoCurrencyWallet:
-        bnb_amount = (
-            Dezimal(
-                self._fetch(
-                    module="account",
-                    action="balance",
-                    address=request.address,
-                    integrations=request.integrations,
+        return self.fetch_multiple([request])[0]
+
+    def supports_multiple_addresses(self) -> bool:
+        return True
+
+    def fetch_multiple(
+        self, requests: list[CryptoFetchRequest]
+    ) -> list[CryptoCurrencyWallet]:
+        bnb_balances = self._fetch_balances(requests)
+
+        return [
+            CryptoCurrencyWallet(
+                id=uuid4(),
+                wallet_connection_id=request.connection_id,
+                symbol="BNB",
+                crypto=CryptoCurrency.BNB,
+                amount=bnb_balances[request.address.lower()],
+                tokens=self._fetch_tokens(request),
+            )
+            for request in requests
+        ]
+
+    def _fetch_balances(self, requests: list[CryptoFetchRequest]) -> dict[str, Dezimal]:
+        addresses = list(dict.fromkeys(request.address for request in requests))
+
+        balances = {}
+        for i in range(0, len(addresses), BALANCE_MULTI_LIMIT):
+            chunk = addresses[i : i + BALANCE_MULTI_LIMIT]
+            entries = self._fetch(
+                module="account",
+                action="balancemulti",
+                address=",".join(chunk),
+                integrations=requests[0].integrations,
+            )
+            for entry in entries:
+                balances[entry["account"].lower()] = (
+                    Dezimal(entry["balance"]) * self.SCALE
+                )
+
+        return balances
+
+    def _fetch_tokens(self, request: CryptoFetchRequest) -> list[CryptoCurrencyToken]:
+        contracts = self._sync_token_contracts(request)
+
+        tokens = []
+        for contract_address, contract in contracts.items():
+            if contract_address not in self.ALLOWED_TOKEN_CONTRACTS:
+                continue
+
+            scale = Dezimal(f"1e-{contract['decimals']}")
+            tokens.append(
+                CryptoCurrencyToken(
+                    id=uuid4(),
+                    token_id=contract_address,
+                    name=contract["name"],
+                    symbol=contract["symbol"],
+                    token=self.ALLOWED_TOKEN_CONTRACTS[contract_address],
+                    amount=Dezimal(contract["balance"]) * scale,
+                    type="bep20",
                 )
             )
-            * self.SCALE
-        )
+
+        return tokens
+
+    def _sync_token_contracts(self, request: CryptoFetchRequest) -> dict[str, dict]:
+        scope = TOKENS_SCOPE.format(address=request.address.lower())
+        raw_state = self._sync_cursor_port.get(BSC.id, scope)
+        state = json.loads(raw_state) if raw_state else {"block": -1, "contracts": {}}
+        contracts = state["contracts"]
 
         token_txs = self._fetch(
             module="account",
             action="tokentx",
             address=request.address,
-            start_block=0,
-            end_block=0,
+            start_block=state["block"] + 1,
             sort="asc",
             integrations=request.integrations,
         )
 
-        tokens = {}
+        touched = set()
+        last_block = state["block"]
         for token_tx in token_txs:
             contract_address = token_tx["contractAddress"]
-            if (
-                contract_address in tokens
-                or contract_address not in self.ALLOWED_TOKEN_CONTRACTS
-            ):
+            touched.add(contract_address)
+            last_block = max(last_block, int(token_tx["blockNumber"]))
+            if contract_address not in contracts:
+                contracts[contract_address] = {
+                    "name": token_tx.get("tokenName"),
+                    "symbol": token_tx.get("tokenSymbol"),
+                    "decimals": token_tx["tokenDecimal"],
+                }
+
+        if len(token_txs) >= TOKEN_TX_RESULT_LIMIT:
+            # The result was truncated, possibly in the middle of its last block
+            last_block -= 1
+
+        updated = last_block != state["block"]
+        for contract_address, contract in contracts.items():
+            if contract_address not in self.ALLOWED_TOKEN_CONTRACTS:
                 continue
 
-            symbol = token_tx.get("tokenSymbol")
-            token_enum = self.ALLOWED_TOKEN_CONTRACTS[contract_address]
-            decimals = token_tx["tokenDecimal"]
-            scale = Dezimal(f"1e-{decimals}")
-            amount = (
-                Dezimal(
-                    self._fetch(
-                        module="account",
-                        action="tokenbalance",
-                        address=request.address,
-                        contract_address=contract_address,
-                        integrations=request.integrations,
-                    )
+            if contract_address in touched or "balance" not in contract:
+                contract["balance"] = self._fetch(
+                    module="account",
+                    action="tokenbalance",
+                    address=request.address,
+                    contract_address=contract_address,
+                    integrations=request.integrations,
                 )
-                * scale
-            )
+                updated = True
 
-            tokens[contract_address] = CryptoCurrencyToken(
-                id=uuid4(),
-                token_id=contract_address,
-                name=token_tx.get("tokenName"),
-                symbol=symbol,
-                token=token_enum,
-                amount=amount,
-                type="bep20",
-            )
+        if updated:
+            state["block"] = last_block
+            self._sync_cursor_port.save(BSC.id, scope, json.dumps(state))
 
-        return CryptoCurrencyWallet(
-            id=uuid4(),
-            wallet_connection_id=request.connection_id,
-            symbol="BNB",
-            crypto=CryptoCurrency.BNB,
-            amount=bnb_amount,
-            tokens=list(tokens.values()),
-        )
+        return contracts
 
     def _fetch(self, integrations: CryptoFetchIntegrations, *args, **kwargs) -> any:
         if not integrations.etherscan:
@@ -1,9 +1,9 @@
 import logging
+from threading import Lock
 from uuid import uuid4
 
-import requests
 from application.ports.crypto_entity_fetcher import CryptoEntityFetcher
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from domain.crypto import CryptoFetchRequest
 from domain.dezimal import Dezimal
 from domain.exception.exceptions import AddressNotFound, TooManyRequests
@@ -13,14 +13,19 @@ from domain.global_position import (
     CryptoCurrencyWallet,
     CryptoToken,
 )
+from infrastructure.client.http.http_session import shared_session
+from infrastructure.client.http.rate_limiter import RateLimiter
+from infrastructure.metrics.cache_metrics import cached
 
 
 class EthereumFetcher(CryptoEntityFetcher):
     TTL = 60
     BASE_URL = "https://api.ethplorer.io/getAddressInfo"
     API_KEY = "freekey"
+    MAX_REQUESTS_PER_SECOND = 2
 
     def __init__(self):
+        self._rate_limiter = RateLimiter(self.MAX_REQUESTS_PER_SECOND)
         self._log = logging.getLogger(__name__)
 
     def fetch(self, request: CryptoFetchRequest) -> CryptoCurrencyWallet:
@@ -77,13 +82,14 @@ class EthereumFetcher(CryptoEntityFetcher):
             )
         return tokens
 
-    @cached(cache=TTLCache(maxsize=50, ttl=TTL))
+    @cached(cache=TTLCache(maxsize=50, ttl=TTL), lock=Lock())
     def _fetch_address_info(self, address: str) -> dict:
         url = f"{self.BASE_URL}/{address}?apiKey={self.API_KEY}"
         return self._fetch(url)
 
     def _fetch(self, url: str) -> dict:
-        response = requests.get(url)
+        self._rate_limiter.wait()
+        response = shared_session().get(url)
 
         if not response.ok:
             if response.status_code == 429:
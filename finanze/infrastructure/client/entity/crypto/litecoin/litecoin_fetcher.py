@@ -1,9 +1,9 @@
 import logging
+from threading import Lock
 from uuid import uuid4
 
-import requests
 from application.ports.crypto_entity_fetcher import CryptoEntityFetcher
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from domain.crypto import CryptoFetchRequest
 from domain.dezimal import Dezimal
 from domain.exception.exceptions import AddressNotFound, TooManyRequests
@@ -11,6 +11,7 @@ from domain.global_position import (
     CryptoCurrency,
     CryptoCurrencyWallet,
 )
+from infrastructure.client.http.http_session import shared_session
 
 
 class LitecoinFetcher(CryptoEntityFetcher):
@@ -18,30 +19,69 @@ class LitecoinFetcher(CryptoEntityFetcher):
 
     BASE_URL = "https://api.blockcypher.com/v1/ltc/main/addrs"
     SCALE = Dezimal("1e-8")
+    MAX_BATCH_SIZE = 3
 
     def __init__(self):
+        self._balances = TTLCache(maxsize=50, ttl=self.TTL)
+        self._cache_lock = Lock()
         self._log = logging.getLogger(__name__)
 
     def fetch(self, request: CryptoFetchRequest) -> CryptoCurrencyWallet:
-        balance = self._fetch_address(request.address)
+        return self.fetch_multiple([request])[0]
 
-        return CryptoCurrencyWallet(
-            id=uuid4(),
-            wallet_connection_id=request.connection_id,
-            symbol="LTC",
-            crypto=CryptoCurrency.LITECOIN,
-            amount=balance,
-        )
+    def supports_multiple_addresses(self) -> bool:
+        return True
 
-    @cached(cache=TTLCache(maxsize=50, ttl=TTL))
-    def _fetch_address(self, address: str) -> Dezimal:
-        url = f"{self.BASE_URL}/{address}/balance"
-        balance = self._fetch(url)["balance"]
+    def fetch_multiple(
+        self, requests: list[CryptoFetchRequest]
+    ) -> list[CryptoCurrencyWallet]:
+        balances = self._fetch_addresses([request.address for request in requests])
 
-        return Dezimal(balance) * self.SCALE
+        return [
+            CryptoCurrencyWallet(
+                id=uuid4(),
+                wallet_connection_id=request.connection_id,
+                symbol="LTC",
+                crypto=CryptoCurrency.LITECOIN,
+                amount=balances[request.address],
+            )
+            for request in requests
+        ]
 
-    def _fetch(self, url: str) -> dict:
-        response = requests.get(url)
+    def _fetch_addresses(self, addresses: list[str]) -> dict[str, Dezimal]:
+        with self._cache_lock:
+            balances = {
+                address: self._balances[address]
+                for address in addresses
+                if address in self._balances
+            }
+
+        missing = list(dict.fromkeys(a for a in addresses if a not in balances))
+        fetched = {}
+        for i in range(0, len(missing), self.MAX_BATCH_SIZE):
+            batch = missing[i : i + self.MAX_BATCH_SIZE]
+            url = f"{self.BASE_URL}/{';'.join(batch)}/balance"
+            results = self._fetch(url)
+            if isinstance(results, dict):
+                results = [results]
+
+            for result in results:
+                if "error" in result:
+                    raise AddressNotFound()
+                fetched[result["address"]] = Dezimal(result["balance"]) * self.SCALE
+
+        for address in missing:
+            if address not in fetched:
+                raise AddressNotFound()
+
+        with self._cache_lock:
+            self._balances.update(fetched)
+
+        balances.update(fetched)
+        return balances
+
+    def _fetch(self, url: str) -> dict | list[dict]:
+        response = shared_session().get(url)
         if response.ok:
             return response.json()
 
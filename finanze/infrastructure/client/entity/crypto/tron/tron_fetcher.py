@@ -1,9 +1,9 @@
 import logging
+from threading import Lock
 from uuid import uuid4
 
-import requests
 from application.ports.crypto_entity_fetcher import CryptoEntityFetcher
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from domain.crypto import CryptoFetchRequest
 from domain.dezimal import Dezimal
 from domain.exception.exceptions import AddressNotFound, TooManyRequests
@@ -13,6 +13,8 @@ from domain.global_position import (
     CryptoCurrencyWallet,
     CryptoToken,
 )
+from infrastructure.client.http.http_session import shared_session
+from infrastructure.metrics.cache_metrics import cached
 
 
 class TronFetcher(CryptoEntityFetcher):
@@ -79,13 +81,13 @@ class TronFetcher(CryptoEntityFetcher):
             )
         return tokens
 
-    @cached(cache=TTLCache(maxsize=50, ttl=TTL))
+    @cached(cache=TTLCache(maxsize=50, ttl=TTL), lock=Lock())
     def _fetch_account_info(self, address: str) -> dict:
         url = f"{self.BASE_URL}?address={address}"
         return self._fetch(url)
 
     def _fetch(self, url: str) -> dict:
-        response = requests.get(url)
+        response = shared_session().get(url)
 
         if not response.ok:
             if response.status_code == 429:
@@ -8,6 +8,7 @@ import tzlocal
 from requests_toolbelt import MultipartEncoder
 
 from domain.entity_login import EntityLoginResult, LoginResultCode
+from infrastructure.client.http.http_session import HttpSession
 
 DATE_FORMAT = "%Y-%m-%d"
 
@@ -72,7 +73,7 @@ class F24APIClient:
         return self._multi_part("/authentication/ajax-check-login-password", data=data)
 
     def login(self, username: str, password: str) -> EntityLoginResult:
-        self._session = requests.Session()
+        self._session = HttpSession()
         self._session.headers["Origin"] = self.BASE_URL
 
         first_login_response = self._request_login(username, password)
@@ -3,7 +3,7 @@ import json
 import re
 from datetime import date, datetime
 from hashlib import sha1
-from typing import Optional
+from typing import Container, Optional
 from uuid import uuid4
 
 from application.ports.financial_entity_fetcher import FinancialEntityFetcher
@@ -266,7 +266,7 @@ class F24Fetcher(FinancialEntityFetcher):
         return self._client.get_positions(user_id)
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self, registered_txs: Container[str], options: FetchOptions
     ) -> Transactions:
         savings_account_id = self._users["savings"]["id"]
         tr_systems_id = self._users["savings"]["trader_systems_id"]
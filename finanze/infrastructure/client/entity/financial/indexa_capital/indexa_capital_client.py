@@ -1,9 +1,11 @@
 import logging
 
 import requests
-from cachetools import cached, TTLCache
+from cachetools import TTLCache
 
 from domain.entity_login import LoginResultCode, EntityLoginResult
+from infrastructure.client.http.http_session import shared_session
+from infrastructure.metrics.cache_metrics import cached
 
 
 class IndexaCapitalClient:
@@ -16,7 +18,7 @@ class IndexaCapitalClient:
     def _execute_request(
         self, path: str, method: str, body: dict | None = None, raw: bool = False
     ) -> dict | requests.Response:
-        response = requests.request(
+        response = shared_session().request(
             method, self.BASE_URL + path, json=body, headers=self._headers
         )
         if raw:
@@ -3,10 +3,12 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 import requests
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from dateutil.tz import tzlocal
 
 from domain.entity_login import EntityLoginResult, LoginResultCode
+from infrastructure.client.http.http_session import HttpSession
+from infrastructure.metrics.cache_metrics import cached
 
 
 def _is_selenium_available() -> bool:
@@ -27,7 +29,7 @@ class MintosAPIClient:
     USER_PATH = f"{BASE_API_URL}/en/webapp-api/user"
 
     def __init__(self):
-        self._session = requests.Session()
+        self._session = HttpSession()
         self._log = logging.getLogger(__name__)
         self._automated_login = _is_selenium_available()
         self._session_expiration = None
@@ -3,9 +3,12 @@ from datetime import date
 from typing import Optional
 
 import requests
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from dateutil.relativedelta import relativedelta
 from domain.entity_login import EntityLoginResult, LoginOptions, LoginResultCode
+from infrastructure.client.http.http_session import shared_session
+from infrastructure.client.http.rate_limiter import RateLimiter
+from infrastructure.metrics.cache_metrics import cached
 
 GET_DATE_FORMAT = "%Y%m%d"
 DATE_FORMAT = "%Y-%m-%d"
@@ -14,9 +17,11 @@ DATE_FORMAT = "%Y-%m-%d"
 class MyInvestorAPIV2Client:
     LOGIN_URL = "https://api.myinvestor.es"
     BASE_URL = "https://app.myinvestor.es"
+    MAX_REQUESTS_PER_SECOND = 8
 
     def __init__(self):
         self._headers = {}
+        self._rate_limiter = RateLimiter(self.MAX_REQUESTS_PER_SECOND)
         self._log = logging.getLogger(__name__)
 
     def _execute_request(
@@ -27,7 +32,8 @@ class MyInvestorAPIV2Client:
         raw: bool = False,
         base_url: str = BASE_URL,
     ) -> dict | requests.Response:
-        response = requests.request(
+        self._rate_limiter.wait()
+        response = shared_session().request(
             method, base_url + path, json=body, headers=self._headers
         )
 
@@ -168,7 +174,11 @@ class MyInvestorAPIV2Client:
             raise ValueError("Invalid params")
 
     def check_maintenance(self):
-        return requests.get("https://cms.myinvestor.es/api/maintenances").json()["data"]
+        return (
+            shared_session()
+            .get("https://cms.myinvestor.es/api/maintenances")
+            .json()["data"]
+        )
 
     def get_user(self):
         return self._get_request("/myinvestor-server/api/v3/customers/self")["payload"][
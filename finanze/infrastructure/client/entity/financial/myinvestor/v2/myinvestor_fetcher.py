@@ -1,7 +1,8 @@
 import logging
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Container, Optional
 from uuid import uuid4
 
 from application.ports.financial_entity_fetcher import FinancialEntityFetcher
@@ -16,6 +17,7 @@ from domain.auto_contributions import (
 from domain.constants import CAPITAL_GAINS_BASE_TAX
 from domain.currency_symbols import SYMBOL_CURRENCY_MAP
 from domain.dezimal import Dezimal
+from domain.entity import Feature
 from domain.entity_login import EntityLoginParams, EntityLoginResult
 from domain.fetch_result import FetchOptions
 from domain.global_position import (
@@ -85,6 +87,7 @@ BEGINNING = date.fromisocalendar(2018, 1, 1)
 
 ACCOUNT_TX_FETCH_STEP = relativedelta(months=2)
 STOCKS_TX_FETCH_STEP = relativedelta(months=4)
+ORDER_DETAILS_WORKERS = 4
 
 
 def _get_stock_investments(broker_investments) -> StockInvestments:
@@ -182,6 +185,9 @@ class MyInvestorFetcherV2(FinancialEntityFetcher):
         self._client = MyInvestorAPIV2Client()
         self._log = logging.getLogger(__name__)
 
+    def concurrent_features(self) -> set[Feature]:
+        return {Feature.POSITION, Feature.AUTO_CONTRIBUTIONS, Feature.TRANSACTIONS}
+
     async def login(self, login_params: EntityLoginParams) -> EntityLoginResult:
         credentials = login_params.credentials
         two_factor = login_params.two_factor
@@ -222,7 +228,7 @@ class MyInvestorFetcherV2(FinancialEntityFetcher):
         return self.fetch_auto_contributions()
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self, registered_txs: Container[str], options: FetchOptions
     ) -> Transactions:
         accounts = self._get_active_owned_accounts()
 
@@ -671,13 +677,13 @@ class MyInvestorFetcherV2(FinancialEntityFetcher):
         return AutoContributions(periodic=periodic_contributions)
 
     def fetch_fund_txs(
-        self, securities_account_id: str, registered_txs: set[str], min_date: date
+        self, securities_account_id: str, registered_txs: Container[str], min_date: date
     ) -> list[FundTx]:
         raw_fund_orders = self._client.get_fund_orders(
             securities_account_id=securities_account_id, from_date=min_date
         )
 
-        fund_txs = []
+        orders = []
         for order in raw_fund_orders:
             ref = order["reference"]
 
@@ -695,9 +701,21 @@ class MyInvestorFetcherV2(FinancialEntityFetcher):
                 )
                 continue
 
-            raw_order_details = self._client.get_fund_order_details(
-                securities_account_id, ref
+            orders.append((order, operation_type))
+
+        with ThreadPoolExecutor(max_workers=ORDER_DETAILS_WORKERS) as executor:
+            order_details = list(
+                executor.map(
+                    lambda entry: self._client.get_fund_order_details(
+                        securities_account_id, entry[0]["reference"]
+                    ),
+                    orders,
+                )
             )
+
+        fund_txs = []
+        for (order, operation_type), raw_order_details in zip(orders, order_details):
+            ref = order["reference"]
             order_date = datetime.strptime(
                 raw_order_details["orderDate"], ISO_DATE_TIME_FORMAT
             )
@@ -737,21 +755,31 @@ class MyInvestorFetcherV2(FinancialEntityFetcher):
         return fund_txs
 
     def fetch_stock_txs(
-        self, securities_account_id: str, registered_txs: set[str], min_date: date
+        self, securities_account_id: str, registered_txs: Container[str], min_date: date
     ) -> list[StockTx]:
-        stock_txs = []
-
+        windows = []
         to_date = from_date = date.today()
         from_date += timedelta(days=1)
         while from_date > min_date:
             from_date -= STOCKS_TX_FETCH_STEP
-            raw_txs = self._client.get_stock_orders(
-                securities_account_id=securities_account_id,
-                from_date=from_date,
-                to_date=to_date,
-                status=None,
+            windows.append((from_date, to_date))
+            to_date -= STOCKS_TX_FETCH_STEP
+
+        with ThreadPoolExecutor(max_workers=ORDER_DETAILS_WORKERS) as executor:
+            raw_txs_by_window = list(
+                executor.map(
+                    lambda window: self._client.get_stock_orders(
+                        securities_account_id=securities_account_id,
+                        from_date=window[0],
+                        to_date=window[1],
+                        status=None,
+                    ),
+                    windows,
+                )
             )
 
+        orders = []
+        for raw_txs in raw_txs_by_window:
             for order in raw_txs:
                 ref = order["id"]
 
@@ -775,57 +803,67 @@ class MyInvestorFetcherV2(FinancialEntityFetcher):
                     )
                     continue
 
-                raw_order_details = self._client.get_stock_order_details(ref)
-                order_date = datetime.strptime(
-                    raw_order_details["orderDate"], ISO_DATE_TIME_FORMAT
+                orders.append((order, operation_type))
+
+        with ThreadPoolExecutor(max_workers=ORDER_DETAILS_WORKERS) as executor:
+            order_details = list(
+                executor.map(
+                    lambda entry: self._client.get_stock_order_details(entry[0]["id"]),
+                    orders,
                 )
+            )
 
-                if not raw_order_details.get("executedShares"):
-                    continue
+        stock_txs = []
+        for (order, operation_type), raw_order_details in zip(orders, order_details):
+            ref = order["id"]
+            order_date = datetime.strptime(
+                raw_order_details["orderDate"], ISO_DATE_TIME_FORMAT
+            )
 
-                amount = round(
-                    Dezimal(raw_order_details["grossAmountOperationCurrency"]), 2
-                )
-                net_amount = round(Dezimal(raw_order_details["netAmountCurrency"]), 2)
-
-                fees = Dezimal(0)
-                if operation_type == TxType.BUY:
-                    # Financial Tx Tax not included in "comisionCorretaje", "comisionMiembroMercado" and "costeCanon"
-                    fees = net_amount - amount
-                elif operation_type == TxType.SELL:
-                    fees = Dezimal(raw_order_details["tradeCommissions"]) + Dezimal(
-                        raw_order_details["otherCommissions"]
-                    )
+            if not raw_order_details.get("executedShares"):
+                continue
 
-                execution_date = datetime.strptime(
-                    raw_order_details["executionDate"], ISO_DATE_TIME_FORMAT
+            amount = round(
+                Dezimal(raw_order_details["grossAmountOperationCurrency"]), 2
+            )
+            net_amount = round(Dezimal(raw_order_details["netAmountCurrency"]), 2)
+
+            fees = Dezimal(0)
+            if operation_type == TxType.BUY:
+                # Financial Tx Tax not included in "comisionCorretaje", "comisionMiembroMercado" and "costeCanon"
+                fees = net_amount - amount
+            elif operation_type == TxType.SELL:
+                fees = Dezimal(raw_order_details["tradeCommissions"]) + Dezimal(
+                    raw_order_details["otherCommissions"]
                 )
 
-                stock_txs.append(
-                    StockTx(
-                        id=uuid4(),
-                        ref=ref,
-                        name=order["toolName"].strip(),
-                        ticker=order["ticker"],
-                        amount=amount,
-                        net_amount=net_amount,
-                        currency=order["currency"],
-                        type=operation_type,
-                        order_date=order_date,
-                        entity=MY_INVESTOR,
-                        isin=raw_order_details["instrumentIsin"],
-                        shares=round(Dezimal(raw_order_details["executedShares"]), 4),
-                        price=round(Dezimal(raw_order_details["priceCurrency"]), 4),
-                        market=order["marketId"],
-                        fees=round(fees, 2),
-                        retentions=Dezimal(0),
-                        date=execution_date,
-                        product_type=ProductType.STOCK_ETF,
-                        is_real=True,
-                        linked_tx=None,
-                    )
-                )
+            execution_date = datetime.strptime(
+                raw_order_details["executionDate"], ISO_DATE_TIME_FORMAT
+            )
 
-            to_date -= STOCKS_TX_FETCH_STEP
+            stock_txs.append(
+                StockTx(
+                    id=uuid4(),
+                    ref=ref,
+                    name=order["toolName"].strip(),
+                    ticker=order["ticker"],
+                    amount=amount,
+                    net_amount=net_amount,
+                    currency=order["currency"],
+                    type=operation_type,
+                    order_date=order_date,
+                    entity=MY_INVESTOR,
+                    isin=raw_order_details["instrumentIsin"],
+                    shares=round(Dezimal(raw_order_details["executedShares"]), 4),
+                    price=round(Dezimal(raw_order_details["priceCurrency"]), 4),
+                    market=order["marketId"],
+                    fees=round(fees, 2),
+                    retentions=Dezimal(0),
+                    date=execution_date,
+                    product_type=ProductType.STOCK_ETF,
+                    is_real=True,
+                    linked_tx=None,
+                )
+            )
 
         return stock_txs
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 import requests
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from dateutil.tz import tzlocal
 
 from domain.entity_login import (
@@ -14,6 +14,8 @@ from domain.entity_login import (
     EntitySession,
     LoginOptions,
 )
+from infrastructure.client.http.http_session import shared_session
+from infrastructure.metrics.cache_metrics import cached
 
 EXPIRATION_DATETIME_REGEX = r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.?\d{0,6})\d*(.*)$"
 
@@ -42,7 +44,7 @@ class SegoAPIClient:
     def _execute_request(
         self, path: str, method: str, body: dict, raw: bool = False
     ) -> dict | requests.Response:
-        response = requests.request(
+        response = shared_session().request(
             method, self.BASE_URL + path, json=body, headers=self._headers
         )
 
@@ -1,13 +1,17 @@
-import copy
+import json
 import logging
 from datetime import date, datetime
 from hashlib import sha1
-from typing import Optional
+from threading import Lock
+from typing import Container, Optional
 from uuid import uuid4
 
 from application.ports.financial_entity_fetcher import FinancialEntityFetcher
+from application.ports.movement_cache_port import MovementCachePort
+from application.ports.sync_cursor_port import SyncCursorPort
 from domain.currency_symbols import SYMBOL_CURRENCY_MAP
 from domain.dezimal import Dezimal
+from domain.entity import Feature
 from domain.entity_login import EntityLoginParams, EntityLoginResult
 from domain.fetch_result import FetchOptions
 from domain.global_position import (
@@ -31,6 +35,9 @@ TAG_TIME_FORMAT = "%H:%M:%S"
 ACTIVE_SEGO_STATES = ["disputa", "gestionando-cobro", "no-llego-fecha-cobro"]
 FINISHED_SEGO_STATES = frozenset({"cobrado", "fallido"})
 
+MOVEMENTS_SCOPE = "movements"
+MOVEMENTS_PAGE_SIZE = 100
+
 
 def parse_tag(tag: str) -> dict:
     tag_props = {}
@@ -76,10 +83,20 @@ def map_txs(
 class SegoFetcher(FinancialEntityFetcher):
     SEGO_FEE = Dezimal(0.2)
 
-    def __init__(self):
+    def __init__(
+        self,
+        sync_cursor_port: SyncCursorPort,
+        movement_cache_port: MovementCachePort,
+    ):
         self._client = SegoAPIClient()
+        self._sync_cursor_port = sync_cursor_port
+        self._movement_cache_port = movement_cache_port
+        self._sync_lock = Lock()
         self._log = logging.getLogger(__name__)
 
+    def concurrent_features(self) -> set[Feature]:
+        return {Feature.POSITION, Feature.TRANSACTIONS}
+
     async def login(self, login_params: EntityLoginParams) -> EntityLoginResult:
         credentials = login_params.credentials
         two_factor = login_params.two_factor
@@ -103,8 +120,8 @@ class SegoFetcher(FinancialEntityFetcher):
             type=AccountType.VIRTUAL_WALLET,
         )
 
-        investment_movements = self._get_normalized_movements(
-            ["TRANSFER"], ["Inversión Factoring"]
+        investment_movements = self._index_by_operation(
+            self._get_normalized_movements(["TRANSFER"], ["Inversión Factoring"])
         )
 
         raw_sego_investments = (
@@ -131,7 +148,9 @@ class SegoFetcher(FinancialEntityFetcher):
 
         return GlobalPosition(id=uuid4(), entity=SEGO, products=products)
 
-    def _map_investment(self, investment_movements, investment) -> FactoringDetail:
+    def _map_investment(
+        self, investment_movements: dict[str, dict], investment
+    ) -> FactoringDetail:
         raw_proj_type = investment["tipoOperacionCodigo"]
         proj_type = None
         if raw_proj_type == "admin-publica":
@@ -155,13 +174,18 @@ class SegoFetcher(FinancialEntityFetcher):
         name = investment["nombreOperacion"].strip()
         interest_rate = Dezimal(investment["tasaInteres"])
 
-        last_invest_date = next(
-            (
-                movement["date"]
-                for movement in investment_movements
-                if name in movement["mensajeCompleto"]
-            ),
-            None,
+        last_invest_movement = investment_movements.get(name)
+        if not last_invest_movement:
+            last_invest_movement = next(
+                (
+                    movement
+                    for movement in investment_movements.values()
+                    if name in movement["mensajeCompleto"]
+                ),
+                None,
+            )
+        last_invest_date = (
+            last_invest_movement["date"] if last_invest_movement else None
         )
 
         return FactoringDetail(
@@ -181,24 +205,92 @@ class SegoFetcher(FinancialEntityFetcher):
             state=state,
         )
 
-    def _get_normalized_movements(self, types=None, subtypes=None) -> list[dict]:
-        if subtypes is None:
-            subtypes = []
-        if types is None:
-            types = []
+    @staticmethod
+    def _index_by_operation(movements: list[dict]) -> dict[str, dict]:
+        indexed = {}
+        for movement in movements:
+            tag = movement.get("tag", None)
+            name = parse_tag(tag).get("operacion") if tag else None
+            key = name.strip() if name else movement["mensajeCompleto"]
+            indexed.setdefault(key, movement)
+
+        return indexed
 
+    @staticmethod
+    def _movement_ref(movement: dict) -> str:
+        return sha1(json.dumps(movement, sort_keys=True).encode("UTF-8")).hexdigest()
+
+    @staticmethod
+    def _is_newest_first(movements: list[dict]) -> bool:
+        if len(movements) < 2:
+            return True
+        first = datetime.strptime(movements[0]["creationDate"], DATETIME_FORMAT)
+        last = datetime.strptime(movements[-1]["creationDate"], DATETIME_FORMAT)
+        return first >= last
+
+    def _fetch_all_movements(self) -> list[dict]:
         raw_movements = []
         page = 1
         while True:
-            fetched_movs = copy.deepcopy(
-                self._client.get_movements(page=page, limit=100)
+            fetched_movs = self._client.get_movements(
+                page=page, limit=MOVEMENTS_PAGE_SIZE
             )
             raw_movements += fetched_movs
 
-            if len(fetched_movs) < 100:
+            if len(fetched_movs) < MOVEMENTS_PAGE_SIZE:
                 break
             page += 1
 
+        return raw_movements
+
+    def _sync_movements(self, reset: bool = False) -> list[dict]:
+        with self._sync_lock:
+            last_ref = None
+            if not reset:
+                last_ref = self._sync_cursor_port.get(SEGO.id, MOVEMENTS_SCOPE)
+
+            new_movements = []
+            found = False
+            page = 1
+            while True:
+                fetched_movs = self._client.get_movements(
+                    page=page, limit=MOVEMENTS_PAGE_SIZE
+                )
+                if page == 1 and not self._is_newest_first(fetched_movs):
+                    self._log.warning(
+                        "SEGO movements are not sorted newest first, skipping cache"
+                    )
+                    return self._fetch_all_movements()
+
+                for movement in fetched_movs:
+                    ref = self._movement_ref(movement)
+                    if ref == last_ref:
+                        found = True
+                        break
+                    new_movements.append((ref, movement))
+
+                if found or len(fetched_movs) < MOVEMENTS_PAGE_SIZE:
+                    break
+                page += 1
+
+            clear = reset or (last_ref is not None and not found)
+            if clear or new_movements:
+                self._movement_cache_port.append(
+                    SEGO.id, MOVEMENTS_SCOPE, new_movements[::-1], clear
+                )
+
+            return self._movement_cache_port.get(SEGO.id)
+
+    def _get_normalized_movements(
+        self, types=None, subtypes=None, reset: bool = False
+    ) -> list[dict]:
+        if subtypes is None:
+            subtypes = []
+        if types is None:
+            types = []
+
+        raw_movements = self._sync_movements(reset)
+
         normalized_movs = []
         for movement in raw_movements:
             if (not types or movement["type"] in types) and (
@@ -235,13 +327,15 @@ class SegoFetcher(FinancialEntityFetcher):
         return sorted(normalized_movs, key=lambda m: m["date"])
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self, registered_txs: Container[str], options: FetchOptions
     ) -> Transactions:
-        factoring_txs = self.fetch_factoring_txs(registered_txs)
+        factoring_txs = self.fetch_factoring_txs(registered_txs, options.deep)
 
         return Transactions(investment=factoring_txs)
 
-    def fetch_factoring_txs(self, registered_txs: set[str]) -> list[FactoringTx]:
+    def fetch_factoring_txs(
+        self, registered_txs: Container[str], deep: bool = False
+    ) -> list[FactoringTx]:
         completed_investments = self._client.get_investments(FINISHED_SEGO_STATES)
 
         txs = self._get_normalized_movements(
@@ -252,6 +346,7 @@ class SegoFetcher(FinancialEntityFetcher):
                 "Ganancias",
                 "Ganancias extraordinarias",
             ],
+            reset=deep,
         )
 
         investment_txs = []
@@ -331,8 +426,8 @@ class SegoFetcher(FinancialEntityFetcher):
         ).hexdigest()
 
     async def historical_position(self) -> HistoricalPosition:
-        investment_movements = self._get_normalized_movements(
-            ["TRANSFER"], ["Inversión Factoring"]
+        investment_movements = self._index_by_operation(
+            self._get_normalized_movements(["TRANSFER"], ["Inversión Factoring"])
         )
 
         raw_sego_investments = (
@@ -23,7 +23,7 @@
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Container, Optional
 
 from pytr.api import TradeRepublicApi, TradeRepublicError
 from pytr.utils import preview
@@ -40,7 +40,7 @@ class TRTimeline:
         self,
         tr: TradeRepublicApi,
         since: Optional[datetime] = None,
-        already_registered_ids: set[str] = None,
+        already_registered_ids: Container[str] = None,
         requested_data: list = TIMELINE_DATA_TYPES,
     ):
         self._tr = tr
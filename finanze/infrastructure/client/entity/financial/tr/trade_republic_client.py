@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Container, Optional
 
 import requests
 from aiocache import cached
@@ -174,7 +174,7 @@ class TradeRepublicClient:
     async def get_transactions(
         self,
         since: Optional[datetime] = None,
-        already_registered_ids: set[str] = None,
+        already_registered_ids: Container[str] = None,
         force_all: bool = False,
     ):
         dl = TRTimeline(
@@ -1,7 +1,7 @@
 import logging
 import re
 from datetime import datetime
-from typing import Optional
+from typing import Container, Optional
 from uuid import uuid4
 
 from application.ports.financial_entity_fetcher import FinancialEntityFetcher
@@ -266,7 +266,7 @@ class TradeRepublicFetcher(FinancialEntityFetcher):
         )
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self, registered_txs: Container[str], options: FetchOptions
     ) -> Transactions:
         raw_txs = await self._client.get_transactions(
             already_registered_ids=registered_txs, force_all=options.deep
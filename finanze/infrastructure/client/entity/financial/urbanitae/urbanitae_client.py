@@ -6,10 +6,12 @@ from typing import Optional
 
 import pyaes
 import requests
-from cachetools import cached, TTLCache
+from cachetools import TTLCache
 from dateutil.relativedelta import relativedelta
 
 from domain.entity_login import EntityLoginResult, LoginResultCode
+from infrastructure.client.http.http_session import shared_session
+from infrastructure.metrics.cache_metrics import cached
 
 DATETIME_FORMAT = "%d/%m/%Y %H:%M:%S"
 
@@ -42,7 +44,7 @@ class UrbanitaeAPIClient:
     def _execute_request(
         self, path: str, method: str, body: dict, raw: bool = False
     ) -> dict | requests.Response:
-        response = requests.request(
+        response = shared_session().request(
             method, self.BASE_URL + path, json=body, headers=self._headers
         )
 
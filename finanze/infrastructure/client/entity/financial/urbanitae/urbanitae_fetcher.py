@@ -1,11 +1,13 @@
 import logging
 from datetime import datetime
+from typing import Container
 from uuid import uuid4
 
 from application.ports.financial_entity_fetcher import FinancialEntityFetcher
 from dateutil.relativedelta import relativedelta
 from domain.constants import CAPITAL_GAINS_BASE_TAX
 from domain.dezimal import Dezimal
+from domain.entity import Feature
 from domain.entity_login import EntityLoginParams, EntityLoginResult
 from domain.fetch_result import FetchOptions
 from domain.global_position import (
@@ -44,6 +46,9 @@ class UrbanitaeFetcher(FinancialEntityFetcher):
         self._client = UrbanitaeAPIClient()
         self._log = logging.getLogger(__name__)
 
+    def concurrent_features(self) -> set[Feature]:
+        return {Feature.POSITION, Feature.TRANSACTIONS}
+
     async def login(self, login_params: EntityLoginParams) -> EntityLoginResult:
         credentials = login_params.credentials
         username, password = credentials["user"], credentials["password"]
@@ -113,7 +118,7 @@ class UrbanitaeFetcher(FinancialEntityFetcher):
         )
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self, registered_txs: Container[str], options: FetchOptions
     ) -> Transactions:
         raw_txs = []
         page = 0
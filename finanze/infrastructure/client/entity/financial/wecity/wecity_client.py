@@ -4,7 +4,7 @@ from typing import Optional
 from uuid import uuid4
 
 import requests
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from dateutil.tz import tzlocal
 
 from domain.entity_login import (
@@ -13,6 +13,8 @@ from domain.entity_login import (
     EntitySession,
     LoginOptions,
 )
+from infrastructure.client.http.http_session import HttpSession
+from infrastructure.metrics.cache_metrics import cached
 
 DATETIME_FORMAT = "%d/%m/%Y %H:%M:%S"
 
@@ -34,7 +36,7 @@ class WecityAPIClient:
         return {}
 
     def _init_session(self):
-        self._session = requests.Session()
+        self._session = HttpSession()
 
         agent = (
             "Mozilla/5.0 (Linux; Android 11; moto g(20)) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -1,6 +1,7 @@
 import logging
 from datetime import date, datetime
 from hashlib import sha1
+from typing import Container
 from uuid import uuid4
 
 from application.ports.financial_entity_fetcher import FinancialEntityFetcher
@@ -198,7 +199,7 @@ class WecityFetcher(FinancialEntityFetcher):
         )
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self, registered_txs: Container[str], options: FetchOptions
     ) -> Transactions:
         raw_transactions = _normalize_transactions(self._client.get_transactions())
 
@@ -0,0 +1,166 @@
+import time
+from bisect import bisect_left
+from dataclasses import field
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+import requests
+from pydantic.dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = (10, 60)
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRY_AFTER = 30
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 10
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+
+@dataclass
+class HostMetrics:
+    requests: int = 0
+    errors: int = 0
+    total_latency: float = 0
+    max_latency: float = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+
+@dataclass
+class HttpRequestRecord:
+    method: str
+    host: str
+    path: str
+    latency: float
+    status: Optional[int] = None
+    size: Optional[int] = None
+
+
+class _HttpMetricsRegistry:
+    def __init__(self):
+        self._lock = Lock()
+        self._hosts: dict[str, HostMetrics] = {}
+        self._listeners: list[Callable[[HttpRequestRecord], None]] = []
+
+    def add_listener(self, listener: Callable[[HttpRequestRecord], None]):
+        self._listeners.append(listener)
+
+    def record(self, request: HttpRequestRecord):
+        host, latency, status = request.host, request.latency, request.status
+        with self._lock:
+            metrics = self._hosts.get(host)
+            if metrics is None:
+                metrics = self._hosts[host] = HostMetrics()
+
+            metrics.requests += 1
+            metrics.total_latency += latency
+            metrics.max_latency = max(metrics.max_latency, latency)
+            metrics.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+            if status is None:
+                metrics.errors += 1
+            else:
+                metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+
+        for listener in self._listeners:
+            listener(request)
+
+    def snapshot(self) -> dict[str, HostMetrics]:
+        with self._lock:
+            return {
+                host: HostMetrics(
+                    requests=metrics.requests,
+                    errors=metrics.errors,
+                    total_latency=metrics.total_latency,
+                    max_latency=metrics.max_latency,
+                    statuses=dict(metrics.statuses),
+                    latency_buckets=list(metrics.latency_buckets),
+                )
+                for host, metrics in self._hosts.items()
+            }
+
+
+http_metrics = _HttpMetricsRegistry()
+
+
+class BoundedRetry(Retry):
+    # Retry-After is honoured, but a request doesn't block for longer than
+    # MAX_RETRY_AFTER, beyond that the 429 or 503 is returned to the caller
+    def increment(self, method=None, url=None, response=None, *args, **kwargs):
+        if response is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                raise MaxRetryError(
+                    kwargs.get("_pool"),
+                    url,
+                    ResponseError(f"Retry-After of {retry_after}s is too long"),
+                )
+
+        return super().increment(method, url, response, *args, **kwargs)
+
+
+class HttpSession(requests.Session):
+    def __init__(
+        self,
+        timeout: tuple[float, float] | float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        persist_cookies: bool = True,
+    ):
+        super().__init__()
+        self._timeout = timeout
+
+        # Only idempotent methods are retried, so logins and POSTs are sent once
+        retry = BoundedRetry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+        if not persist_cookies:
+            self.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    def request(self, method, url, *args, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self._timeout)
+
+        parts = urlsplit(url)
+        record = HttpRequestRecord(
+            method=method.upper(), host=parts.netloc, path=parts.path, latency=0
+        )
+        start = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.RequestException:
+            record.latency = time.perf_counter() - start
+            http_metrics.record(record)
+            raise
+
+        record.latency = time.perf_counter() - start
+        record.status = response.status_code
+        # Non streamed bodies are already read at this point
+        if not kwargs.get("stream"):
+            record.size = len(response.content)
+        http_metrics.record(record)
+        return response
+
+
+_shared_session = HttpSession(persist_cookies=False)
+
+
+def shared_session() -> HttpSession:
+    return _shared_session
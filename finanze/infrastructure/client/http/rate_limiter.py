@@ -0,0 +1,19 @@
+import time
+from threading import Lock
+
+
+class RateLimiter:
+    def __init__(self, max_per_second: float):
+        self._interval = 1 / max_per_second
+        self._lock = Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
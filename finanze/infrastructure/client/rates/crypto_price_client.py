@@ -1,10 +1,11 @@
 import logging
 
-import requests
 from application.ports.crypto_price_provider import CryptoPriceProvider
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from domain.dezimal import Dezimal
 from domain.global_position import CRYPTO_SYMBOLS, CryptoAsset, CryptoCurrency
+from infrastructure.client.http.http_session import shared_session
+from infrastructure.metrics.cache_metrics import cached
 
 
 class CryptoPriceClient(CryptoPriceProvider):
@@ -32,7 +33,7 @@ class CryptoPriceClient(CryptoPriceProvider):
         return Dezimal(raw)
 
     def _fetch(self, url: str) -> str:
-        response = requests.get(url)
+        response = shared_session().get(url)
         if response.ok:
             return response.text
 
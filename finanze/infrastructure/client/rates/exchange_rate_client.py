@@ -1,11 +1,12 @@
 import logging
 from datetime import datetime
 
-import requests
 from application.ports.exchange_rate_provider import ExchangeRateProvider
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from domain.dezimal import Dezimal
 from domain.exchange_rate import ExchangeRates
+from infrastructure.client.http.http_session import shared_session
+from infrastructure.metrics.cache_metrics import cached
 
 AVAILABLE_CURRENCIES = ["EUR", "USD"]
 
@@ -49,7 +50,7 @@ class ExchangeRateClient(ExchangeRateProvider):
         return self._fetch(url)
 
     def _fetch(self, url: str) -> dict:
-        response = requests.get(url)
+        response = shared_session().get(url)
         if response.ok:
             return response.json()
 
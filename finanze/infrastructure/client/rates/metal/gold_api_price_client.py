@@ -1,9 +1,9 @@
 import logging
 
-import requests
 from domain.commodity import COMMODITY_SYMBOLS, CommodityType, WeightUnit
 from domain.dezimal import Dezimal
 from domain.exchange_rate import CommodityExchangeRate
+from infrastructure.client.http.http_session import shared_session
 
 
 class GoldApiPriceClient:
@@ -35,7 +35,7 @@ class GoldApiPriceClient:
         )
 
     def _fetch(self, url: str) -> dict:
-        response = requests.get(url)
+        response = shared_session().get(url)
         if response.ok:
             return response.json()
 
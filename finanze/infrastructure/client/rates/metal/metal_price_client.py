@@ -1,9 +1,10 @@
 from application.ports.metal_price_provider import MetalPriceProvider
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from domain.commodity import CommodityType
 from domain.exchange_rate import CommodityExchangeRate
 from infrastructure.client.rates.metal.gold_api_price_client import GoldApiPriceClient
 from infrastructure.client.rates.metal.rmint_api_price_client import RMintApiPriceClient
+from infrastructure.metrics.cache_metrics import cached
 
 
 class MetalPriceClient(MetalPriceProvider):
@@ -1,10 +1,10 @@
 import logging
 import time
 
-import requests
 from domain.commodity import COMMODITY_SYMBOLS, CommodityType, WeightUnit
 from domain.dezimal import Dezimal
 from domain.exchange_rate import CommodityExchangeRate
+from infrastructure.client.http.http_session import shared_session
 
 
 class RMintApiPriceClient:
@@ -52,7 +52,7 @@ class RMintApiPriceClient:
         )
 
     def _fetch(self, url: str, params: dict = None) -> dict:
-        response = requests.get(url, params=params)
+        response = shared_session().get(url, params=params)
         if response.ok:
             return response.json()
 
@@ -4,12 +4,13 @@ from pathlib import Path
 
 import strictyaml
 from application.ports.config_port import ConfigPort
-from cachetools import TTLCache, cached
+from cachetools import TTLCache
 from cachetools.keys import hashkey
 from domain.settings import Settings
 from domain.user import User
 from infrastructure.config.base_config import BASE_CONFIG, CURRENT_VERSION
 from infrastructure.config.config_migrator import ConfigMigrator
+from infrastructure.metrics.cache_metrics import cached
 
 CONFIG_NAME = "config.yml"
 
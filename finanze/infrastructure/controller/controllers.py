@@ -1,3 +1,5 @@
+from typing import Optional
+
 from domain.use_cases.add_entity_credentials import AddEntityCredentials
 from domain.use_cases.change_user_password import ChangeUserPassword
 from domain.use_cases.connect_crypto_wallet import ConnectCryptoWallet
@@ -5,16 +7,23 @@ from domain.use_cases.connect_etherscan import ConnectEtherscan
 from domain.use_cases.connect_google import ConnectGoogle
 from domain.use_cases.delete_crypto_wallet import DeleteCryptoWalletConnection
 from domain.use_cases.disconnect_entity import DisconnectEntity
+from domain.use_cases.fetch_all_financial_data import FetchAllFinancialData
 from domain.use_cases.fetch_crypto_data import FetchCryptoData
 from domain.use_cases.fetch_financial_data import FetchFinancialData
 from domain.use_cases.get_available_entities import GetAvailableEntities
 from domain.use_cases.get_contributions import GetContributions
 from domain.use_cases.get_exchange_rates import GetExchangeRates
 from domain.use_cases.get_external_integrations import GetExternalIntegrations
+from domain.use_cases.get_fetch_run import GetFetchRun
+from domain.use_cases.get_fetch_run_trends import GetFetchRunTrends
 from domain.use_cases.get_login_status import GetLoginStatus
 from domain.use_cases.get_position import GetPosition
+from domain.use_cases.get_position_history import GetPositionHistory
+from domain.use_cases.get_position_totals import GetPositionTotals
 from domain.use_cases.get_settings import GetSettings
+from domain.use_cases.get_slowest_fetch_runs import GetSlowestFetchRuns
 from domain.use_cases.get_transactions import GetTransactions
+from domain.use_cases.rebuild_latest_positions import RebuildLatestPositions
 from domain.use_cases.register_user import RegisterUser
 from domain.use_cases.save_commodities import SaveCommodities
 from domain.use_cases.update_crypto_wallet import UpdateCryptoWalletConnection
@@ -29,21 +38,38 @@ from infrastructure.controller.routes.change_user_password import change_user_pa
 from infrastructure.controller.routes.connect_crypto_wallet import connect_crypto_wallet
 from infrastructure.controller.routes.connect_etherscan import connect_etherscan
 from infrastructure.controller.routes.connect_google import connect_google
+from infrastructure.controller.routes.db_stats import db_stats
 from infrastructure.controller.routes.contributions import contributions
 from infrastructure.controller.routes.delete_crypto_wallet import delete_crypto_wallet
 from infrastructure.controller.routes.disconnect_entity import disconnect_entity
 from infrastructure.controller.routes.exchange_rates import exchange_rates
 from infrastructure.controller.routes.export import export
+from infrastructure.controller.routes.fetch_all_financial_data import (
+    fetch_all_financial_data,
+)
 from infrastructure.controller.routes.fetch_crypto_data import fetch_crypto_data
+from infrastructure.controller.routes.fetch_events import fetch_events
 from infrastructure.controller.routes.fetch_financial_data import fetch_financial_data
+from infrastructure.controller.routes.fetch_runs import (
+    fetch_run_trends,
+    get_fetch_run,
+    slowest_fetch_runs,
+)
 from infrastructure.controller.routes.get_available_sources import get_available_sources
 from infrastructure.controller.routes.get_external_integrations import (
     get_external_integrations,
 )
 from infrastructure.controller.routes.get_settings import get_settings
+from infrastructure.controller.routes.jobs import get_job, get_jobs
 from infrastructure.controller.routes.login_status import login_status
 from infrastructure.controller.routes.logout import logout
+from infrastructure.controller.routes.metrics import metrics
+from infrastructure.controller.routes.position_history import position_history
+from infrastructure.controller.routes.position_totals import position_totals
 from infrastructure.controller.routes.positions import positions
+from infrastructure.controller.routes.rebuild_latest_positions import (
+    rebuild_latest_positions,
+)
 from infrastructure.controller.routes.register_user import register_user
 from infrastructure.controller.routes.save_commodities import save_commodities
 from infrastructure.controller.routes.transactions import transactions
@@ -51,6 +77,10 @@ from infrastructure.controller.routes.update_crypto_wallet import update_crypto_
 from infrastructure.controller.routes.update_settings import update_settings
 from infrastructure.controller.routes.user_login import user_login
 from infrastructure.controller.routes.virtual_fetch import virtual_fetch
+from infrastructure.jobs.fetch_progress_broker import FetchProgressBroker
+from infrastructure.jobs.job_runner import JobRunner
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from infrastructure.repository.db.instrumentation import DBInstrumentation
 
 
 def register_routes(
@@ -60,6 +90,7 @@ def register_routes(
     change_user_password_uc: ChangeUserPassword,
     get_available_entities_uc: GetAvailableEntities,
     fetch_financial_data_uc: FetchFinancialData,
+    fetch_all_financial_data_uc: FetchAllFinancialData,
     fetch_crypto_data_uc: FetchCryptoData,
     update_sheets_uc: UpdateSheets,
     virtual_fetch_uc: VirtualFetch,
@@ -80,6 +111,16 @@ def register_routes(
     get_external_integrations_uc: GetExternalIntegrations,
     connect_google_uc: ConnectGoogle,
     connect_etherscan_uc: ConnectEtherscan,
+    rebuild_latest_positions_uc: RebuildLatestPositions,
+    get_position_history_uc: GetPositionHistory,
+    get_position_totals_uc: GetPositionTotals,
+    db_instrumentation: Optional[DBInstrumentation],
+    job_runner: JobRunner,
+    fetch_progress_broker: FetchProgressBroker,
+    metrics_registry: MetricsRegistry,
+    get_slowest_fetch_runs_uc: GetSlowestFetchRuns,
+    get_fetch_run_trends_uc: GetFetchRunTrends,
+    get_fetch_run_uc: GetFetchRun,
 ):
     @app.route("/api/v1/login", methods=["POST"])
     def user_login_route():
@@ -99,7 +140,7 @@ def register_routes(
 
     @app.route("/api/v1/logout", methods=["POST"])
     def logout_route():
-        return logout(user_logout_uc)
+        return logout(user_logout_uc, job_runner)
 
     @app.route("/api/v1/settings", methods=["GET"])
     def settings_route():
@@ -122,25 +163,61 @@ def register_routes(
         return await disconnect_entity(disconnect_entity_uc)
 
     @app.route("/api/v1/fetch/financial", methods=["POST"])
-    async def fetch_financial_data_route():
-        return await fetch_financial_data(fetch_financial_data_uc)
+    def fetch_financial_data_route():
+        return fetch_financial_data(fetch_financial_data_uc, job_runner)
+
+    @app.route("/api/v1/fetch/financial/all", methods=["POST"])
+    def fetch_all_financial_data_route():
+        return fetch_all_financial_data(fetch_all_financial_data_uc, job_runner)
 
     @app.route("/api/v1/fetch/crypto", methods=["POST"])
-    async def fetch_crypto_data_route():
-        return await fetch_crypto_data(fetch_crypto_data_uc)
+    def fetch_crypto_data_route():
+        return fetch_crypto_data(fetch_crypto_data_uc, job_runner)
 
     @app.route("/api/v1/fetch/virtual", methods=["POST"])
-    async def virtual_fetch_route():
-        return await virtual_fetch(virtual_fetch_uc)
+    def virtual_fetch_route():
+        return virtual_fetch(virtual_fetch_uc, job_runner)
+
+    @app.route("/api/v1/fetch/events", methods=["GET"])
+    def fetch_events_route():
+        return fetch_events(fetch_progress_broker)
+
+    @app.route("/api/v1/fetch/runs/slowest", methods=["GET"])
+    def slowest_fetch_runs_route():
+        return slowest_fetch_runs(get_slowest_fetch_runs_uc)
+
+    @app.route("/api/v1/fetch/runs/trends", methods=["GET"])
+    def fetch_run_trends_route():
+        return fetch_run_trends(get_fetch_run_trends_uc)
+
+    @app.route("/api/v1/fetch/runs/<run_id>", methods=["GET"])
+    def fetch_run_route(run_id: str):
+        return get_fetch_run(get_fetch_run_uc, run_id)
 
     @app.route("/api/v1/export", methods=["POST"])
-    async def export_route():
-        return await export(update_sheets_uc)
+    def export_route():
+        return export(update_sheets_uc, job_runner)
+
+    @app.route("/api/v1/jobs", methods=["GET"])
+    def jobs_route():
+        return get_jobs(job_runner)
+
+    @app.route("/api/v1/jobs/<job_id>", methods=["GET"])
+    def job_route(job_id: str):
+        return get_job(job_runner, job_id)
 
     @app.route("/api/v1/positions", methods=["GET"])
     def positions_route():
         return positions(get_position_uc)
 
+    @app.route("/api/v1/positions/history", methods=["GET"])
+    def position_history_route():
+        return position_history(get_position_history_uc)
+
+    @app.route("/api/v1/positions/totals", methods=["GET"])
+    def position_totals_route():
+        return position_totals(get_position_totals_uc)
+
     @app.route("/api/v1/contributions", methods=["GET"])
     def contributions_route():
         return contributions(get_contributions_uc)
@@ -180,3 +257,15 @@ def register_routes(
     @app.route("/api/v1/integrations/etherscan", methods=["POST"])
     def connect_etherscan_route():
         return connect_etherscan(connect_etherscan_uc)
+
+    @app.route("/api/v1/maintenance/latest-positions", methods=["POST"])
+    def rebuild_latest_positions_route():
+        return rebuild_latest_positions(rebuild_latest_positions_uc)
+
+    @app.route("/api/v1/debug/db", methods=["GET", "DELETE"])
+    def db_stats_route():
+        return db_stats(db_instrumentation)
+
+    @app.route("/metrics", methods=["GET"])
+    def metrics_route():
+        return metrics(metrics_registry)
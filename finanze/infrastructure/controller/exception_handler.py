@@ -1,9 +1,13 @@
+from typing import Optional
+
 from domain.data_init import DataEncryptedError
 from domain.exception.exceptions import (
     AddressAlreadyExists,
     AddressNotFound,
     EntityNotFound,
     ExecutionConflict,
+    ExportException,
+    ExternalIntegrationRequired,
     InvalidProvidedCredentials,
     TooManyRequests,
 )
@@ -50,6 +54,26 @@ def handle_address_not_found(e):
     return jsonify({"code": "ADDRESS_NOT_FOUND", "message": str(e)}), 404
 
 
+JOB_ERROR_CODES = {
+    EntityNotFound: "ENTITY_NOT_FOUND",
+    ExecutionConflict: "ALREADY_EXECUTING",
+    ExternalIntegrationRequired: "INTEGRATION_REQUIRED",
+    DataEncryptedError: "NOT_LOGGED",
+    TooManyRequests: "TOO_MANY_REQUESTS",
+}
+
+
+def map_job_error(e: Exception) -> Optional[dict]:
+    if isinstance(e, ExportException):
+        return {"code": e.details, "message": str(e)}
+
+    for error_type, code in JOB_ERROR_CODES.items():
+        if isinstance(e, error_type):
+            return {"code": code, "message": str(e)}
+
+    return None
+
+
 def register_exception_handlers(app):
     app.register_error_handler(EntityNotFound, handle_entity_not_found)
     app.register_error_handler(InvalidProvidedCredentials, handle_invalid_credentials)
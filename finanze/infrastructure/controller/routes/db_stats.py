@@ -0,0 +1,16 @@
+from typing import Optional
+
+from flask import jsonify, request
+
+from infrastructure.repository.db.instrumentation import DBInstrumentation
+
+
+def db_stats(db_instrumentation: Optional[DBInstrumentation]):
+    if db_instrumentation is None:
+        return jsonify({"message": "Database instrumentation is not enabled"}), 404
+
+    if request.method == "DELETE":
+        db_instrumentation.reset()
+        return "", 204
+
+    return jsonify(db_instrumentation.snapshot()), 200
@@ -1,20 +1,16 @@
-from domain.exception.exceptions import ExportException
 from domain.export import ExportRequest
 from domain.use_cases.update_sheets import UpdateSheets
 from flask import jsonify, request
+from infrastructure.jobs.job_runner import JobRunner
 from pydantic import ValidationError
 
 
-async def export(update_sheets: UpdateSheets):
+def export(update_sheets: UpdateSheets, job_runner: JobRunner):
     body = request.json
     try:
         export_request = ExportRequest(**body)
     except ValidationError:
         return "", 400
 
-    try:
-        await update_sheets.execute(export_request)
-    except ExportException as e:
-        return jsonify({"message": str(e), "code": e.details}), 500
-
-    return "", 204
+    job = job_runner.submit("export", update_sheets.execute(export_request))
+    return jsonify(job), 202
@@ -0,0 +1,66 @@
+from uuid import UUID
+
+from domain.entity import Feature
+from domain.entity_login import LoginOptions
+from domain.fetch_result import FetchAllRequest, FetchOptions
+from domain.use_cases.fetch_all_financial_data import FetchAllFinancialData
+from flask import jsonify, request
+from infrastructure.jobs.job_runner import JobRunner
+
+
+def _map_features(features: list[str]) -> list[Feature]:
+    return [Feature[feature] for feature in features]
+
+
+def fetch_all_financial_data(
+    fetch_all_financial_data_uc: FetchAllFinancialData, job_runner: JobRunner
+):
+    body = request.json
+
+    entities = body.get("entities", [])
+    if not entities:
+        return jsonify({"message": "Source entities not provided"}), 400
+
+    try:
+        entities = [UUID(entity) for entity in entities]
+    except ValueError:
+        return jsonify({"message": "Invalid entity id"}), 400
+
+    feature_fields = body.get("features", [])
+    try:
+        features = _map_features(feature_fields)
+    except KeyError as e:
+        return jsonify({"message": f"Invalid feature {e}"}), 400
+
+    avoid_new_login = body.get("avoidNewLogin", False)
+    deep = body.get("deep", False)
+
+    fetch_request = FetchAllRequest(
+        entities=entities,
+        features=features,
+        fetch_options=FetchOptions(deep=deep),
+        login_options=LoginOptions(avoid_new_login=avoid_new_login),
+    )
+
+    fetch = _fetch_all(fetch_all_financial_data_uc, fetch_request, job_runner)
+    return jsonify(job_runner.submit("fetch_financial_all", fetch)), 202
+
+
+async def _fetch_all(
+    fetch_all_financial_data_uc: FetchAllFinancialData,
+    fetch_request: FetchAllRequest,
+    job_runner: JobRunner,
+) -> dict:
+    results = []
+    async for entity_result in fetch_all_financial_data_uc.execute(fetch_request):
+        result = entity_result.result
+        response = {"entity": entity_result.entity_id, "code": result.code}
+        if result.details:
+            response["details"] = result.details
+        if result.data:
+            response["data"] = result.data
+        results.append(response)
+        # Finished entities show up in the job while the rest keep running
+        job_runner.update_result({"results": list(results)})
+
+    return {"results": results}
@@ -4,9 +4,10 @@ from domain.entity import Feature
 from domain.fetch_result import FetchOptions, FetchRequest
 from domain.use_cases.fetch_crypto_data import FetchCryptoData
 from flask import jsonify, request
+from infrastructure.jobs.job_runner import JobRunner
 
 
-async def fetch_crypto_data(fetch_crypto_data_uc: FetchCryptoData):
+def fetch_crypto_data(fetch_crypto_data_uc: FetchCryptoData, job_runner: JobRunner):
     body = request.json
 
     entity = body.get("entity", None)
@@ -20,6 +21,11 @@ async def fetch_crypto_data(fetch_crypto_data_uc: FetchCryptoData):
         features=[Feature.POSITION],
         fetch_options=FetchOptions(deep=deep),
     )
+    fetch = _fetch(fetch_crypto_data_uc, fetch_request)
+    return jsonify(job_runner.submit("fetch_crypto", fetch)), 202
+
+
+async def _fetch(fetch_crypto_data_uc: FetchCryptoData, fetch_request: FetchRequest):
     result = await fetch_crypto_data_uc.execute(fetch_request)
 
     response = {"code": result.code}
@@ -28,4 +34,4 @@ async def fetch_crypto_data(fetch_crypto_data_uc: FetchCryptoData):
     if result.data:
         response["data"] = result.data
 
-    return jsonify(response), 200
+    return response
@@ -0,0 +1,37 @@
+from queue import Empty
+
+from flask import Response, current_app, request
+from infrastructure.jobs.fetch_progress_broker import FetchProgressBroker
+
+HEARTBEAT_SECONDS = 15
+RETRY_MILLIS = 3000
+
+
+def fetch_events(fetch_progress_broker: FetchProgressBroker):
+    last_event_id = request.headers.get("Last-Event-ID", "")
+    last_event_id = int(last_event_id) if last_event_id.isdigit() else None
+
+    json = current_app.json
+    subscriber = fetch_progress_broker.subscribe(last_event_id)
+
+    def stream():
+        try:
+            yield f"retry: {RETRY_MILLIS}\n\n"
+            while True:
+                try:
+                    event_id, event = subscriber.get(timeout=HEARTBEAT_SECONDS)
+                except Empty:
+                    # Comments keep proxies from closing the connection and let
+                    # the server notice clients that went away
+                    yield ": keep-alive\n\n"
+                    continue
+
+                yield f"id: {event_id}\nevent: fetch\ndata: {json.dumps(event)}\n\n"
+        finally:
+            fetch_progress_broker.unsubscribe(subscriber)
+
+    return Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -5,13 +5,16 @@ from domain.entity_login import LoginOptions, TwoFactor
 from domain.fetch_result import FetchOptions, FetchRequest
 from domain.use_cases.fetch_financial_data import FetchFinancialData
 from flask import jsonify, request
+from infrastructure.jobs.job_runner import JobRunner
 
 
 def _map_features(features: list[str]) -> list[Feature]:
     return [Feature[feature] for feature in features]
 
 
-async def fetch_financial_data(fetch_financial_data_uc: FetchFinancialData):
+def fetch_financial_data(
+    fetch_financial_data_uc: FetchFinancialData, job_runner: JobRunner
+):
     body = request.json
 
     entity = body.get("entity", None)
@@ -38,6 +41,13 @@ async def fetch_financial_data(fetch_financial_data_uc: FetchFinancialData):
         fetch_options=FetchOptions(deep=deep),
         login_options=LoginOptions(avoid_new_login=avoid_new_login),
     )
+    fetch = _fetch(fetch_financial_data_uc, fetch_request)
+    return jsonify(job_runner.submit("fetch_financial", fetch)), 202
+
+
+async def _fetch(
+    fetch_financial_data_uc: FetchFinancialData, fetch_request: FetchRequest
+) -> dict:
     result = await fetch_financial_data_uc.execute(fetch_request)
 
     response = {"code": result.code}
@@ -46,4 +56,4 @@ async def fetch_financial_data(fetch_financial_data_uc: FetchFinancialData):
     if result.data:
         response["data"] = result.data
 
-    return jsonify(response), 200
+    return response
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from dateutil.tz import tzlocal
+from domain.fetch_trace import FetchRunQuery
+from domain.use_cases.get_fetch_run import GetFetchRun
+from domain.use_cases.get_fetch_run_trends import GetFetchRunTrends
+from domain.use_cases.get_slowest_fetch_runs import GetSlowestFetchRuns
+from flask import jsonify, request
+
+DEFAULT_SLOWEST_LIMIT = 20
+MAX_SLOWEST_LIMIT = 200
+DEFAULT_TREND_DAYS = 30
+
+
+def slowest_fetch_runs(get_slowest_fetch_runs: GetSlowestFetchRuns):
+    try:
+        limit = min(
+            int(request.args.get("limit", DEFAULT_SLOWEST_LIMIT)), MAX_SLOWEST_LIMIT
+        )
+        query = FetchRunQuery(
+            entity_id=request.args.get("entity"),
+            source=request.args.get("source"),
+            since=request.args.get("since"),
+            limit=max(limit, 1),
+        )
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    runs = get_slowest_fetch_runs.execute(query)
+    return jsonify({"runs": runs}), 200
+
+
+def fetch_run_trends(get_fetch_run_trends: GetFetchRunTrends):
+    try:
+        days = int(request.args.get("days", DEFAULT_TREND_DAYS))
+        query = FetchRunQuery(
+            entity_id=request.args.get("entity"),
+            source=request.args.get("source"),
+            since=datetime.now(tzlocal()) - timedelta(days=max(days, 1)),
+        )
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    trends = get_fetch_run_trends.execute(query)
+    return jsonify({"trends": trends}), 200
+
+
+def get_fetch_run(get_fetch_run_uc: GetFetchRun, run_id: str):
+    try:
+        run_id = UUID(run_id)
+    except ValueError:
+        return jsonify({"message": "Invalid run id"}), 400
+
+    run = get_fetch_run_uc.execute(run_id)
+    if not run:
+        return jsonify({"code": "FETCH_RUN_NOT_FOUND"}), 404
+
+    return jsonify(run), 200
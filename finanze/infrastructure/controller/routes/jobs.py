@@ -0,0 +1,33 @@
+from uuid import UUID
+
+from flask import jsonify, request
+from infrastructure.jobs.job_runner import JobRunner
+
+MAX_WAIT_SECONDS = 60
+
+
+def get_job(job_runner: JobRunner, job_id: str):
+    try:
+        job_id = UUID(job_id)
+    except ValueError:
+        return jsonify({"message": "Invalid job id"}), 400
+
+    try:
+        wait = min(float(request.args.get("wait", 0)), MAX_WAIT_SECONDS)
+    except ValueError:
+        return jsonify({"message": "Invalid wait"}), 400
+
+    if wait > 0:
+        job = job_runner.wait(job_id, wait)
+    else:
+        job = job_runner.get(job_id)
+
+    if not job:
+        return jsonify({"code": "JOB_NOT_FOUND"}), 404
+
+    return jsonify(job), 200
+
+
+def get_jobs(job_runner: JobRunner):
+    jobs = sorted(job_runner.get_all(), key=lambda job: job.created_at, reverse=True)
+    return jsonify({"jobs": jobs}), 200
@@ -1,8 +1,12 @@
 from domain.data_init import AlreadyLockedError
 from domain.use_cases.user_logout import UserLogout
+from infrastructure.jobs.job_runner import JobRunner
 
 
-def logout(user_logout_uc: UserLogout):
+def logout(user_logout_uc: UserLogout, job_runner: JobRunner):
+    # Running jobs are cancelled and the threads they offloaded work to joined,
+    # so nothing of this session gets committed once the DB is closed
+    job_runner.cancel_jobs()
     try:
         user_logout_uc.execute()
         return "", 204
@@ -0,0 +1,9 @@
+from flask import Response
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+
+def metrics(metrics_registry: MetricsRegistry):
+    return Response(
+        generate_latest(metrics_registry.registry), content_type=CONTENT_TYPE_LATEST
+    )
@@ -0,0 +1,34 @@
+from flask import jsonify, request
+
+from domain.exception.exceptions import UnsupportedCurrency
+from domain.position_history import HistoryGranularity, PositionHistoryQuery
+from domain.use_cases.get_position_history import GetPositionHistory
+
+
+def position_history(get_position_history: GetPositionHistory):
+    currency = request.args.get("currency")
+    if not currency:
+        return jsonify({"message": "Currency not provided"}), 400
+
+    granularity = request.args.get("granularity", HistoryGranularity.DAILY.value)
+    entities = request.args.getlist("entity")
+    excluded_entities = request.args.getlist("excluded_entity")
+
+    try:
+        query = PositionHistoryQuery(
+            currency=currency,
+            granularity=granularity.upper(),
+            from_date=request.args.get("from_date"),
+            to_date=request.args.get("to_date"),
+            entities=[e for e in entities] or None,
+            excluded_entities=[ee for ee in excluded_entities] or None,
+        )
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    try:
+        result = get_position_history.execute(query)
+    except UnsupportedCurrency:
+        return jsonify({"message": f"Unsupported currency {currency}"}), 400
+
+    return jsonify(result), 200
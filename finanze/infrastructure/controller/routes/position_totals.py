@@ -0,0 +1,16 @@
+from flask import jsonify, request
+
+from domain.global_position import PositionQueryRequest
+from domain.use_cases.get_position_totals import GetPositionTotals
+
+
+def position_totals(get_position_totals: GetPositionTotals):
+    entities = request.args.getlist("entity")
+    excluded_entities = request.args.getlist("excluded_entity")
+
+    query = PositionQueryRequest(
+        entities=[e for e in entities] or None,
+        excluded_entities=[ee for ee in excluded_entities] or None,
+    )
+    result = get_position_totals.execute(query)
+    return jsonify({"totals": result}), 200
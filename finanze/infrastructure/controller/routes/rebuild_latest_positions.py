@@ -0,0 +1,6 @@
+from domain.use_cases.rebuild_latest_positions import RebuildLatestPositions
+
+
+def rebuild_latest_positions(rebuild_latest_positions_uc: RebuildLatestPositions):
+    rebuild_latest_positions_uc.execute()
+    return "", 204
@@ -1,6 +1,6 @@
 from flask import request, jsonify
 
-from domain.transactions import TransactionQueryRequest
+from domain.transactions import TransactionCursor, TransactionQueryRequest
 
 
 def transactions(get_transactions_uc):
@@ -12,6 +12,7 @@ def transactions(get_transactions_uc):
     from_date = request.args.get("from_date")
     to_date = request.args.get("to_date")
     tx_types = request.args.getlist("type")
+    cursor = request.args.get("cursor")
 
     query = TransactionQueryRequest(
         page=page,
@@ -22,8 +23,13 @@ def transactions(get_transactions_uc):
         from_date=from_date,
         to_date=to_date,
         types=[tx_type for tx_type in tx_types] or None,
+        cursor=TransactionCursor.decode(cursor) if cursor else None,
     )
 
     result = get_transactions_uc.execute(query)
 
-    return jsonify({"transactions": result.transactions}), 200
+    response = {
+        "transactions": result.transactions,
+        "next_cursor": result.next_cursor,
+    }
+    return jsonify(response), 200
@@ -1,9 +1,14 @@
+from domain.use_cases.virtual_fetch import VirtualFetch
 from flask import jsonify
+from infrastructure.jobs.job_runner import JobRunner
 
-from domain.use_cases.virtual_fetch import VirtualFetch
+
+def virtual_fetch(virtual_fetch_uc: VirtualFetch, job_runner: JobRunner):
+    fetch = _fetch(virtual_fetch_uc)
+    return jsonify(job_runner.submit("fetch_virtual", fetch)), 202
 
 
-async def virtual_fetch(virtual_fetch_uc: VirtualFetch):
+async def _fetch(virtual_fetch_uc: VirtualFetch) -> dict:
     result = await virtual_fetch_uc.execute()
 
     response = {"code": result.code.name}
@@ -12,4 +17,4 @@ async def virtual_fetch(virtual_fetch_uc: VirtualFetch):
     if result.errors:
         response["errors"] = result.errors
 
-    return jsonify(response), 200
+    return response
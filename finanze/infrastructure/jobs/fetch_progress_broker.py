@@ -0,0 +1,55 @@
+from collections import deque
+from queue import Full, Queue
+from threading import Lock
+from typing import Callable, Optional
+
+from application.ports.fetch_progress_port import FetchProgressPort
+from domain.fetch_progress import FetchProgressEvent
+from infrastructure.jobs.job_runner import current_job_id
+
+ProgressEntry = tuple[int, FetchProgressEvent]
+
+
+class FetchProgressBroker(FetchProgressPort):
+    BUFFER_SIZE = 500
+    SUBSCRIBER_QUEUE_SIZE = 1000
+
+    def __init__(
+        self, listeners: Optional[list[Callable[[FetchProgressEvent], None]]] = None
+    ):
+        self._listeners = listeners or []
+        self._last_id = 0
+        self._buffer: deque[ProgressEntry] = deque(maxlen=self.BUFFER_SIZE)
+        self._subscribers: set[Queue] = set()
+        self._lock = Lock()
+
+    def publish(self, event: FetchProgressEvent):
+        event.job_id = current_job_id.get()
+        with self._lock:
+            self._last_id += 1
+            entry = (self._last_id, event)
+            self._buffer.append(entry)
+            for subscriber in self._subscribers:
+                try:
+                    subscriber.put_nowait(entry)
+                except Full:
+                    # A stalled client must not block fetches, it can catch up
+                    # from the buffer by reconnecting with its last event id
+                    pass
+
+        for listener in self._listeners:
+            listener(event)
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Queue:
+        subscriber = Queue(maxsize=self.SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            if last_event_id is not None:
+                for entry in self._buffer:
+                    if entry[0] > last_event_id:
+                        subscriber.put_nowait(entry)
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Queue):
+        with self._lock:
+            self._subscribers.discard(subscriber)
@@ -0,0 +1,42 @@
+import asyncio
+import logging
+from concurrent.futures import Future
+from typing import Optional
+
+from domain.data_init import DataEncryptedError
+from domain.use_cases.run_scheduled_fetches import RunScheduledFetches
+from infrastructure.jobs.job_runner import JobRunner
+
+
+class FetchScheduler:
+    TICK = 60
+
+    def __init__(
+        self, run_scheduled_fetches: RunScheduledFetches, job_runner: JobRunner
+    ):
+        self._run_scheduled_fetches = run_scheduled_fetches
+        self._job_runner = job_runner
+        self._task: Optional[Future] = None
+
+        self._log = logging.getLogger(__name__)
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+
+        self._task = self._job_runner.spawn(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    async def _run(self):
+        while True:
+            try:
+                await self._run_scheduled_fetches.execute()
+            except DataEncryptedError:
+                pass
+            except Exception:
+                self._log.exception("Fetch scheduler run failed")
+
+            await asyncio.sleep(self.TICK)
@@ -0,0 +1,202 @@
+import asyncio
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextvars import ContextVar
+from dataclasses import replace
+from datetime import datetime
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Coroutine, Optional
+from uuid import UUID, uuid4
+
+from application.ports.job_port import JobPort
+from dateutil.tz import tzlocal
+from domain.job import Job, JobStatus
+
+# Set while a job runs, it follows the job into the threads and loops it spawns
+current_job_id: ContextVar[Optional[UUID]] = ContextVar("current_job_id", default=None)
+
+
+class JobExecutor(ThreadPoolExecutor):
+    # Default executor of the job loop, it keeps track of the work jobs offload
+    # with to_thread, which goes on after their task is cancelled
+
+    def __init__(self):
+        super().__init__(thread_name_prefix="job-worker")
+        self._pending: set[Future] = set()
+        self._pending_lock = Lock()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = super().submit(fn, *args, **kwargs)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future: Future):
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def join(self):
+        with self._pending_lock:
+            pending = list(self._pending)
+        wait(pending)
+
+
+class JobRunner(JobPort):
+    MAX_FINISHED_JOBS = 100
+
+    def __init__(self, error_mapper: Callable[[Exception], Optional[dict]]):
+        self._error_mapper = error_mapper
+        self._executor = JobExecutor()
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._executor)
+        self._thread = None
+
+        self._jobs: dict[UUID, Job] = {}
+        self._done: dict[UUID, Event] = {}
+        self._tasks: dict[UUID, asyncio.Task] = {}
+        self._lock = Lock()
+
+        self._log = logging.getLogger(__name__)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._thread = Thread(target=self._run, name="job-runner", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self._thread or not self._thread.is_alive():
+            self._loop.close()
+            return
+
+        # Running jobs are cancelled and awaited, and the threads they offloaded
+        # work to are joined, so no fetch is left halfway when the DB is closed
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _shutdown(self):
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        await self._cancel(tasks)
+        await self._loop.shutdown_asyncgens()
+        await self._loop.shutdown_default_executor()
+
+    async def _cancel_jobs(self):
+        with self._lock:
+            tasks = list(self._tasks.values())
+        await self._cancel(tasks)
+
+    @staticmethod
+    async def _cancel(tasks: list[asyncio.Task]):
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def cancel_jobs(self):
+        if not self._thread or not self._thread.is_alive():
+            return
+
+        # Cancelling the tasks doesn't stop the threads fetches and exports run
+        # in, they are joined so none of them commits once this returns
+        asyncio.run_coroutine_threadsafe(self._cancel_jobs(), self._loop).result()
+        self._executor.join()
+
+    def submit(self, job_type: str, coro: Coroutine[Any, Any, Any]) -> Job:
+        job = Job(
+            id=uuid4(),
+            type=job_type,
+            status=JobStatus.PENDING,
+            created_at=datetime.now(tzlocal()),
+        )
+        with self._lock:
+            self._evict_finished()
+            self._jobs[job.id] = job
+            self._done[job.id] = Event()
+            snapshot = replace(job)
+
+        asyncio.run_coroutine_threadsafe(self._execute(job, coro), self._loop)
+        return snapshot
+
+    def spawn(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    # Jobs are updated on the loop thread, callers only get copies taken under
+    # the lock so they never see or serialize a job while it changes
+    def get(self, job_id: UUID) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job) if job else None
+
+    def get_all(self) -> list[Job]:
+        with self._lock:
+            return [replace(job) for job in self._jobs.values()]
+
+    def wait(self, job_id: UUID, timeout: float) -> Optional[Job]:
+        with self._lock:
+            done = self._done.get(job_id)
+        if done:
+            done.wait(timeout)
+        return self.get(job_id)
+
+    def update_result(self, result: Any):
+        # Partial result of the running job, replaced by the final one when done
+        with self._lock:
+            job = self._jobs.get(current_job_id.get())
+            if job:
+                job.result = result
+
+    def _update(self, job: Job, **changes):
+        with self._lock:
+            for field, value in changes.items():
+                setattr(job, field, value)
+
+    def _finish(self, job: Job, status: JobStatus, **changes):
+        # Status and finish time change together, finished jobs are evicted by
+        # their finish time
+        self._update(job, status=status, finished_at=datetime.now(tzlocal()), **changes)
+
+    async def _execute(self, job: Job, coro: Coroutine[Any, Any, Any]):
+        current_job_id.set(job.id)
+        with self._lock:
+            self._tasks[job.id] = asyncio.current_task()
+        self._update(job, status=JobStatus.RUNNING, started_at=datetime.now(tzlocal()))
+        try:
+            result = await coro
+            self._finish(job, JobStatus.COMPLETED, result=result)
+        except asyncio.CancelledError:
+            self._finish(
+                job,
+                JobStatus.FAILED,
+                error={"code": "CANCELLED", "message": "Job cancelled"},
+            )
+            raise
+        except Exception as e:
+            error = self._error_mapper(e)
+            if error is None:
+                self._log.exception(f"Unexpected error in {job.type} job {job.id}")
+                error = {"code": "UNEXPECTED_ERROR", "message": str(e)}
+            self._finish(job, JobStatus.FAILED, error=error)
+        finally:
+            with self._lock:
+                self._tasks.pop(job.id, None)
+                done = self._done.get(job.id)
+            if done:
+                done.set()
+
+    def _evict_finished(self):
+        finished = [job for job in self._jobs.values() if job.finished]
+        if len(finished) < self.MAX_FINISHED_JOBS:
+            return
+
+        finished.sort(key=lambda job: job.finished_at)
+        for job in finished[: len(finished) - self.MAX_FINISHED_JOBS + 1]:
+            del self._jobs[job.id]
+            del self._done[job.id]
@@ -0,0 +1,43 @@
+import logging
+from threading import Event, Thread
+
+from application.ports.config_port import ConfigPort
+from domain.data_init import DataEncryptedError
+from domain.settings import PositionRetentionConfig
+from domain.use_cases.compact_positions import CompactPositions
+
+
+class PositionRetentionWorker:
+    def __init__(self, compact_positions: CompactPositions, config_port: ConfigPort):
+        self._compact_positions = compact_positions
+        self._config_port = config_port
+        self._stop = Event()
+        self._thread = None
+
+        self._log = logging.getLogger(__name__)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="position-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _interval(self) -> int:
+        try:
+            return self._config_port.load().data.positionRetention.interval
+        except Exception:
+            return PositionRetentionConfig.interval
+
+    def _run(self):
+        while not self._stop.wait(self._interval()):
+            try:
+                self._compact_positions.execute()
+            except DataEncryptedError:
+                pass
+            except Exception:
+                self._log.exception("Position retention run failed")
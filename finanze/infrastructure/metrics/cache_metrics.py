@@ -0,0 +1,26 @@
+from threading import Lock
+from typing import Any, Callable
+
+from cachetools import cached as _cached
+from cachetools.keys import hashkey
+
+_lock = Lock()
+_cached_functions: dict[str, Callable] = {}
+
+
+def cached(cache, key=hashkey, lock=None):
+    """cachetools.cached, also keeping hit and miss counts for /metrics."""
+
+    def decorator(func):
+        wrapper = _cached(cache, key=key, lock=lock, info=True)(func)
+        with _lock:
+            _cached_functions[func.__qualname__] = wrapper
+        return wrapper
+
+    return decorator
+
+
+def cache_stats() -> dict[str, Any]:
+    with _lock:
+        functions = dict(_cached_functions)
+    return {name: func.cache_info() for name, func in functions.items()}
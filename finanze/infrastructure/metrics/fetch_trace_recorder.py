@@ -0,0 +1,151 @@
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Optional
+from uuid import UUID
+
+from application.ports.fetch_trace_port import FetchTracePort
+from dateutil.tz import tzlocal
+from domain.entity import Feature
+from domain.fetch_progress import (
+    FetchProgressEvent,
+    FetchSource,
+    FetchStage,
+    FetchStageStatus,
+    active_stage,
+)
+from domain.fetch_trace import HTTP_SPAN, FetchRun, FetchSpan, compute_breakdown
+from infrastructure.client.http.http_session import HttpRequestRecord
+
+RUN_RETENTION_DAYS = 90
+MAX_SPANS_PER_RUN = 5000
+
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|[0-9a-fA-F]{16,}|(?=[A-Za-z0-9_-]*\d)[A-Za-z0-9_-]{20,})$"
+)
+
+
+def path_template(path: str) -> str:
+    # Ids, account numbers and such are masked, keeping traces groupable by
+    # endpoint and free of personal data
+    return "/".join(
+        ":id" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+@dataclass
+class _PendingRun:
+    id: UUID
+    source: FetchSource
+    entity_id: Optional[UUID]
+    job_id: Optional[UUID]
+    started_at: datetime
+    features: set[Feature] = field(default_factory=set)
+    spans: list[FetchSpan] = field(default_factory=list)
+
+
+class FetchTraceRecorder:
+    def __init__(self, fetch_trace_port: FetchTracePort):
+        self._fetch_trace_port = fetch_trace_port
+        self._runs: dict[UUID, _PendingRun] = {}
+        self._lock = Lock()
+
+        self._log = logging.getLogger(__name__)
+
+    def record_fetch_progress(self, event: FetchProgressEvent):
+        if event.stage == FetchStage.FETCH:
+            if event.status == FetchStageStatus.STARTED:
+                with self._lock:
+                    self._runs[event.fetch_id] = _PendingRun(
+                        id=event.fetch_id,
+                        source=event.source,
+                        entity_id=event.entity_id,
+                        job_id=event.job_id,
+                        started_at=event.timestamp,
+                    )
+            else:
+                with self._lock:
+                    run = self._runs.pop(event.fetch_id, None)
+                if run:
+                    self._save(run, event)
+            return
+
+        if event.status == FetchStageStatus.STARTED:
+            return
+
+        started_at = event.timestamp - timedelta(seconds=event.duration or 0)
+        span = FetchSpan(
+            kind=event.stage.value,
+            offset=0,
+            duration=event.duration or 0,
+            entity_id=event.entity_id,
+            feature=event.feature,
+            error=(event.details or {}).get("message")
+            if event.status == FetchStageStatus.FAILED
+            else None,
+        )
+        self._add_span(event.fetch_id, span, started_at)
+
+    def record_http_request(self, request: HttpRequestRecord):
+        stage = active_stage.get()
+        if stage is None:
+            return
+
+        started_at = datetime.now(tzlocal()) - timedelta(seconds=request.latency)
+        span = FetchSpan(
+            kind=HTTP_SPAN,
+            offset=0,
+            duration=round(request.latency, 3),
+            stage=stage.stage,
+            entity_id=stage.entity_id,
+            feature=stage.feature,
+            method=request.method,
+            host=request.host,
+            path=path_template(request.path),
+            status=request.status,
+            bytes=request.size,
+            error=None if request.status is not None else "No response",
+        )
+        self._add_span(stage.fetch_id, span, started_at)
+
+    def _add_span(self, fetch_id: UUID, span: FetchSpan, started_at: datetime):
+        with self._lock:
+            run = self._runs.get(fetch_id)
+            if run is None or len(run.spans) >= MAX_SPANS_PER_RUN:
+                return
+
+            span.offset = round(
+                max((started_at - run.started_at).total_seconds(), 0), 3
+            )
+            if span.feature:
+                run.features.add(span.feature)
+            run.spans.append(span)
+
+    def _save(self, pending: _PendingRun, event: FetchProgressEvent):
+        code = (event.details or {}).get("code") or (event.details or {}).get("error")
+        spans = sorted(pending.spans, key=lambda s: s.offset)
+        run = FetchRun(
+            id=pending.id,
+            source=pending.source,
+            status=event.status,
+            started_at=pending.started_at,
+            duration=event.duration or 0,
+            breakdown=compute_breakdown(spans),
+            entity_id=pending.entity_id,
+            features=sorted(pending.features),
+            code=getattr(code, "value", code),
+            job_id=pending.job_id,
+            spans=spans,
+        )
+
+        # Traces must never break the fetch they describe
+        try:
+            self._fetch_trace_port.save(run)
+            self._fetch_trace_port.delete_before(
+                run.started_at - timedelta(days=RUN_RETENTION_DAYS)
+            )
+        except Exception:
+            self._log.exception(f"Could not save trace of fetch run {run.id}")
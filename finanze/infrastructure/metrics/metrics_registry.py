@@ -0,0 +1,248 @@
+import logging
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from domain import native_entities
+from domain.data_init import DataEncryptedError
+from domain.fetch_progress import FetchProgressEvent, FetchStage, FetchStageStatus
+from infrastructure.client.http.http_session import LATENCY_BUCKETS, http_metrics
+from infrastructure.metrics.cache_metrics import cache_stats, cached
+from infrastructure.repository.db.client import DBClient
+from infrastructure.repository.db.instrumentation import LATENCY_BUCKETS_MS
+from prometheus_client import CollectorRegistry, Counter, Histogram
+from prometheus_client.core import (
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    HistogramMetricFamily,
+)
+
+FETCH_DURATION_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+DB_LATENCY_BUCKETS = [bound / 1000 for bound in LATENCY_BUCKETS_MS]
+
+COUNTED_TABLES = [
+    "global_positions",
+    "investment_transactions",
+    "account_transactions",
+    "investment_historic",
+    "periodic_contributions",
+    "daily_position_aggregates",
+    "entity_movements",
+]
+ROW_COUNT_TTL = 300
+
+
+def _cumulative(bounds: list[float], counts: Iterable[int]) -> list[tuple[str, int]]:
+    buckets = []
+    total = 0
+    for bound, count in zip([*map(str, bounds), "+Inf"], counts):
+        total += count
+        buckets.append((bound, total))
+    return buckets
+
+
+def _entity_label(entity_id: Optional[UUID]) -> str:
+    if entity_id is None:
+        return ""
+    entity = next(
+        (e for e in native_entities.NATIVE_ENTITIES if e.id == entity_id), None
+    )
+    return entity.name if entity else str(entity_id)
+
+
+class MetricsRegistry:
+    def __init__(self, db_client: DBClient):
+        self.registry = CollectorRegistry()
+        self._db_client = db_client
+        self._server = None
+
+        stage_labels = ["source", "entity", "stage", "feature"]
+        self._fetch_duration = Histogram(
+            "finanze_fetch_duration_seconds",
+            "Duration of fetch stages, by entity and feature",
+            stage_labels,
+            buckets=FETCH_DURATION_BUCKETS,
+            registry=self.registry,
+        )
+        self._fetch_failures = Counter(
+            "finanze_fetch_failures",
+            "Fetch stages that raised an error",
+            stage_labels,
+            registry=self.registry,
+        )
+        self._login_results = Counter(
+            "finanze_login_results",
+            "Entity login outcomes, by login result code",
+            ["entity", "code"],
+            registry=self.registry,
+        )
+        self.registry.register(self)
+
+        self._log = logging.getLogger(__name__)
+
+    def bind_server(self, server: Any):
+        self._server = server
+
+    def record_fetch_progress(self, event: FetchProgressEvent):
+        if event.status == FetchStageStatus.STARTED:
+            return
+
+        entity = _entity_label(event.entity_id)
+        labels = (
+            event.source.value,
+            entity,
+            event.stage.value,
+            event.feature.value if event.feature else "",
+        )
+        self._fetch_duration.labels(*labels).observe(event.duration or 0)
+
+        if event.status == FetchStageStatus.FAILED:
+            self._fetch_failures.labels(*labels).inc()
+        elif event.stage == FetchStage.LOGIN and event.details:
+            code = event.details.get("code")
+            self._login_results.labels(entity, getattr(code, "value", code)).inc()
+
+    def collect(self):
+        yield from self._collect_http()
+        yield from self._collect_caches()
+        yield from self._collect_db()
+        yield from self._collect_server()
+
+    def _collect_http(self):
+        requests = CounterMetricFamily(
+            "finanze_http_client_requests",
+            "Outbound HTTP requests, by host and response status",
+            labels=["host", "status"],
+        )
+        latency = HistogramMetricFamily(
+            "finanze_http_client_request_duration_seconds",
+            "Outbound HTTP request latency, including retries",
+            labels=["host"],
+        )
+        for host, metrics in http_metrics.snapshot().items():
+            for status, count in metrics.statuses.items():
+                requests.add_metric([host, str(status)], count)
+            if metrics.errors:
+                requests.add_metric([host, "error"], metrics.errors)
+            latency.add_metric(
+                [host],
+                _cumulative(LATENCY_BUCKETS, metrics.latency_buckets),
+                metrics.total_latency,
+            )
+        yield requests
+        yield latency
+
+    def _collect_caches(self):
+        hits = CounterMetricFamily(
+            "finanze_cache_hits", "Cached method hits", labels=["cache"]
+        )
+        misses = CounterMetricFamily(
+            "finanze_cache_misses", "Cached method misses", labels=["cache"]
+        )
+        size = GaugeMetricFamily(
+            "finanze_cache_size", "Cached method entries", labels=["cache"]
+        )
+        for name, info in cache_stats().items():
+            hits.add_metric([name], info.hits)
+            misses.add_metric([name], info.misses)
+            size.add_metric([name], info.currsize)
+        yield hits
+        yield misses
+        yield size
+
+    def _collect_db(self):
+        try:
+            table_rows = self._table_rows(self._db_client.session)
+        except DataEncryptedError:
+            table_rows = {}
+        except Exception:
+            self._log.exception("Could not count table rows")
+            table_rows = {}
+
+        rows = GaugeMetricFamily(
+            "finanze_db_table_rows", "Rows in the main tables", labels=["table"]
+        )
+        for table, count in table_rows.items():
+            rows.add_metric([table], count)
+        yield rows
+
+        # Statement and lock timings are only recorded with --db-instrumentation
+        instrumentation = self._db_client.instrumentation
+        if instrumentation is None:
+            return
+
+        snapshot = instrumentation.snapshot()
+
+        locks = HistogramMetricFamily(
+            "finanze_db_lock_seconds",
+            "Time spent waiting for and holding DB connection locks",
+            labels=["lock", "phase"],
+        )
+        for name, histogram in snapshot["locks"].items():
+            lock, _, phase = name.rpartition("_")
+            locks.add_metric(
+                [lock, phase],
+                _cumulative(DB_LATENCY_BUCKETS, histogram["buckets"].values()),
+                histogram["total_ms"] / 1000,
+            )
+        yield locks
+
+        statements = HistogramMetricFamily(
+            "finanze_db_statement_seconds",
+            "Time spent executing statements and fetching their results",
+            labels=["phase"],
+        )
+        for phase in ("execute", "fetch"):
+            counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            total_ms = 0
+            for statement in snapshot["statements"]:
+                histogram = statement[phase]
+                counts = [a + b for a, b in zip(counts, histogram["buckets"].values())]
+                total_ms += histogram["total_ms"]
+            statements.add_metric(
+                [phase], _cumulative(DB_LATENCY_BUCKETS, counts), total_ms / 1000
+            )
+        yield statements
+
+        fetched_rows = CounterMetricFamily(
+            "finanze_db_fetched_rows", "Rows fetched by statements"
+        )
+        fetched_rows.add_metric([], sum(s["rows"] for s in snapshot["statements"]))
+        yield fetched_rows
+
+    # Keyed on the DB session, so counts of a user are never reported after a
+    # logout or once another user logs in
+    @cached(
+        TTLCache(maxsize=1, ttl=ROW_COUNT_TTL),
+        key=lambda self, session: hashkey(session),
+    )
+    def _table_rows(self, session: Optional[UUID]) -> dict[str, int]:
+        counts = {}
+        with self._db_client.read() as cursor:
+            for table in COUNTED_TABLES:
+                cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                counts[table] = cursor.fetchone()[0]
+        return counts
+
+    def _collect_server(self):
+        if self._server is None:
+            return
+
+        dispatcher = self._server.task_dispatcher
+        queue = GaugeMetricFamily(
+            "finanze_server_queued_requests",
+            "Requests waiting for a free server thread",
+        )
+        queue.add_metric([], len(dispatcher.queue))
+        yield queue
+
+        active = GaugeMetricFamily(
+            "finanze_server_active_threads", "Server threads handling a request"
+        )
+        active.add_metric([], dispatcher.active_count)
+        yield active
+
+        threads = GaugeMetricFamily("finanze_server_threads", "Server worker threads")
+        threads.add_metric([], len(dispatcher.threads))
+        yield threads
@@ -1,13 +1,16 @@
 from contextlib import contextmanager
-from threading import RLock
+from queue import Queue
+from threading import RLock, get_ident
+from time import perf_counter
 from types import TracebackType
-from typing import Optional, Literal, Any, Generator
-from uuid import uuid4
+from typing import Optional, Literal, Any, Generator, Iterable
+from uuid import UUID, uuid4
 
 from pysqlcipher3 import dbapi2 as sqlcipher
 from typing_extensions import TypeAlias, Self
 
 from domain.data_init import DataEncryptedError
+from infrastructure.repository.db.instrumentation import DBInstrumentation
 
 UnderlyingCursor: TypeAlias = sqlcipher.Cursor
 UnderlyingConnection: TypeAlias = sqlcipher.Connection
@@ -42,6 +45,9 @@ class DBCursor:
     def execute(self, statement: str, *args) -> Self:
         return self._cursor.execute(statement, *args)
 
+    def executemany(self, statement: str, params: Iterable[Any]) -> Self:
+        return self._cursor.executemany(statement, params)
+
     def fetchone(self) -> Any:
         return self._cursor.fetchone()
 
@@ -55,11 +61,76 @@ class DBCursor:
         self._cursor.close()
 
 
+def _elapsed_ms(start: float) -> float:
+    return (perf_counter() - start) * 1000
+
+
+class InstrumentedDBCursor(DBCursor):
+    def __init__(
+        self, cursor: UnderlyingCursor, instrumentation: DBInstrumentation
+    ) -> None:
+        super().__init__(cursor)
+        self._instrumentation = instrumentation
+        self._last_sql: Optional[str] = None
+
+    def execute(self, statement: str, *args) -> Self:
+        start = perf_counter()
+        result = self._cursor.execute(statement, *args)
+        self._last_sql = self._instrumentation.record_execute(
+            statement,
+            args[0] if args else (),
+            _elapsed_ms(start),
+            self._cursor.connection,
+        )
+        return result
+
+    def executemany(self, statement: str, params: Iterable[Any]) -> Self:
+        start = perf_counter()
+        result = self._cursor.executemany(statement, params)
+        self._last_sql = self._instrumentation.record_execute(
+            statement, None, _elapsed_ms(start), self._cursor.connection
+        )
+        return result
+
+    def fetchone(self) -> Any:
+        start = perf_counter()
+        row = self._cursor.fetchone()
+        self._instrumentation.record_fetch(
+            self._last_sql, _elapsed_ms(start), 0 if row is None else 1
+        )
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> list[Any]:
+        start = perf_counter()
+        rows = self._cursor.fetchmany(size)
+        self._instrumentation.record_fetch(
+            self._last_sql, _elapsed_ms(start), len(rows)
+        )
+        return rows
+
+    def fetchall(self) -> list[Any]:
+        start = perf_counter()
+        rows = self._cursor.fetchall()
+        self._instrumentation.record_fetch(
+            self._last_sql, _elapsed_ms(start), len(rows)
+        )
+        return rows
+
+
 class DBClient:
-    def __init__(self, connection: UnderlyingConnection | None = None):
+    def __init__(
+        self,
+        connection: UnderlyingConnection | None = None,
+        instrumentation: Optional[DBInstrumentation] = None,
+    ):
         self._conn = connection
+        self._instrumentation = instrumentation
         self.savepoint_stack: list[Optional[str]] = []
         self._lock = RLock()
+        self._tx_owner: Optional[int] = None
+        self._readers: Queue[UnderlyingConnection] = Queue()
+        self._reader_count = 0
+        self._session: Optional[UUID] = None
 
     def _get_connection(self) -> UnderlyingConnection:
         if self._conn is None:
@@ -68,13 +139,14 @@ class DBClient:
 
     @contextmanager
     def tx(self) -> Generator[DBCursor, None, None]:
-        with self._lock:
+        with self._locked("tx"):
             cursor = self._cursor()
             try:
                 if not self.savepoint_stack:
                     # Outer transaction
                     cursor.execute("BEGIN")
                     self.savepoint_stack.append(None)
+                    self._tx_owner = get_ident()
                 else:
                     # Generate unique savepoint name for nested transaction
                     savepoint_name = f"savepoint_{uuid4().hex}"
@@ -106,17 +178,86 @@ class DBClient:
                 # Cleanup stack and cursor
                 if self.savepoint_stack:
                     self.savepoint_stack.pop()
+                if not self.savepoint_stack:
+                    self._tx_owner = None
                 cursor.close()
 
     @contextmanager
     def read(self) -> Generator[DBCursor, None, None]:
-        with self._lock:
+        # Reads issued from within an open transaction must see its uncommitted
+        # changes, so they stay on the writer connection
+        if not self._reader_count or self._tx_owner == get_ident():
+            with self._locked("read"):
+                cursor = self._cursor()
+                try:
+                    yield cursor
+                finally:
+                    cursor.close()
+            return
+
+        if self._instrumentation is None:
+            reader = self._readers.get()
+        else:
+            start = perf_counter()
+            reader = self._readers.get()
+            self._instrumentation.record_lock("reader_wait", _elapsed_ms(start))
+
+        # Readers are in autocommit mode, so every statement would otherwise see
+        # the latest commit. A read transaction pins one WAL snapshot for all of
+        # the statements of this read
+        cursor = self._wrap(reader.cursor())
+        start = perf_counter()
+        try:
+            reader.execute("BEGIN")
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+                reader.execute("COMMIT")
+        finally:
+            self._readers.put(reader)
+            if self._instrumentation is not None:
+                self._instrumentation.record_lock("reader_hold", _elapsed_ms(start))
+
+    @contextmanager
+    def maintenance(self) -> Generator[DBCursor, None, None]:
+        # Statements like VACUUM can't run inside a transaction, the connection
+        # is in autocommit mode so they are issued straight under the lock
+        with self._locked("maintenance"):
+            if self.savepoint_stack:
+                raise RuntimeError("Maintenance can't run inside a transaction")
             cursor = self._cursor()
             try:
                 yield cursor
             finally:
                 cursor.close()
 
+    def _locked(self, name: str):
+        # Plain lock when instrumentation is disabled, so it adds no overhead
+        if self._instrumentation is None:
+            return self._lock
+        return self._timed_lock(name)
+
+    @contextmanager
+    def _timed_lock(self, name: str) -> Generator[None, None, None]:
+        start = perf_counter()
+        with self._lock:
+            acquired = perf_counter()
+            self._instrumentation.record_lock(f"{name}_wait", _elapsed_ms(start))
+            try:
+                yield
+            finally:
+                self._instrumentation.record_lock(f"{name}_hold", _elapsed_ms(acquired))
+
+    @property
+    def instrumentation(self) -> Optional[DBInstrumentation]:
+        return self._instrumentation
+
+    @property
+    def session(self) -> Optional[UUID]:
+        # Changes every time a database is opened, None while locked
+        return self._session
+
     def _commit(self):
         self._get_connection().commit()
 
@@ -125,8 +266,16 @@ class DBClient:
 
     def close(self):
         with self._lock:
+            self.close_readers()
             self._get_connection().close()
             self._conn = None
+            self._session = None
+
+    def close_readers(self):
+        reader_count, self._reader_count = self._reader_count, 0
+        # Waits for in-flight reads to give their connection back
+        for _ in range(reader_count):
+            self._readers.get().close()
 
     def silent_close(self) -> bool:
         try:
@@ -136,8 +285,21 @@ class DBClient:
             return False
 
     def _cursor(self) -> DBCursor:
-        return DBCursor(self._get_connection().cursor())
+        return self._wrap(self._get_connection().cursor())
+
+    def _wrap(self, cursor: UnderlyingCursor) -> DBCursor:
+        if self._instrumentation is None:
+            return DBCursor(cursor)
+        return InstrumentedDBCursor(cursor, self._instrumentation)
 
     def set_connection(self, connection: UnderlyingConnection) -> None:
         self._conn = connection
         self.savepoint_stack = []
+        self._tx_owner = None
+        self._session = uuid4()
+
+    def set_readers(self, connections: list[UnderlyingConnection]) -> None:
+        self.close_readers()
+        for connection in connections:
+            self._readers.put(connection)
+        self._reader_count = len(connections)
@@ -0,0 +1,46 @@
+from decimal import Decimal, InvalidOperation
+from typing import Optional
+
+from infrastructure.repository.db.client import UnderlyingConnection
+
+
+def _parse(value) -> Optional[Decimal]:
+    if value is None:
+        return None
+    try:
+        return Decimal(str(value).strip())
+    except InvalidOperation:
+        return None
+
+
+def _format(value: Decimal) -> str:
+    # Same plain notation Dezimal uses when amounts are stored
+    return f"{value:f}"
+
+
+class DecimalSum:
+    """Exact SUM over amounts stored as decimal strings."""
+
+    def __init__(self):
+        self._total: Optional[Decimal] = None
+
+    def step(self, value):
+        parsed = _parse(value)
+        if parsed is None:
+            return
+        self._total = parsed if self._total is None else self._total + parsed
+
+    def finalize(self) -> Optional[str]:
+        return _format(self._total) if self._total is not None else None
+
+
+def decimal_normalize(value):
+    parsed = _parse(value)
+    if parsed is None or not parsed.is_finite():
+        return value
+    return _format(parsed)
+
+
+def register(connection: UnderlyingConnection):
+    connection.create_aggregate("DEC_SUM", 1, DecimalSum)
+    connection.create_function("DEC_NORM", 1, decimal_normalize)
@@ -0,0 +1,141 @@
+import logging
+import re
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Optional
+
+LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_SAVEPOINT_NAME = re.compile(r"savepoint_[0-9a-f]{32}", re.IGNORECASE)
+
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+def normalize_sql(statement: str) -> str:
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _SAVEPOINT_NAME.sub("savepoint_?", sql)
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _PLACEHOLDER_LIST.sub("?...", sql)
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float):
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> dict:
+        bounds = [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + ["le_inf"]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(bounds, self.buckets)),
+        }
+
+
+class StatementStats:
+    def __init__(self):
+        self.execute = LatencyHistogram()
+        self.fetch = LatencyHistogram()
+        self.rows = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "execute": self.execute.to_dict(),
+            "fetch": self.fetch.to_dict(),
+            "rows": self.rows,
+        }
+
+
+class DBInstrumentation:
+    def __init__(self, slow_query_ms: float = 200):
+        self.slow_query_ms = slow_query_ms
+        self._lock = Lock()
+        self._statements: dict[str, StatementStats] = {}
+        self._locks: dict[str, LatencyHistogram] = {}
+        self._slow_log = logging.getLogger(f"{__name__}.slow_query")
+
+    def _statement(self, sql: str) -> StatementStats:
+        if sql not in self._statements:
+            self._statements[sql] = StatementStats()
+        return self._statements[sql]
+
+    def record_execute(
+        self, statement: str, params: Any, elapsed_ms: float, connection: Any
+    ) -> str:
+        sql = normalize_sql(statement)
+        with self._lock:
+            self._statement(sql).execute.observe(elapsed_ms)
+
+        if elapsed_ms >= self.slow_query_ms:
+            self._log_slow(statement, params, elapsed_ms, connection)
+
+        return sql
+
+    def record_fetch(self, sql: Optional[str], elapsed_ms: float, rows: int):
+        if sql is None:
+            return
+        with self._lock:
+            stats = self._statement(sql)
+            stats.fetch.observe(elapsed_ms)
+            stats.rows += rows
+
+    def record_lock(self, name: str, elapsed_ms: float):
+        with self._lock:
+            if name not in self._locks:
+                self._locks[name] = LatencyHistogram()
+            self._locks[name].observe(elapsed_ms)
+
+    def _log_slow(self, statement: str, params: Any, elapsed_ms: float, connection):
+        plan = None
+        if params is not None and statement.lstrip().upper().startswith(_EXPLAINABLE):
+            try:
+                explain_cursor = connection.cursor()
+                try:
+                    explain_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", params)
+                    plan = [row[-1] for row in explain_cursor.fetchall()]
+                finally:
+                    explain_cursor.close()
+            except Exception as e:
+                plan = [f"Could not explain statement: {e}"]
+
+        self._slow_log.warning(
+            f"Slow statement ({elapsed_ms:.1f} ms): {normalize_sql(statement)}"
+            + ("\nQuery plan:\n  " + "\n  ".join(plan) if plan else "")
+        )
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            statements = sorted(
+                self._statements.items(),
+                key=lambda item: item[1].execute.total_ms + item[1].fetch.total_ms,
+                reverse=True,
+            )
+            return {
+                "slow_query_ms": self.slow_query_ms,
+                "statements": [
+                    {"sql": sql, **stats.to_dict()} for sql, stats in statements
+                ],
+                "locks": {
+                    name: histogram.to_dict() for name, histogram in self._locks.items()
+                },
+            }
+
+    def reset(self):
+        with self._lock:
+            self._statements.clear()
+            self._locks.clear()
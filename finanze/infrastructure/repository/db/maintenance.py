@@ -0,0 +1,27 @@
+import logging
+
+from application.ports.db_maintenance_port import DBMaintenancePort
+from infrastructure.repository.db.client import DBClient
+
+INCREMENTAL_AUTO_VACUUM = 2
+VACUUM_PAGES = 2000
+
+
+class DBMaintenance(DBMaintenancePort):
+    def __init__(self, client: DBClient):
+        self._db_client = client
+        self._log = logging.getLogger(__name__)
+
+    def optimize(self):
+        with self._db_client.maintenance() as cursor:
+            cursor.execute("ANALYZE")
+
+            cursor.execute("PRAGMA auto_vacuum")
+            if cursor.fetchone()[0] != INCREMENTAL_AUTO_VACUUM:
+                self._log.info("Enabling incremental auto vacuum, rebuilding database")
+                cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                cursor.execute("VACUUM")
+                return
+
+            cursor.execute(f"PRAGMA incremental_vacuum({VACUUM_PAGES})")
+            cursor.fetchall()
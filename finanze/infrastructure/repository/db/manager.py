@@ -9,6 +9,7 @@ from domain.data_init import (
     DatasourceInitParams,
     DecryptionError,
 )
+from infrastructure.repository.db import decimal_functions
 from infrastructure.repository.db.client import DBClient, UnderlyingConnection
 from infrastructure.repository.db.upgrader import DatabaseUpgrader
 from infrastructure.repository.db.version_registry import versions
@@ -16,6 +17,7 @@ from pysqlcipher3 import dbapi2 as sqlcipher
 from pysqlcipher3._sqlite3 import DatabaseError
 
 DB_NAME = "data.db"
+READER_POOL_SIZE = 4
 
 
 class DBManager(DatasourceInitiator):
@@ -41,7 +43,9 @@ class DBManager(DatasourceInitiator):
     def initialize(self, params: DatasourceInitParams):
         self._initialize(params)
 
-    def _initialize(self, params: DatasourceInitParams) -> UnderlyingConnection:
+    def _initialize(
+        self, params: DatasourceInitParams, open_readers: bool = True
+    ) -> UnderlyingConnection:
         user_path = Path(params.user.path) / DB_NAME
         self._log.info(f"Attempting to connect and unlock database at {user_path}")
 
@@ -52,24 +56,35 @@ class DBManager(DatasourceInitiator):
 
             self._unlocked = False
             connection = None
+            readers = []
             try:
-                connection = sqlcipher.connect(
-                    database=str(user_path),
-                    isolation_level=None,
-                    check_same_thread=False,
-                )
+                connection = self._connect(user_path)
 
                 self._unlock_and_setup(connection, params.password)
+                # Only applies to new databases, existing ones are converted
+                # by the first DBMaintenance.optimize run
+                connection.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+                connection.execute("PRAGMA journal_mode = WAL;")
 
                 self._unlocked = True
                 self._client.set_connection(connection)
 
                 self._setup_database_schema()
 
+                if open_readers:
+                    for _ in range(READER_POOL_SIZE):
+                        reader = self._connect(user_path)
+                        readers.append(reader)
+                        self._unlock_and_setup(reader, params.password)
+                        reader.execute("PRAGMA query_only = ON;")
+                    self._client.set_readers(readers)
+
                 return connection
 
             except DatabaseError as e:
                 self._log.error(f"Failed to unlock database: {e}")
+                for reader in readers:
+                    reader.close()
                 if connection:
                     connection.close()
                 if "file is not a database" in str(e) or "encrypted" in str(e):
@@ -82,10 +97,19 @@ class DBManager(DatasourceInitiator):
                 self._log.exception(
                     "An unexpected error occurred during database connection/unlock."
                 )
+                for reader in readers:
+                    reader.close()
                 if connection:
                     connection.close()
                 raise
 
+    def _connect(self, path: Path) -> UnderlyingConnection:
+        return sqlcipher.connect(
+            database=str(path),
+            isolation_level=None,
+            check_same_thread=False,
+        )
+
     def _unlock_and_setup(self, connection: UnderlyingConnection, password: str):
         sanitized_pass = password.replace(r"'", r"''")
         connection.execute(f"PRAGMA key='{sanitized_pass}';")
@@ -96,6 +120,7 @@ class DBManager(DatasourceInitiator):
 
         connection.execute("PRAGMA foreign_keys = ON;")
         connection.row_factory = sqlcipher.Row
+        decimal_functions.register(connection)
 
         return connection
 
@@ -108,7 +133,7 @@ class DBManager(DatasourceInitiator):
                 "Database is unlocked, it must be locked before changing password."
             )
 
-        connection = self._initialize(user_params)
+        connection = self._initialize(user_params, open_readers=False)
         self._change_password(connection, new_password)
         self.lock()
 
@@ -117,7 +142,10 @@ class DBManager(DatasourceInitiator):
             raise Exception("Database must be unlocked before changing password.")
 
         sanitized_pass = new_password.replace(r"'", r"''")
+        # Rekeying is not supported while in WAL mode
+        connection.execute("PRAGMA journal_mode = DELETE;")
         connection.execute(f"PRAGMA rekey='{sanitized_pass}';")
+        connection.execute("PRAGMA journal_mode = WAL;")
 
         self._log.info("Database password changed successfully.")
 
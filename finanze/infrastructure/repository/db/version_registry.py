@@ -12,6 +12,32 @@ from infrastructure.repository.db.versions.v030_2_re_rename_historic import V030
 from infrastructure.repository.db.versions.v030_3_crypto_initial_investments import (
     V0303CryptoInitialInvestments,
 )
+from infrastructure.repository.db.versions.v030_4_sync_cursors import V0304SyncCursors
+from infrastructure.repository.db.versions.v030_5_transaction_index import (
+    V0305TransactionIndex,
+)
+from infrastructure.repository.db.versions.v030_6_position_snapshots import (
+    V0306PositionSnapshots,
+)
+from infrastructure.repository.db.versions.v030_7_latest_positions import (
+    V0307LatestPositions,
+)
+from infrastructure.repository.db.versions.v030_8_daily_position_aggregates import (
+    V0308DailyPositionAggregates,
+)
+from infrastructure.repository.db.versions.v030_9_decimal_amounts import (
+    V0309DecimalAmounts,
+)
+from infrastructure.repository.db.versions.v030_10_historic_lookup import (
+    V03010HistoricLookup,
+)
+from infrastructure.repository.db.versions.v030_11_transaction_refs import (
+    V03011TransactionRefs,
+)
+from infrastructure.repository.db.versions.v030_12_fetch_runs import V03012FetchRuns
+from infrastructure.repository.db.versions.v030_13_shared_transaction_refs import (
+    V03013SharedTransactionRefs,
+)
 
 versions = [
     V0Genesis(),
@@ -26,4 +52,14 @@ versions = [
     V0301BSC(),
     V0302(),
     V0303CryptoInitialInvestments(),
+    V0304SyncCursors(),
+    V0305TransactionIndex(),
+    V0306PositionSnapshots(),
+    V0307LatestPositions(),
+    V0308DailyPositionAggregates(),
+    V0309DecimalAmounts(),
+    V03010HistoricLookup(),
+    V03011TransactionRefs(),
+    V03012FetchRuns(),
+    V03013SharedTransactionRefs(),
 ]
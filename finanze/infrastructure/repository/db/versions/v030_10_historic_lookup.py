@@ -0,0 +1,19 @@
+from infrastructure.repository.db.client import DBCursor
+from infrastructure.repository.db.query_mixin import QueryMixin
+from infrastructure.repository.db.upgrader import DBVersionMigration
+
+DDL = """
+      CREATE INDEX idx_itxs_investment_entity_name ON investment_transactions (entity_id, name);
+      CREATE INDEX idx_ihist_entity_name ON investment_historic (entity_id, name);
+      """
+
+
+class V03010HistoricLookup(DBVersionMigration, QueryMixin):
+    @property
+    def name(self):
+        return "v0.3.0:10_historic_lookup"
+
+    def upgrade(self, cursor: DBCursor):
+        statements = self.parse_block(DDL)
+        for statement in statements:
+            cursor.execute(statement)
@@ -0,0 +1,35 @@
+from infrastructure.repository.db.client import DBCursor
+from infrastructure.repository.db.query_mixin import QueryMixin
+from infrastructure.repository.db.upgrader import DBVersionMigration
+
+DDL = """
+      DELETE
+      FROM investment_transactions
+      WHERE is_real
+        AND rowid NOT IN (SELECT MAX(rowid)
+                          FROM investment_transactions
+                          WHERE is_real
+                          GROUP BY entity_id, ref);
+
+      DELETE
+      FROM account_transactions
+      WHERE is_real
+        AND rowid NOT IN (SELECT MAX(rowid)
+                          FROM account_transactions
+                          WHERE is_real
+                          GROUP BY entity_id, ref);
+
+      CREATE UNIQUE INDEX idx_itxs_investment_entity_ref ON investment_transactions (entity_id, ref) WHERE is_real;
+      CREATE UNIQUE INDEX idx_account_entity_ref ON account_transactions (entity_id, ref) WHERE is_real;
+      """
+
+
+class V03011TransactionRefs(DBVersionMigration, QueryMixin):
+    @property
+    def name(self):
+        return "v0.3.0:11_transaction_refs"
+
+    def upgrade(self, cursor: DBCursor):
+        statements = self.parse_block(DDL)
+        for statement in statements:
+            cursor.execute(statement)
@@ -0,0 +1,56 @@
+from infrastructure.repository.db.client import DBCursor
+from infrastructure.repository.db.query_mixin import QueryMixin
+from infrastructure.repository.db.upgrader import DBVersionMigration
+
+DDL = """
+      CREATE TABLE fetch_runs
+      (
+          id               CHAR(36)    PRIMARY KEY,
+          source           VARCHAR(16) NOT NULL,
+          entity_id        CHAR(36)    REFERENCES entities (id) ON DELETE CASCADE ON UPDATE CASCADE,
+          features         TEXT        NOT NULL,
+          job_id           CHAR(36),
+          status           VARCHAR(16) NOT NULL,
+          code             VARCHAR(64),
+          started_at       TIMESTAMP   NOT NULL,
+          duration         REAL        NOT NULL,
+          login_duration   REAL        NOT NULL,
+          http_duration    REAL        NOT NULL,
+          mapping_duration REAL        NOT NULL,
+          commit_duration  REAL        NOT NULL
+      );
+
+      CREATE INDEX idx_fetch_runs_started_at ON fetch_runs (started_at);
+      CREATE INDEX idx_fetch_runs_entity_started_at ON fetch_runs (entity_id, started_at);
+
+      CREATE TABLE fetch_run_spans
+      (
+          run_id       CHAR(36)     NOT NULL REFERENCES fetch_runs (id) ON DELETE CASCADE,
+          seq          INTEGER      NOT NULL,
+          kind         VARCHAR(16)  NOT NULL,
+          stage        VARCHAR(16),
+          entity_id    CHAR(36),
+          feature      VARCHAR(32),
+          start_offset REAL         NOT NULL,
+          duration     REAL         NOT NULL,
+          method       VARCHAR(16),
+          host         VARCHAR(255),
+          path         TEXT,
+          status       INTEGER,
+          bytes        INTEGER,
+          error        TEXT,
+
+          PRIMARY KEY (run_id, seq)
+      );
+      """
+
+
+class V03012FetchRuns(DBVersionMigration, QueryMixin):
+    @property
+    def name(self):
+        return "v0.3.0:12_fetch_runs"
+
+    def upgrade(self, cursor: DBCursor):
+        statements = self.parse_block(DDL)
+        for statement in statements:
+            cursor.execute(statement)
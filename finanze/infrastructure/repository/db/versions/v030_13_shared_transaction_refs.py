@@ -0,0 +1,63 @@
+from infrastructure.repository.db.client import DBCursor
+from infrastructure.repository.db.query_mixin import QueryMixin
+from infrastructure.repository.db.upgrader import DBVersionMigration
+
+# Refs already stored in both tables keep the most recently written row
+DDL = """
+      DELETE
+      FROM account_transactions
+      WHERE is_real
+        AND EXISTS (SELECT 1
+                    FROM investment_transactions it
+                    WHERE it.entity_id = account_transactions.entity_id
+                      AND it.ref = account_transactions.ref
+                      AND it.is_real
+                      AND it.created_at >= account_transactions.created_at);
+
+      DELETE
+      FROM investment_transactions
+      WHERE is_real
+        AND EXISTS (SELECT 1
+                    FROM account_transactions at
+                    WHERE at.entity_id = investment_transactions.entity_id
+                      AND at.ref = investment_transactions.ref
+                      AND at.is_real);
+      """
+
+# A real transaction ref is unique per entity across both tables, writing it to
+# one table replaces the row holding it in the other, so a transaction that
+# changes kind moves instead of being duplicated
+TRIGGERS = [
+    """
+    CREATE TRIGGER trg_itx_shared_ref
+        BEFORE INSERT
+        ON investment_transactions
+        WHEN NEW.is_real
+    BEGIN
+        DELETE FROM account_transactions WHERE entity_id = NEW.entity_id AND ref = NEW.ref AND is_real;
+    END;
+    """,
+    """
+    CREATE TRIGGER trg_atx_shared_ref
+        BEFORE INSERT
+        ON account_transactions
+        WHEN NEW.is_real
+    BEGIN
+        DELETE FROM investment_transactions WHERE entity_id = NEW.entity_id AND ref = NEW.ref AND is_real;
+    END;
+    """,
+]
+
+
+class V03013SharedTransactionRefs(DBVersionMigration, QueryMixin):
+    @property
+    def name(self):
+        return "v0.3.0:13_shared_transaction_refs"
+
+    def upgrade(self, cursor: DBCursor):
+        statements = self.parse_block(DDL)
+        for statement in statements:
+            cursor.execute(statement)
+
+        for trigger in TRIGGERS:
+            cursor.execute(trigger)
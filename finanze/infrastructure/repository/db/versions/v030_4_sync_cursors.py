@@ -0,0 +1,38 @@
+from infrastructure.repository.db.client import DBCursor
+from infrastructure.repository.db.query_mixin import QueryMixin
+from infrastructure.repository.db.upgrader import DBVersionMigration
+
+DDL = """
+      CREATE TABLE sync_cursors
+      (
+          entity_id  CHAR(36)     NOT NULL REFERENCES entities (id) ON DELETE CASCADE ON UPDATE CASCADE,
+          scope      VARCHAR(255) NOT NULL,
+          cursor     TEXT         NOT NULL,
+          updated_at TIMESTAMP    NOT NULL,
+
+          PRIMARY KEY (entity_id, scope)
+      );
+
+      CREATE TABLE entity_movements
+      (
+          entity_id CHAR(36)     NOT NULL REFERENCES entities (id) ON DELETE CASCADE ON UPDATE CASCADE,
+          ref       VARCHAR(255) NOT NULL,
+          seq       INTEGER      NOT NULL,
+          payload   TEXT         NOT NULL,
+
+          PRIMARY KEY (entity_id, ref)
+      );
+
+      CREATE INDEX idx_em_entity_id_seq ON entity_movements (entity_id, seq);
+      """
+
+
+class V0304SyncCursors(DBVersionMigration, QueryMixin):
+    @property
+    def name(self):
+        return "v0.3.0:4_sync_cursors"
+
+    def upgrade(self, cursor: DBCursor):
+        statements = self.parse_block(DDL)
+        for statement in statements:
+            cursor.execute(statement)
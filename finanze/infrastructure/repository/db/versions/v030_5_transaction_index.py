@@ -0,0 +1,98 @@
+from infrastructure.repository.db.client import DBCursor
+from infrastructure.repository.db.query_mixin import QueryMixin
+from infrastructure.repository.db.upgrader import DBVersionMigration
+
+DDL = """
+      CREATE TABLE transaction_index
+      (
+          id           CHAR(36)     PRIMARY KEY,
+          source       VARCHAR(16)  NOT NULL,
+          entity_id    CHAR(36)     NOT NULL,
+          product_type VARCHAR(32)  NOT NULL,
+          type         VARCHAR(32)  NOT NULL,
+          date         TIMESTAMP    NOT NULL
+      );
+
+      CREATE INDEX idx_txi_date_id ON transaction_index (date DESC, id DESC);
+      CREATE INDEX idx_txi_entity_id_date ON transaction_index (entity_id, date DESC, id DESC);
+      CREATE INDEX idx_txi_product_type_date ON transaction_index (product_type, date DESC, id DESC);
+
+      INSERT INTO transaction_index (id, source, entity_id, product_type, type, date)
+      SELECT id, 'INVESTMENT', entity_id, product_type, type, date
+      FROM investment_transactions;
+
+      INSERT INTO transaction_index (id, source, entity_id, product_type, type, date)
+      SELECT id, 'ACCOUNT', entity_id, 'ACCOUNT', type, date
+      FROM account_transactions;
+      """
+
+TRIGGERS = [
+    """
+    CREATE TRIGGER trg_itx_index_insert
+        AFTER INSERT
+        ON investment_transactions
+    BEGIN
+        INSERT INTO transaction_index (id, source, entity_id, product_type, type, date)
+        VALUES (NEW.id, 'INVESTMENT', NEW.entity_id, NEW.product_type, NEW.type, NEW.date);
+    END;
+    """,
+    """
+    CREATE TRIGGER trg_itx_index_update
+        AFTER UPDATE OF id, entity_id, product_type, type, date
+        ON investment_transactions
+    BEGIN
+        DELETE FROM transaction_index WHERE id = OLD.id;
+        INSERT INTO transaction_index (id, source, entity_id, product_type, type, date)
+        VALUES (NEW.id, 'INVESTMENT', NEW.entity_id, NEW.product_type, NEW.type, NEW.date);
+    END;
+    """,
+    """
+    CREATE TRIGGER trg_itx_index_delete
+        AFTER DELETE
+        ON investment_transactions
+    BEGIN
+        DELETE FROM transaction_index WHERE id = OLD.id;
+    END;
+    """,
+    """
+    CREATE TRIGGER trg_atx_index_insert
+        AFTER INSERT
+        ON account_transactions
+    BEGIN
+        INSERT INTO transaction_index (id, source, entity_id, product_type, type, date)
+        VALUES (NEW.id, 'ACCOUNT', NEW.entity_id, 'ACCOUNT', NEW.type, NEW.date);
+    END;
+    """,
+    """
+    CREATE TRIGGER trg_atx_index_update
+        AFTER UPDATE OF id, entity_id, type, date
+        ON account_transactions
+    BEGIN
+        DELETE FROM transaction_index WHERE id = OLD.id;
+        INSERT INTO transaction_index (id, source, entity_id, product_type, type, date)
+        VALUES (NEW.id, 'ACCOUNT', NEW.entity_id, 'ACCOUNT', NEW.type, NEW.date);
+    END;
+    """,
+    """
+    CREATE TRIGGER trg_atx_index_delete
+        AFTER DELETE
+        ON account_transactions
+    BEGIN
+        DELETE FROM transaction_index WHERE id = OLD.id;
+    END;
+    """,
+]
+
+
+class V0305TransactionIndex(DBVersionMigration, QueryMixin):
+    @property
+    def name(self):
+        return "v0.3.0:5_transaction_index"
+
+    def upgrade(self, cursor: DBCursor):
+        statements = self.parse_block(DDL)
+        for statement in statements:
+            cursor.execute(statement)
+
+        for trigger in TRIGGERS:
+            cursor.execute(trigger)
@@ -0,0 +1,58 @@
+from infrastructure.repository.db.client import DBCursor
+from infrastructure.repository.db.query_mixin import QueryMixin
+from infrastructure.repository.db.upgrader import DBVersionMigration
+
+DDL = """
+      CREATE TABLE latest_positions
+      (
+          entity_id          CHAR(36) NOT NULL REFERENCES entities (id) ON DELETE CASCADE ON UPDATE CASCADE,
+          is_real            BOOLEAN  NOT NULL,
+          global_position_id CHAR(36) NOT NULL REFERENCES global_positions (id) ON DELETE CASCADE ON UPDATE CASCADE,
+
+          PRIMARY KEY (entity_id, is_real)
+      );
+
+      CREATE INDEX idx_latp_global_position_id ON latest_positions (global_position_id);
+      CREATE INDEX idx_gp_entity_real_date ON global_positions (entity_id, is_real, date DESC);
+      """
+
+# Latest real position of each entity and the positions of the last virtual
+# import, as of this version of the latest_positions helpers
+BACKFILL = """
+           INSERT INTO latest_positions (entity_id, is_real, global_position_id)
+           SELECT entity_id, TRUE, id
+           FROM (SELECT id,
+                        entity_id,
+                        ROW_NUMBER() OVER (PARTITION BY entity_id ORDER BY date DESC, id DESC) AS rn
+                 FROM global_positions
+                 WHERE is_real = TRUE)
+           WHERE rn = 1;
+
+           INSERT INTO latest_positions (entity_id, is_real, global_position_id)
+           SELECT entity_id, FALSE, id
+           FROM (SELECT gp.id,
+                        gp.entity_id,
+                        ROW_NUMBER() OVER (PARTITION BY gp.entity_id ORDER BY gp.date DESC, gp.id DESC) AS rn
+                 FROM global_positions gp
+                          JOIN virtual_data_imports vdi ON vdi.global_position_id = gp.id
+                 WHERE gp.is_real = FALSE
+                   AND vdi.import_id = (SELECT import_id
+                                        FROM virtual_data_imports
+                                        ORDER BY date DESC
+                                        LIMIT 1))
+           WHERE rn = 1;
+           """
+
+
+class V0307LatestPositions(DBVersionMigration, QueryMixin):
+    @property
+    def name(self):
+        return "v0.3.0:7_latest_positions"
+
+    def upgrade(self, cursor: DBCursor):
+        statements = self.parse_block(DDL)
+        for statement in statements:
+            cursor.execute(statement)
+
+        for statement in self.parse_block(BACKFILL):
+            cursor.execute(statement)
@@ -0,0 +1,96 @@
+from domain.dezimal import Dezimal
+from infrastructure.repository.db.client import DBCursor
+from infrastructure.repository.db.query_mixin import QueryMixin
+from infrastructure.repository.db.upgrader import DBVersionMigration
+
+DDL = """
+      CREATE TABLE daily_position_aggregates
+      (
+          date         DATE        NOT NULL,
+          entity_id    CHAR(36)    NOT NULL REFERENCES entities (id) ON DELETE CASCADE ON UPDATE CASCADE,
+          is_real      BOOLEAN     NOT NULL,
+          product_type VARCHAR(32) NOT NULL,
+          currency     CHAR(3)     NOT NULL,
+          amount       TEXT        NOT NULL,
+
+          PRIMARY KEY (date, entity_id, is_real, product_type, currency)
+      );
+
+      CREATE INDEX idx_dpa_entity_real_date ON daily_position_aggregates (entity_id, is_real, date);
+      """
+
+# Value column of each product table and the backfill query as of this version,
+# independent of the live daily_aggregates and product_values helpers
+PRODUCT_VALUES = [
+    ("ACCOUNT", "account_positions", "total"),
+    ("STOCK_ETF", "stock_positions", "market_value"),
+    ("FUND", "fund_positions", "market_value"),
+    ("DEPOSIT", "deposit_positions", "amount"),
+    ("REAL_ESTATE_CF", "real_estate_cf_positions", "pending_amount"),
+    ("FACTORING", "factoring_positions", "amount"),
+    ("CROWDLENDING", "crowdlending_positions", "total"),
+    ("CRYPTO", "crypto_currency_wallet_positions", "market_value"),
+    ("COMMODITY", "commodity_positions", "market_value"),
+    ("LOAN", "loan_positions", "principal_outstanding"),
+]
+
+VALUES_SQL = " UNION ALL ".join(
+    [
+        f"SELECT global_position_id, '{product_type}' AS product_type, currency, {column} AS amount FROM {table}"
+        for product_type, table, column in PRODUCT_VALUES
+    ]
+    + [
+        """
+        SELECT w.global_position_id, 'CRYPTO' AS product_type, t.currency, t.market_value AS amount
+        FROM crypto_currency_token_positions t
+                 JOIN crypto_currency_wallet_positions w ON t.wallet_id = w.id
+        """
+    ]
+)
+
+# Only the last position of each entity and day counts for that day
+DAY_VALUES_SQL = f"""
+    WITH day_positions AS (SELECT DATE(date)                           AS day,
+                                  entity_id,
+                                  is_real,
+                                  COALESCE(content_position_id, id)    AS content_id,
+                                  ROW_NUMBER() OVER (PARTITION BY entity_id, is_real, DATE(date) ORDER BY date DESC, id DESC) AS rn
+                           FROM global_positions)
+    SELECT dp.day, dp.entity_id, dp.is_real, v.product_type, v.currency, v.amount
+    FROM day_positions dp
+             JOIN ({VALUES_SQL}) v ON v.global_position_id = dp.content_id
+    WHERE dp.rn = 1
+"""
+
+
+class V0308DailyPositionAggregates(DBVersionMigration, QueryMixin):
+    @property
+    def name(self):
+        return "v0.3.0:8_daily_position_aggregates"
+
+    def upgrade(self, cursor: DBCursor):
+        statements = self.parse_block(DDL)
+        for statement in statements:
+            cursor.execute(statement)
+
+        cursor.execute(DAY_VALUES_SQL)
+        totals = {}
+        for row in cursor.fetchall():
+            if row["amount"] is None or not row["currency"]:
+                continue
+            key = (
+                row["day"],
+                row["entity_id"],
+                bool(row["is_real"]),
+                row["product_type"],
+                row["currency"],
+            )
+            totals[key] = totals.get(key, Dezimal(0)) + Dezimal(row["amount"])
+
+        cursor.executemany(
+            """
+            INSERT INTO daily_position_aggregates (date, entity_id, is_real, product_type, currency, amount)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [key + (str(amount),) for key, amount in totals.items()],
+        )
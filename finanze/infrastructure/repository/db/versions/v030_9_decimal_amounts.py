@@ -0,0 +1,89 @@
+from infrastructure.repository.db.client import DBCursor
+from infrastructure.repository.db.query_mixin import QueryMixin
+from infrastructure.repository.db.upgrader import DBVersionMigration
+
+DECIMAL_COLUMNS = {
+    "account_positions": ["total", "interest", "retained", "pending_transfers"],
+    "card_positions": ["card_limit", "used"],
+    "loan_positions": [
+        "current_installment",
+        "interest_rate",
+        "loan_amount",
+        "principal_outstanding",
+        "principal_paid",
+    ],
+    "stock_positions": [
+        "shares",
+        "initial_investment",
+        "average_buy_price",
+        "market_value",
+    ],
+    "fund_portfolios": ["initial_investment", "market_value"],
+    "fund_positions": [
+        "shares",
+        "initial_investment",
+        "average_buy_price",
+        "market_value",
+    ],
+    "factoring_positions": ["amount", "interest_rate", "gross_interest_rate"],
+    "real_estate_cf_positions": ["amount", "pending_amount", "interest_rate"],
+    "deposit_positions": ["amount", "expected_interests", "interest_rate"],
+    "crowdlending_positions": ["total", "weighted_interest_rate"],
+    "crypto_currency_wallet_positions": ["amount", "market_value"],
+    "crypto_currency_token_positions": ["amount", "market_value"],
+    "commodity_positions": [
+        "amount",
+        "market_value",
+        "initial_investment",
+        "average_buy_price",
+    ],
+    "crypto_initial_investments": ["initial_investment", "average_buy_price"],
+    "periodic_contributions": ["amount"],
+    "investment_transactions": [
+        "amount",
+        "net_amount",
+        "shares",
+        "price",
+        "fees",
+        "retentions",
+        "interests",
+    ],
+    "account_transactions": [
+        "amount",
+        "interest_rate",
+        "avg_balance",
+        "fees",
+        "retentions",
+    ],
+    "investment_historic": [
+        "invested",
+        "repaid",
+        "returned",
+        "net_return",
+        "fees",
+        "retentions",
+        "interests",
+        "interest_rate",
+        "gross_interest_rate",
+    ],
+}
+
+
+class V0309DecimalAmounts(DBVersionMigration, QueryMixin):
+    @property
+    def name(self):
+        return "v0.3.0:9_decimal_amounts"
+
+    def upgrade(self, cursor: DBCursor):
+        # Rewrites legacy values (exponent notation, floats, padding) into the
+        # plain decimal notation DEC_SUM and Dezimal agree on
+        for table, columns in DECIMAL_COLUMNS.items():
+            for column in columns:
+                cursor.execute(
+                    f"""
+                    UPDATE {table}
+                    SET {column} = DEC_NORM({column})
+                    WHERE {column} IS NOT NULL
+                      AND {column} IS NOT DEC_NORM({column})
+                    """
+                )
@@ -0,0 +1,173 @@
+import json
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from application.ports.fetch_trace_port import FetchTracePort
+from domain.entity import Feature
+from domain.fetch_progress import FetchSource, FetchStage, FetchStageStatus
+from domain.fetch_trace import FetchRun, FetchRunBreakdown, FetchRunQuery, FetchSpan
+from infrastructure.repository.db.client import DBClient
+
+RUN_COLUMNS = """
+    id, source, entity_id, features, job_id, status, code, started_at, duration,
+    login_duration, http_duration, mapping_duration, commit_duration
+"""
+
+
+def _map_run(row, spans: Optional[list[FetchSpan]] = None) -> FetchRun:
+    return FetchRun(
+        id=UUID(row["id"]),
+        source=FetchSource(row["source"]),
+        status=FetchStageStatus(row["status"]),
+        started_at=datetime.fromisoformat(row["started_at"]),
+        duration=row["duration"],
+        breakdown=FetchRunBreakdown(
+            login=row["login_duration"],
+            http=row["http_duration"],
+            mapping=row["mapping_duration"],
+            commit=row["commit_duration"],
+        ),
+        entity_id=UUID(row["entity_id"]) if row["entity_id"] else None,
+        features=[Feature(f) for f in json.loads(row["features"])],
+        code=row["code"],
+        job_id=UUID(row["job_id"]) if row["job_id"] else None,
+        spans=spans,
+    )
+
+
+def _map_span(row) -> FetchSpan:
+    return FetchSpan(
+        kind=row["kind"],
+        offset=row["start_offset"],
+        duration=row["duration"],
+        stage=FetchStage(row["stage"]) if row["stage"] else None,
+        entity_id=UUID(row["entity_id"]) if row["entity_id"] else None,
+        feature=Feature(row["feature"]) if row["feature"] else None,
+        method=row["method"],
+        host=row["host"],
+        path=row["path"],
+        status=row["status"],
+        bytes=row["bytes"],
+        error=row["error"],
+    )
+
+
+def _filters(query: FetchRunQuery) -> tuple[str, list]:
+    conditions, params = [], []
+    if query.entity_id:
+        conditions.append("entity_id = ?")
+        params.append(str(query.entity_id))
+    if query.source:
+        conditions.append("source = ?")
+        params.append(query.source.value)
+    if query.since:
+        conditions.append("started_at >= ?")
+        params.append(query.since.isoformat())
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where, params
+
+
+class FetchTraceRepository(FetchTracePort):
+    def __init__(self, client: DBClient):
+        self._db_client = client
+
+    def save(self, run: FetchRun):
+        with self._db_client.tx() as cursor:
+            cursor.execute(
+                f"INSERT INTO fetch_runs ({RUN_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(run.id),
+                    run.source.value,
+                    str(run.entity_id) if run.entity_id else None,
+                    json.dumps([f.value for f in run.features]),
+                    str(run.job_id) if run.job_id else None,
+                    run.status.value,
+                    run.code,
+                    run.started_at.isoformat(),
+                    run.duration,
+                    run.breakdown.login,
+                    run.breakdown.http,
+                    run.breakdown.mapping,
+                    run.breakdown.commit,
+                ),
+            )
+            cursor.executemany(
+                """
+                INSERT INTO fetch_run_spans (run_id, seq, kind, stage, entity_id, feature,
+                                             start_offset, duration, method, host, path,
+                                             status, bytes, error)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        str(run.id),
+                        seq,
+                        span.kind,
+                        span.stage.value if span.stage else None,
+                        str(span.entity_id) if span.entity_id else None,
+                        span.feature.value if span.feature else None,
+                        span.offset,
+                        span.duration,
+                        span.method,
+                        span.host,
+                        span.path,
+                        span.status,
+                        span.bytes,
+                        span.error,
+                    )
+                    for seq, span in enumerate(run.spans or [])
+                ],
+            )
+
+    def get_by_id(self, run_id: UUID) -> Optional[FetchRun]:
+        with self._db_client.read() as cursor:
+            cursor.execute(
+                f"SELECT {RUN_COLUMNS} FROM fetch_runs WHERE id = ?", (str(run_id),)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            cursor.execute(
+                "SELECT * FROM fetch_run_spans WHERE run_id = ? ORDER BY seq",
+                (str(run_id),),
+            )
+            spans = [_map_span(span_row) for span_row in cursor.fetchall()]
+            return _map_run(row, spans)
+
+    def get_slowest(self, query: FetchRunQuery) -> list[FetchRun]:
+        where, params = _filters(query)
+        limit = "LIMIT ?" if query.limit else ""
+        if query.limit:
+            params.append(query.limit)
+
+        with self._db_client.read() as cursor:
+            cursor.execute(
+                f"SELECT {RUN_COLUMNS} FROM fetch_runs {where} "
+                f"ORDER BY duration DESC {limit}",
+                params,
+            )
+            return [_map_run(row) for row in cursor.fetchall()]
+
+    def get_all(self, query: FetchRunQuery) -> list[FetchRun]:
+        where, params = _filters(query)
+        limit = "LIMIT ?" if query.limit else ""
+        if query.limit:
+            params.append(query.limit)
+
+        with self._db_client.read() as cursor:
+            cursor.execute(
+                f"SELECT {RUN_COLUMNS} FROM fetch_runs {where} "
+                f"ORDER BY started_at {limit}",
+                params,
+            )
+            return [_map_run(row) for row in cursor.fetchall()]
+
+    def delete_before(self, date: datetime):
+        with self._db_client.tx() as cursor:
+            cursor.execute(
+                "DELETE FROM fetch_runs WHERE started_at < ?", (date.isoformat(),)
+            )
@@ -20,6 +20,23 @@ from infrastructure.repository.transaction.transaction_repository import (
 )
 
 
+INSERT_HISTORIC_ENTRY = """
+    INSERT INTO investment_historic (id, name, invested, repaid, returned, currency,
+                                     last_invest_date,
+                                     last_tx_date, effective_maturity, net_return, fees,
+                                     retentions, interests, state, entity_id, product_type,
+                                     interest_rate, gross_interest_rate, maturity,
+                                     extended_maturity, type, business_type, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+INSERT_HISTORIC_TX = """
+    INSERT INTO investment_historic_txs
+        (tx_id, historic_entry_id)
+    VALUES (?, ?)
+    """
+
+
 def _map_historic_row(row) -> BaseHistoricEntry:
     entity = Entity(
         id=UUID(row["entity_id"]),
@@ -63,9 +80,7 @@ def _map_historic_row(row) -> BaseHistoricEntry:
             **common,
             interest_rate=Dezimal(row["interest_rate"]),
             maturity=datetime.fromisoformat(row["maturity"]).date(),
-            extended_maturity=row["extended_maturity"]
-            if "extended_maturity" in row
-            else None,
+            extended_maturity=row["extended_maturity"],
             type=row["type"],
             business_type=row["business_type"],
         )
@@ -75,87 +90,131 @@ def _map_transaction_row(row) -> BaseInvestmentTx:
     return _map_investment_row(row)
 
 
+def _historic_row(entry: BaseHistoricEntry, created_at: str) -> tuple:
+    interest_rate = gross_interest_rate = maturity = None
+    extended_maturity = entry_type = business_type = None
+
+    if isinstance(entry, FactoringEntry):
+        interest_rate = str(entry.interest_rate)
+        gross_interest_rate = str(entry.gross_interest_rate)
+        maturity = entry.maturity.isoformat()
+        entry_type = entry.type
+    elif isinstance(entry, RealEstateCFEntry):
+        interest_rate = str(entry.interest_rate)
+        maturity = entry.maturity.isoformat()
+        extended_maturity = entry.extended_maturity
+        entry_type = entry.type
+        business_type = entry.business_type
+
+    return (
+        str(entry.id),
+        entry.name,
+        str(entry.invested),
+        str(entry.repaid) if entry.repaid else None,
+        str(entry.returned) if entry.returned else None,
+        entry.currency,
+        entry.last_invest_date.isoformat(),
+        entry.last_tx_date.isoformat(),
+        entry.effective_maturity.isoformat() if entry.effective_maturity else None,
+        str(entry.net_return) if entry.net_return else None,
+        str(entry.fees) if entry.fees else None,
+        str(entry.retentions) if entry.retentions else None,
+        str(entry.interests) if entry.interests else None,
+        entry.state,
+        str(entry.entity.id),
+        entry.product_type.value,
+        interest_rate,
+        gross_interest_rate,
+        maturity,
+        extended_maturity,
+        entry_type,
+        business_type,
+        created_at,
+    )
+
+
 class HistoricSQLRepository(HistoricPort):
     def __init__(self, client: DBClient):
         self._db_client = client
 
     def save(self, entries: list[BaseHistoricEntry]):
+        created_at = datetime.now(tzlocal()).isoformat()
+        rows = [_historic_row(entry, created_at) for entry in entries]
+        related_txs = [
+            (str(tx.id), str(entry.id)) for entry in entries for tx in entry.related_txs
+        ]
+
         with self._db_client.tx() as cursor:
-            for entry in entries:
-                base_data = {
-                    "id": str(entry.id),
-                    "name": entry.name,
-                    "invested": str(entry.invested),
-                    "repaid": str(entry.repaid) if entry.repaid else None,
-                    "returned": str(entry.returned) if entry.returned else None,
-                    "currency": entry.currency,
-                    "last_invest_date": entry.last_invest_date.isoformat(),
-                    "last_tx_date": entry.last_tx_date.isoformat(),
-                    "effective_maturity": entry.effective_maturity.isoformat()
-                    if entry.effective_maturity
-                    else None,
-                    "net_return": str(entry.net_return) if entry.net_return else None,
-                    "fees": str(entry.fees) if entry.fees else None,
-                    "retentions": str(entry.retentions) if entry.retentions else None,
-                    "interests": str(entry.interests) if entry.interests else None,
-                    "state": entry.state,
-                    "entity_id": str(entry.entity.id),
-                    "product_type": entry.product_type.value,
-                    "created_at": datetime.now(tzlocal()).isoformat(),
-                    "interest_rate": None,
-                    "gross_interest_rate": None,
-                    "maturity": None,
-                    "extended_maturity": None,
-                    "type": None,
-                    "business_type": None,
-                }
-
-                if isinstance(entry, FactoringEntry):
-                    base_data.update(
-                        {
-                            "interest_rate": str(entry.interest_rate),
-                            "gross_interest_rate": str(entry.gross_interest_rate),
-                            "maturity": entry.maturity.isoformat(),
-                            "type": entry.type,
-                        }
-                    )
-                elif isinstance(entry, RealEstateCFEntry):
-                    base_data.update(
-                        {
-                            "interest_rate": str(entry.interest_rate),
-                            "maturity": entry.maturity.isoformat(),
-                            "extended_maturity": entry.extended_maturity,
-                            "type": entry.type,
-                            "business_type": entry.business_type,
-                        }
-                    )
+            cursor.executemany(INSERT_HISTORIC_ENTRY, rows)
+            cursor.executemany(INSERT_HISTORIC_TX, related_txs)
 
-                cursor.execute(
-                    """
-                               INSERT INTO investment_historic (id, name, invested, repaid, returned, currency,
-                                                                last_invest_date,
-                                                                last_tx_date, effective_maturity, net_return, fees,
-                                                                retentions, interests, state, entity_id, product_type,
-                                                                interest_rate, gross_interest_rate, maturity,
-                                                                extended_maturity, type, business_type, created_at)
-                               VALUES (:id, :name, :invested, :repaid, :returned, :currency, :last_invest_date,
-                                       :last_tx_date, :effective_maturity, :net_return, :fees,
-                                       :retentions, :interests, :state, :entity_id, :product_type,
-                                       :interest_rate, :gross_interest_rate, :maturity,
-                                       :extended_maturity, :type, :business_type, :created_at)
-                               """,
-                    base_data,
-                )
+    def upsert(self, entries: list[BaseHistoricEntry]):
+        if not entries:
+            return
 
-                for tx in entry.related_txs:
-                    cursor.execute(
-                        """
-                                   INSERT INTO investment_historic_txs
-                                       (tx_id, historic_entry_id)
-                                   VALUES (?, ?)
-                                   """,
-                        (str(tx.id), str(entry.id)),
-                    )
+        created_at = datetime.now(tzlocal()).isoformat()
+        rows = [_historic_row(entry, created_at) for entry in entries]
+        entry_ids = [str(entry.id) for entry in entries]
+        related_txs = [
+            (str(tx.id), str(entry.id)) for entry in entries for tx in entry.related_txs
+        ]
+
+        with self._db_client.tx() as cursor:
+            cursor.executemany(
+                f"""
+                {INSERT_HISTORIC_ENTRY}
+                ON CONFLICT (id) DO UPDATE SET name                = excluded.name,
+                                               invested            = excluded.invested,
+                                               repaid              = excluded.repaid,
+                                               returned            = excluded.returned,
+                                               currency            = excluded.currency,
+                                               last_invest_date    = excluded.last_invest_date,
+                                               last_tx_date        = excluded.last_tx_date,
+                                               effective_maturity  = excluded.effective_maturity,
+                                               net_return          = excluded.net_return,
+                                               fees                = excluded.fees,
+                                               retentions          = excluded.retentions,
+                                               interests           = excluded.interests,
+                                               state               = excluded.state,
+                                               product_type        = excluded.product_type,
+                                               interest_rate       = excluded.interest_rate,
+                                               gross_interest_rate = excluded.gross_interest_rate,
+                                               maturity            = excluded.maturity,
+                                               extended_maturity   = excluded.extended_maturity,
+                                               type                = excluded.type,
+                                               business_type       = excluded.business_type
+                """,
+                rows,
+            )
+            cursor.execute(
+                f"DELETE FROM investment_historic_txs WHERE historic_entry_id IN ({', '.join('?' for _ in entry_ids)})",
+                tuple(entry_ids),
+            )
+            cursor.executemany(INSERT_HISTORIC_TX, related_txs)
+
+    def get_by_entity(self, entity_id: UUID) -> list[BaseHistoricEntry]:
+        with self._db_client.read() as cursor:
+            cursor.execute(
+                """
+                SELECT h.*, e.name AS entity_name, e.id AS entity_id, e.type as entity_type, e.is_real AS entity_is_real
+                FROM investment_historic h
+                         JOIN entities e ON h.entity_id = e.id
+                WHERE h.entity_id = ?
+                """,
+                (str(entity_id),),
+            )
+            return [_map_historic_row(row) for row in cursor.fetchall()]
+
+    def delete(self, entry_ids: list[UUID]):
+        if not entry_ids:
+            return
+
+        ids = [str(entry_id) for entry_id in entry_ids]
+        with self._db_client.tx() as cursor:
+            cursor.execute(
+                f"DELETE FROM investment_historic WHERE id IN ({', '.join('?' for _ in ids)})",
+                tuple(ids),
+            )
 
     def get_all(self, fetch_related_txs: bool = False) -> Historic:
         with self._db_client.read() as cursor:
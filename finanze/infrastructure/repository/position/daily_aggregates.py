@@ -0,0 +1,56 @@
+from uuid import UUID
+
+from infrastructure.repository.db.client import DBCursor
+from infrastructure.repository.position.product_values import PRODUCT_VALUES_SQL
+
+
+def _insert(cursor: DBCursor, position_filter: str, params: tuple):
+    # Only the last position of each entity and day counts for that day
+    cursor.execute(
+        f"""
+        INSERT INTO daily_position_aggregates (date, entity_id, is_real, product_type, currency, amount)
+        WITH day_positions AS (SELECT DATE(date)                           AS day,
+                                      entity_id,
+                                      is_real,
+                                      COALESCE(content_position_id, id)    AS content_id,
+                                      ROW_NUMBER() OVER (PARTITION BY entity_id, is_real, DATE(date) ORDER BY date DESC, id DESC) AS rn
+                               FROM global_positions
+                               WHERE {position_filter})
+        SELECT dp.day, dp.entity_id, dp.is_real, v.product_type, v.currency, DEC_SUM(v.amount)
+        FROM day_positions dp
+                 JOIN ({PRODUCT_VALUES_SQL}) v ON v.global_position_id = dp.content_id
+        WHERE dp.rn = 1
+          AND v.amount IS NOT NULL
+          AND v.currency IS NOT NULL
+          AND v.currency != ''
+        GROUP BY dp.day, dp.entity_id, dp.is_real, v.product_type, v.currency
+        """,
+        params,
+    )
+
+
+def refresh_day(cursor: DBCursor, entity_id: UUID, is_real: bool, day: str):
+    cursor.execute(
+        "DELETE FROM daily_position_aggregates WHERE entity_id = ? AND is_real = ? AND date = ?",
+        (str(entity_id), is_real, day),
+    )
+    _insert(
+        cursor,
+        "entity_id = ? AND is_real = ? AND DATE(date) = ?",
+        (str(entity_id), is_real, day),
+    )
+
+
+def refresh_for_position(cursor: DBCursor, global_position_id: UUID):
+    cursor.execute(
+        "SELECT entity_id, is_real, DATE(date) AS day FROM global_positions WHERE id = ?",
+        (str(global_position_id),),
+    )
+    row = cursor.fetchone()
+    if row:
+        refresh_day(cursor, row["entity_id"], bool(row["is_real"]), row["day"])
+
+
+def rebuild(cursor: DBCursor):
+    cursor.execute("DELETE FROM daily_position_aggregates")
+    _insert(cursor, "TRUE", ())
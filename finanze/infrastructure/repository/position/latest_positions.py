@@ -0,0 +1,75 @@
+from typing import Optional
+from uuid import UUID
+
+from infrastructure.repository.db.client import DBCursor
+
+
+def _placeholders(values: list) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def refresh_real(cursor: DBCursor, entity_ids: Optional[list[UUID]] = None):
+    params = []
+    entity_filter = ""
+    if entity_ids is not None:
+        if not entity_ids:
+            return
+        params = [str(entity_id) for entity_id in entity_ids]
+        entity_filter = f"AND entity_id IN ({_placeholders(params)})"
+
+    cursor.execute(
+        f"DELETE FROM latest_positions WHERE is_real = TRUE {entity_filter}",
+        tuple(params),
+    )
+    cursor.execute(
+        f"""
+        INSERT INTO latest_positions (entity_id, is_real, global_position_id)
+        SELECT entity_id, TRUE, id
+        FROM (SELECT id,
+                     entity_id,
+                     ROW_NUMBER() OVER (PARTITION BY entity_id ORDER BY date DESC, id DESC) AS rn
+              FROM global_positions
+              WHERE is_real = TRUE {entity_filter})
+        WHERE rn = 1
+        """,
+        tuple(params),
+    )
+
+
+def refresh_virtual(cursor: DBCursor):
+    cursor.execute("DELETE FROM latest_positions WHERE is_real = FALSE")
+    cursor.execute(
+        """
+        INSERT INTO latest_positions (entity_id, is_real, global_position_id)
+        SELECT entity_id, FALSE, id
+        FROM (SELECT gp.id,
+                     gp.entity_id,
+                     ROW_NUMBER() OVER (PARTITION BY gp.entity_id ORDER BY gp.date DESC, gp.id DESC) AS rn
+              FROM global_positions gp
+                       JOIN virtual_data_imports vdi ON vdi.global_position_id = gp.id
+              WHERE gp.is_real = FALSE
+                AND vdi.import_id = (SELECT import_id
+                                     FROM virtual_data_imports
+                                     ORDER BY date DESC
+                                     LIMIT 1))
+        WHERE rn = 1
+        """
+    )
+
+
+def set_real_if_newer(cursor: DBCursor, entity_id: UUID, global_position_id: UUID):
+    cursor.execute(
+        """
+        INSERT INTO latest_positions (entity_id, is_real, global_position_id)
+        VALUES (?, TRUE, ?)
+        ON CONFLICT (entity_id, is_real) DO UPDATE SET global_position_id = excluded.global_position_id
+        WHERE (SELECT date FROM global_positions WHERE id = excluded.global_position_id) >=
+              (SELECT date FROM global_positions WHERE id = latest_positions.global_position_id)
+        """,
+        (str(entity_id), str(global_position_id)),
+    )
+
+
+def rebuild(cursor: DBCursor):
+    refresh_real(cursor)
+    refresh_virtual(cursor)
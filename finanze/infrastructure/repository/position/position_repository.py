@@ -35,6 +35,8 @@ from domain.global_position import (
     Loans,
     LoanType,
     PositionQueryRequest,
+    PositionTotal,
+    ProductPosition,
     ProductPositions,
     ProductType,
     RealEstateCFDetail,
@@ -42,22 +44,25 @@ from domain.global_position import (
     StockDetail,
     StockInvestments,
 )
+from domain.position_history import PositionAggregate, PositionHistoryQuery
 from infrastructure.repository.common.json_serialization import DezimalJSONEncoder
 from infrastructure.repository.db.client import DBClient, DBCursor
+from infrastructure.repository.position import daily_aggregates, latest_positions
+from infrastructure.repository.position.product_values import PRODUCT_VALUES_SQL
+from infrastructure.repository.position.snapshot_content import (
+    ProductRows,
+    content_hash,
+    insert_statement,
+    release_content,
+)
 
 
-def _save_loans(cursor, position: GlobalPosition, loans: Loans):
-    for loan in loans.entries:
-        cursor.execute(
-            """
-            INSERT INTO loan_positions (id, global_position_id, type, currency, name, current_installment,
-                                        interest_rate, loan_amount, next_payment_date,
-                                        principal_outstanding, principal_paid)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+def _loan_rows(position_id: str, loans: Loans) -> ProductRows:
+    return {
+        "loan_positions": [
             (
                 str(loan.id),
-                str(position.id),
+                position_id,
                 loan.type,
                 loan.currency,
                 loan.name,
@@ -67,21 +72,18 @@ def _save_loans(cursor, position: GlobalPosition, loans: Loans):
                 loan.next_payment_date.isoformat(),
                 str(loan.principal_outstanding),
                 str(loan.principal_paid),
-            ),
-        )
+            )
+            for loan in loans.entries
+        ]
+    }
 
 
-def _save_cards(cursor, position: GlobalPosition, cards: Cards):
-    for card in cards.entries:
-        cursor.execute(
-            """
-            INSERT INTO card_positions (id, global_position_id, type, name, currency,
-                                        ending, card_limit, used, active, related_account)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+def _card_rows(position_id: str, cards: Cards) -> ProductRows:
+    return {
+        "card_positions": [
             (
                 str(card.id),
-                str(position.id),
+                position_id,
                 card.type.value,
                 card.name,
                 card.currency,
@@ -90,21 +92,18 @@ def _save_cards(cursor, position: GlobalPosition, cards: Cards):
                 str(card.used),
                 card.active,
                 str(card.related_account) if card.related_account else None,
-            ),
-        )
+            )
+            for card in cards.entries
+        ]
+    }
 
 
-def _save_accounts(cursor, position: GlobalPosition, accounts: Accounts):
-    for account in accounts.entries:
-        cursor.execute(
-            """
-            INSERT INTO account_positions (id, global_position_id, type, currency, name, iban, total,
-                                           interest, retained, pending_transfers)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+def _account_rows(position_id: str, accounts: Accounts) -> ProductRows:
+    return {
+        "account_positions": [
             (
                 str(account.id),
-                str(position.id),
+                position_id,
                 account.type,
                 account.currency,
                 account.name,
@@ -113,40 +112,35 @@ def _save_accounts(cursor, position: GlobalPosition, accounts: Accounts):
                 str(account.interest) if account.interest else None,
                 str(account.retained) if account.retained else None,
                 str(account.pending_transfers) if account.pending_transfers else None,
-            ),
-        )
+            )
+            for account in accounts.entries
+        ]
+    }
 
 
-def _save_crowdlending(cursor, position: GlobalPosition, crowdlending: Crowdlending):
-    cursor.execute(
-        """
-        INSERT INTO crowdlending_positions (id, global_position_id, total, weighted_interest_rate, currency, distribution)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (
-            str(crowdlending.id),
-            str(position.id),
-            str(crowdlending.total),
-            str(crowdlending.weighted_interest_rate),
-            crowdlending.currency,
-            json.dumps(crowdlending.distribution, cls=DezimalJSONEncoder)
-            if crowdlending.distribution
-            else "{}",
-        ),
-    )
-
-
-def _save_commodities(cursor, position: GlobalPosition, commodities: Commodities):
-    for commodity in commodities.entries:
-        cursor.execute(
-            """
-            INSERT INTO commodity_positions (id, global_position_id, name, type, amount, unit,
-                                           market_value, currency, initial_investment, average_buy_price)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+def _crowdlending_rows(position_id: str, crowdlending: Crowdlending) -> ProductRows:
+    return {
+        "crowdlending_positions": [
+            (
+                str(crowdlending.id),
+                position_id,
+                str(crowdlending.total),
+                str(crowdlending.weighted_interest_rate),
+                crowdlending.currency,
+                json.dumps(crowdlending.distribution, cls=DezimalJSONEncoder)
+                if crowdlending.distribution
+                else "{}",
+            )
+        ]
+    }
+
+
+def _commodity_rows(position_id: str, commodities: Commodities) -> ProductRows:
+    return {
+        "commodity_positions": [
             (
                 str(commodity.id),
-                str(position.id),
+                position_id,
                 commodity.name,
                 commodity.type.value,
                 str(commodity.amount),
@@ -159,18 +153,30 @@ def _save_commodities(cursor, position: GlobalPosition, commodities: Commodities
                 str(commodity.average_buy_price)
                 if commodity.average_buy_price
                 else None,
-            ),
-        )
+            )
+            for commodity in commodities.entries
+        ]
+    }
 
 
-def _save_crypto_currency_token_positions(cursor, wallet_detail: CryptoCurrencyWallet):
-    for token_detail in wallet_detail.tokens:
-        cursor.execute(
-            """
-            INSERT INTO crypto_currency_token_positions (id, wallet_id, token_id, name, symbol, token, amount,
-                                               market_value, currency, type)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+def _crypto_currency_rows(
+    position_id: str, cryptocurrencies: CryptoCurrencies
+) -> ProductRows:
+    return {
+        "crypto_currency_wallet_positions": [
+            (
+                str(wallet_detail.id),
+                position_id,
+                str(wallet_detail.wallet_connection_id),
+                wallet_detail.symbol,
+                str(wallet_detail.amount),
+                str(wallet_detail.market_value),
+                wallet_detail.currency,
+                wallet_detail.crypto.value,
+            )
+            for wallet_detail in cryptocurrencies.entries
+        ],
+        "crypto_currency_token_positions": [
             (
                 str(token_detail.id),
                 str(wallet_detail.id),
@@ -182,46 +188,19 @@ def _save_crypto_currency_token_positions(cursor, wallet_detail: CryptoCurrencyW
                 str(token_detail.market_value),
                 token_detail.currency,
                 token_detail.type,
-            ),
-        )
-
-
-def _save_crypto_currencies(
-    cursor, position: GlobalPosition, cryptocurrencies: CryptoCurrencies
-):
-    for wallet_detail in cryptocurrencies.entries:
-        cursor.execute(
-            """
-            INSERT INTO crypto_currency_wallet_positions (id, global_position_id, wallet_connection_id, symbol, amount,
-                                                          market_value, currency,
-                                                          crypto)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                str(wallet_detail.id),
-                str(position.id),
-                str(wallet_detail.wallet_connection_id),
-                wallet_detail.symbol,
-                str(wallet_detail.amount),
-                str(wallet_detail.market_value),
-                wallet_detail.currency,
-                wallet_detail.crypto.value,
-            ),
-        )
-        _save_crypto_currency_token_positions(cursor, wallet_detail)
+            )
+            for wallet_detail in cryptocurrencies.entries
+            for token_detail in wallet_detail.tokens or []
+        ],
+    }
 
 
-def _save_deposits(cursor, position: GlobalPosition, deposits: Deposits):
-    for detail in deposits.entries:
-        cursor.execute(
-            """
-            INSERT INTO deposit_positions (id, global_position_id, name, amount, currency,
-                                           expected_interests, interest_rate, creation, maturity)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+def _deposit_rows(position_id: str, deposits: Deposits) -> ProductRows:
+    return {
+        "deposit_positions": [
             (
                 str(detail.id),
-                str(position.id),
+                position_id,
                 detail.name,
                 str(detail.amount),
                 str(detail.currency),
@@ -229,24 +208,20 @@ def _save_deposits(cursor, position: GlobalPosition, deposits: Deposits):
                 str(detail.interest_rate),
                 detail.creation.isoformat(),
                 detail.maturity.isoformat(),
-            ),
-        )
+            )
+            for detail in deposits.entries
+        ]
+    }
 
 
-def _save_real_estate_cf(
-    cursor, position: GlobalPosition, real_estate: RealEstateCFInvestments
-):
-    for detail in real_estate.entries:
-        cursor.execute(
-            """
-            INSERT INTO real_estate_cf_positions (id, global_position_id, name, amount, pending_amount, currency,
-                                                 interest_rate, last_invest_date, maturity, type,
-                                                 business_type, state, extended_maturity)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+def _real_estate_cf_rows(
+    position_id: str, real_estate: RealEstateCFInvestments
+) -> ProductRows:
+    return {
+        "real_estate_cf_positions": [
             (
                 str(detail.id),
-                str(position.id),
+                position_id,
                 detail.name,
                 str(detail.amount),
                 str(detail.pending_amount),
@@ -258,22 +233,18 @@ def _save_real_estate_cf(
                 detail.business_type,
                 detail.state,
                 detail.extended_maturity,
-            ),
-        )
+            )
+            for detail in real_estate.entries
+        ]
+    }
 
 
-def _save_factoring(cursor, position: GlobalPosition, factoring: FactoringInvestments):
-    for detail in factoring.entries:
-        cursor.execute(
-            """
-            INSERT INTO factoring_positions (id, global_position_id, name, amount, currency,
-                                             interest_rate, gross_interest_rate, last_invest_date,
-                                             maturity, type, state)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+def _factoring_rows(position_id: str, factoring: FactoringInvestments) -> ProductRows:
+    return {
+        "factoring_positions": [
             (
                 str(detail.id),
-                str(position.id),
+                position_id,
                 detail.name,
                 str(detail.amount),
                 detail.currency,
@@ -285,42 +256,36 @@ def _save_factoring(cursor, position: GlobalPosition, factoring: FactoringInvest
                 detail.maturity.isoformat(),
                 detail.type,
                 detail.state,
-            ),
-        )
+            )
+            for detail in factoring.entries
+        ]
+    }
 
 
-def _save_fund_portfolios(cursor, position: GlobalPosition, portfolios: FundPortfolios):
-    for portfolio in portfolios.entries:
-        cursor.execute(
-            """
-            INSERT INTO fund_portfolios (id, global_position_id, name, currency, initial_investment, market_value)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
+def _fund_portfolio_rows(position_id: str, portfolios: FundPortfolios) -> ProductRows:
+    return {
+        "fund_portfolios": [
             (
                 str(portfolio.id),
-                str(position.id),
+                position_id,
                 portfolio.name,
                 portfolio.currency,
                 str(portfolio.initial_investment)
                 if portfolio.initial_investment
                 else None,
                 str(portfolio.market_value) if portfolio.market_value else None,
-            ),
-        )
+            )
+            for portfolio in portfolios.entries
+        ]
+    }
 
 
-def _save_funds(cursor, position: GlobalPosition, funds: FundInvestments):
-    for detail in funds.entries:
-        cursor.execute(
-            """
-            INSERT INTO fund_positions (id, global_position_id, name, isin, market,
-                                        shares, initial_investment, average_buy_price,
-                                        market_value, currency, portfolio_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+def _fund_rows(position_id: str, funds: FundInvestments) -> ProductRows:
+    return {
+        "fund_positions": [
             (
                 str(detail.id),
-                str(position.id),
+                position_id,
                 detail.name,
                 detail.isin,
                 detail.market,
@@ -330,22 +295,18 @@ def _save_funds(cursor, position: GlobalPosition, funds: FundInvestments):
                 str(detail.market_value),
                 detail.currency,
                 str(detail.portfolio.id) if detail.portfolio else None,
-            ),
-        )
+            )
+            for detail in funds.entries
+        ]
+    }
 
 
-def _save_stocks(cursor, position: GlobalPosition, stocks: StockInvestments):
-    for detail in stocks.entries:
-        cursor.execute(
-            """
-            INSERT INTO stock_positions (id, global_position_id, name, ticker, isin, market,
-                                         shares, initial_investment, average_buy_price,
-                                         market_value, currency, type, subtype)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+def _stock_rows(position_id: str, stocks: StockInvestments) -> ProductRows:
+    return {
+        "stock_positions": [
             (
                 str(detail.id),
-                str(position.id),
+                position_id,
                 detail.name,
                 detail.ticker,
                 detail.isin,
@@ -357,42 +318,62 @@ def _save_stocks(cursor, position: GlobalPosition, stocks: StockInvestments):
                 detail.currency,
                 detail.type,
                 detail.subtype,
-            ),
-        )
+            )
+            for detail in stocks.entries
+        ]
+    }
 
 
-def _save_position(
-    cursor, position: GlobalPosition, product_type: ProductType, save_fn: Callable
-):
-    product_position = position.products.get(product_type)
-    if product_position:
-        save_fn(cursor, position, product_position)
-
-
-def _save_product_positions(cursor, position: GlobalPosition):
-    _save_position(cursor, position, ProductType.ACCOUNT, _save_accounts)
-    _save_position(cursor, position, ProductType.CARD, _save_cards)
-    _save_position(cursor, position, ProductType.LOAN, _save_loans)
-    _save_position(cursor, position, ProductType.STOCK_ETF, _save_stocks)
-    _save_position(cursor, position, ProductType.FUND_PORTFOLIO, _save_fund_portfolios)
-    _save_position(cursor, position, ProductType.FUND, _save_funds)
-    _save_position(cursor, position, ProductType.FACTORING, _save_factoring)
-    _save_position(cursor, position, ProductType.REAL_ESTATE_CF, _save_real_estate_cf)
-    _save_position(cursor, position, ProductType.DEPOSIT, _save_deposits)
-    _save_position(cursor, position, ProductType.CROWDLENDING, _save_crowdlending)
-    _save_position(cursor, position, ProductType.CRYPTO, _save_crypto_currencies)
-    _save_position(cursor, position, ProductType.COMMODITY, _save_commodities)
-
-
-def _store_position(
-    positions: ProductPositions,
-    global_position_id: UUID,
+PRODUCT_ROW_BUILDERS = [
+    (ProductType.ACCOUNT, _account_rows),
+    (ProductType.CARD, _card_rows),
+    (ProductType.LOAN, _loan_rows),
+    (ProductType.STOCK_ETF, _stock_rows),
+    (ProductType.FUND_PORTFOLIO, _fund_portfolio_rows),
+    (ProductType.FUND, _fund_rows),
+    (ProductType.FACTORING, _factoring_rows),
+    (ProductType.REAL_ESTATE_CF, _real_estate_cf_rows),
+    (ProductType.DEPOSIT, _deposit_rows),
+    (ProductType.CROWDLENDING, _crowdlending_rows),
+    (ProductType.CRYPTO, _crypto_currency_rows),
+    (ProductType.COMMODITY, _commodity_rows),
+]
+
+
+def _build_product_rows(position: GlobalPosition) -> ProductRows:
+    position_id = str(position.id)
+    rows = {}
+    for product_type, build_fn in PRODUCT_ROW_BUILDERS:
+        product_position = position.products.get(product_type)
+        if product_position:
+            rows.update(build_fn(position_id, product_position))
+    return rows
+
+
+def _save_product_rows(cursor: DBCursor, rows: ProductRows):
+    for table, table_rows in rows.items():
+        if table_rows:
+            cursor.executemany(insert_statement(table), table_rows)
+
+
+def _placeholders(values: list) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _group_by_global_position(cursor: DBCursor, map_fn: Callable) -> dict[str, list]:
+    grouped = {}
+    for row in cursor.fetchall():
+        grouped.setdefault(row["global_position_id"], []).append(map_fn(row))
+    return grouped
+
+
+def _store_positions(
+    positions: dict[str, ProductPositions],
     product_type: ProductType,
-    get_fc: Callable,
+    product_by_global_position: dict[str, ProductPosition],
 ):
-    position = get_fc(global_position_id)
-    if position:
-        positions[product_type] = position
+    for global_position_id, product_position in product_by_global_position.items():
+        positions[global_position_id][product_type] = product_position
 
 
 class PositionSQLRepository(PositionPort):
@@ -400,18 +381,49 @@ class PositionSQLRepository(PositionPort):
         self._db_client = client
 
     def save(self, position: GlobalPosition):
+        rows = _build_product_rows(position)
+        rows_hash = content_hash(rows)
+
         with self._db_client.tx() as cursor:
             cursor.execute(
-                "INSERT INTO global_positions (id, date, entity_id, is_real) VALUES (?, ?, ?, ?)",
+                """
+                SELECT id
+                FROM global_positions
+                WHERE entity_id = ?
+                  AND is_real = ?
+                  AND content_hash = ?
+                  AND content_position_id IS NULL
+                LIMIT 1
+                """,
+                (str(position.entity.id), position.is_real, rows_hash),
+            )
+            existing = cursor.fetchone()
+            content_position_id = existing["id"] if existing else None
+
+            cursor.execute(
+                """
+                INSERT INTO global_positions (id, date, entity_id, is_real, content_hash, content_position_id)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
                 (
                     str(position.id),
                     position.date.isoformat(),
                     str(position.entity.id),
                     position.is_real,
+                    rows_hash,
+                    content_position_id,
                 ),
             )
 
-            _save_product_positions(cursor, position)
+            if not content_position_id:
+                _save_product_rows(cursor, rows)
+
+            if position.is_real:
+                latest_positions.set_real_if_newer(
+                    cursor, position.entity.id, position.id
+                )
+
+            daily_aggregates.refresh_for_position(cursor, position.id)
 
     def get_last_grouped_by_entity(
         self, query: Optional[PositionQueryRequest] = None
@@ -444,31 +456,26 @@ class PositionSQLRepository(PositionPort):
     ) -> Dict[Entity, GlobalPosition]:
         with self._db_client.read() as cursor:
             sql = """
-                  WITH latest_positions AS (SELECT entity_id, MAX(date) as latest_date
-                                            FROM global_positions
-                                            WHERE is_real = TRUE
-                                            GROUP BY entity_id)
                   SELECT gp.*,
                          e.name    AS entity_name,
                          e.id      AS entity_id,
                          e.type    as entity_type,
                          e.is_real AS entity_is_real
-                  FROM global_positions gp
-                           JOIN latest_positions lp
-                                ON gp.entity_id = lp.entity_id AND gp.date = lp.latest_date
-                           JOIN entities e ON gp.entity_id = e.id
-                  WHERE gp.is_real = TRUE
+                  FROM latest_positions lp
+                           JOIN global_positions gp ON gp.id = lp.global_position_id
+                           JOIN entities e ON lp.entity_id = e.id
+                  WHERE lp.is_real = TRUE
                   """
 
             params = []
             conditions = []
             if query and query.entities:
                 placeholders = ", ".join("?" for _ in query.entities)
-                conditions.append(f"gp.entity_id IN ({placeholders})")
+                conditions.append(f"lp.entity_id IN ({placeholders})")
                 params.extend([str(e) for e in query.entities])
             if query and query.excluded_entities:
                 placeholders = ", ".join("?" for _ in query.excluded_entities)
-                conditions.append(f"gp.entity_id NOT IN ({placeholders})")
+                conditions.append(f"lp.entity_id NOT IN ({placeholders})")
                 params.extend([str(e) for e in query.excluded_entities])
 
             if conditions:
@@ -479,8 +486,13 @@ class PositionSQLRepository(PositionPort):
             return self._map_position_rows(cursor)
 
     def _map_position_rows(self, cursor: DBCursor):
+        rows = cursor.fetchall()
+        products_by_position = self._get_product_positions(
+            cursor, [row["id"] for row in rows]
+        )
+
         positions = {}
-        for row in cursor.fetchall():
+        for row in rows:
             entity = Entity(
                 id=UUID(row["entity_id"]),
                 name=row["entity_name"],
@@ -492,7 +504,7 @@ class PositionSQLRepository(PositionPort):
                 id=UUID(row["id"]),
                 entity=entity,
                 date=datetime.fromisoformat(row["date"]),
-                products=self._get_product_positions(row["id"]),
+                products=products_by_position[row["id"]],
                 is_real=row["is_real"],
             )
             positions[entity] = position
@@ -503,41 +515,26 @@ class PositionSQLRepository(PositionPort):
     ) -> Dict[Entity, GlobalPosition]:
         with self._db_client.read() as cursor:
             sql = """
-                  WITH latest_import_details AS (SELECT import_id
-                                                 FROM virtual_data_imports
-                                                 ORDER BY date DESC
-                                                 LIMIT 1),
-                       last_imported_position_ids AS (SELECT vdi.global_position_id
-                                                      FROM virtual_data_imports vdi
-                                                               JOIN latest_import_details lid
-                                                                    ON vdi.import_id = lid.import_id),
-                       latest_positions AS (SELECT entity_id, MAX(date) as latest_date
-                                            FROM global_positions gp
-                                                     INNER JOIN last_imported_position_ids lp
-                                                                ON gp.id = lp.global_position_id
-                                            WHERE gp.is_real = FALSE
-                                            GROUP BY gp.entity_id)
                   SELECT gp.*,
                          e.name    AS entity_name,
                          e.id      AS entity_id,
                          e.type    AS entity_type,
                          e.is_real AS entity_is_real
-                  FROM global_positions gp
-                           JOIN latest_positions lp
-                                ON gp.entity_id = lp.entity_id AND gp.date = lp.latest_date
-                           JOIN entities e ON gp.entity_id = e.id
-                  WHERE gp.is_real = FALSE \
+                  FROM latest_positions lp
+                           JOIN global_positions gp ON gp.id = lp.global_position_id
+                           JOIN entities e ON lp.entity_id = e.id
+                  WHERE lp.is_real = FALSE
                   """
 
             params = []
             conditions = []
             if query and query.entities:
                 placeholders = ", ".join("?" for _ in query.entities)
-                conditions.append(f"gp.entity_id IN ({placeholders})")
+                conditions.append(f"lp.entity_id IN ({placeholders})")
                 params.extend([str(e) for e in query.entities])
             if query and query.excluded_entities:
                 placeholders = ", ".join("?" for _ in query.excluded_entities)
-                conditions.append(f"gp.entity_id NOT IN ({placeholders})")
+                conditions.append(f"lp.entity_id NOT IN ({placeholders})")
                 params.extend([str(e) for e in query.excluded_entities])
 
             if conditions:
@@ -547,307 +544,290 @@ class PositionSQLRepository(PositionPort):
 
             return self._map_position_rows(cursor)
 
-    def _get_accounts(self, global_position_id: UUID) -> Optional[Accounts]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                """
-                           SELECT *
-                           FROM account_positions
-                           WHERE global_position_id = ?
-                           """,
-                (str(global_position_id),),
-            )
-
-            accounts = [
-                Account(
-                    id=UUID(row["id"]),
-                    total=Dezimal(row["total"]),
-                    currency=row["currency"],
-                    type=AccountType[row["type"]],
-                    name=row["name"],
-                    iban=row["iban"],
-                    interest=Dezimal(row["interest"]) if row["interest"] else None,
-                    retained=Dezimal(row["retained"]) if row["retained"] else None,
-                    pending_transfers=Dezimal(row["pending_transfers"])
-                    if row["pending_transfers"]
-                    else None,
-                )
-                for row in cursor
-            ]
-
-            if not accounts:
-                return None
-
-            return Accounts(accounts)
-
-    def _get_cards(self, global_position_id: UUID) -> Optional[Cards]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                "SELECT * FROM card_positions WHERE global_position_id = ?",
-                (str(global_position_id),),
-            )
+    def _get_accounts(
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, Accounts]:
+        cursor.execute(
+            f"""
+                       SELECT *
+                       FROM account_positions
+                       WHERE global_position_id IN ({_placeholders(global_position_ids)})
+                       """,
+            tuple(global_position_ids),
+        )
 
-            cards = [
-                Card(
-                    id=UUID(row["id"]),
-                    name=row["name"],
-                    currency=row["currency"],
-                    ending=row["ending"],
-                    type=CardType[row["type"]],
-                    limit=Dezimal(row["card_limit"]) if row["card_limit"] else None,
-                    used=Dezimal(row["used"]),
-                    active=bool(row["active"]),
-                    related_account=row["related_account"],
-                )
-                for row in cursor
-            ]
+        accounts = _group_by_global_position(
+            cursor,
+            lambda row: Account(
+                id=UUID(row["id"]),
+                total=Dezimal(row["total"]),
+                currency=row["currency"],
+                type=AccountType[row["type"]],
+                name=row["name"],
+                iban=row["iban"],
+                interest=Dezimal(row["interest"]) if row["interest"] else None,
+                retained=Dezimal(row["retained"]) if row["retained"] else None,
+                pending_transfers=Dezimal(row["pending_transfers"])
+                if row["pending_transfers"]
+                else None,
+            ),
+        )
 
-            if not cards:
-                return None
+        return {gp_id: Accounts(entries) for gp_id, entries in accounts.items()}
 
-            return Cards(cards)
+    def _get_cards(
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, Cards]:
+        cursor.execute(
+            f"SELECT * FROM card_positions WHERE global_position_id IN ({_placeholders(global_position_ids)})",
+            tuple(global_position_ids),
+        )
 
-    def _get_loans(self, global_position_id: UUID) -> Optional[Loans]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                "SELECT * FROM loan_positions WHERE global_position_id = ?",
-                (str(global_position_id),),
-            )
+        cards = _group_by_global_position(
+            cursor,
+            lambda row: Card(
+                id=UUID(row["id"]),
+                name=row["name"],
+                currency=row["currency"],
+                ending=row["ending"],
+                type=CardType[row["type"]],
+                limit=Dezimal(row["card_limit"]) if row["card_limit"] else None,
+                used=Dezimal(row["used"]),
+                active=bool(row["active"]),
+                related_account=row["related_account"],
+            ),
+        )
 
-            loans = [
-                Loan(
-                    id=UUID(row["id"]),
-                    type=LoanType[row["type"]],
-                    currency=row["currency"],
-                    name=row["name"],
-                    current_installment=Dezimal(row["current_installment"]),
-                    interest_rate=Dezimal(row["interest_rate"]),
-                    loan_amount=Dezimal(row["loan_amount"]),
-                    next_payment_date=datetime.fromisoformat(
-                        row["next_payment_date"]
-                    ).date(),
-                    principal_outstanding=Dezimal(row["principal_outstanding"]),
-                    principal_paid=Dezimal(row["principal_paid"]),
-                )
-                for row in cursor
-            ]
+        return {gp_id: Cards(entries) for gp_id, entries in cards.items()}
 
-            if not loans:
-                return None
+    def _get_loans(
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, Loans]:
+        cursor.execute(
+            f"SELECT * FROM loan_positions WHERE global_position_id IN ({_placeholders(global_position_ids)})",
+            tuple(global_position_ids),
+        )
 
-            return Loans(loans)
+        loans = _group_by_global_position(
+            cursor,
+            lambda row: Loan(
+                id=UUID(row["id"]),
+                type=LoanType[row["type"]],
+                currency=row["currency"],
+                name=row["name"],
+                current_installment=Dezimal(row["current_installment"]),
+                interest_rate=Dezimal(row["interest_rate"]),
+                loan_amount=Dezimal(row["loan_amount"]),
+                next_payment_date=datetime.fromisoformat(
+                    row["next_payment_date"]
+                ).date(),
+                principal_outstanding=Dezimal(row["principal_outstanding"]),
+                principal_paid=Dezimal(row["principal_paid"]),
+            ),
+        )
 
-    def _get_stocks(self, global_position_id: UUID) -> Optional[StockInvestments]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                "SELECT * FROM stock_positions WHERE global_position_id = ?",
-                (str(global_position_id),),
-            )
+        return {gp_id: Loans(entries) for gp_id, entries in loans.items()}
 
-            details = [
-                StockDetail(
-                    id=UUID(row["id"]),
-                    name=row["name"],
-                    ticker=row["ticker"],
-                    isin=row["isin"],
-                    market=row["market"],
-                    shares=Dezimal(row["shares"]),
-                    initial_investment=Dezimal(row["initial_investment"]),
-                    average_buy_price=Dezimal(row["average_buy_price"]),
-                    market_value=Dezimal(row["market_value"]),
-                    currency=row["currency"],
-                    type=row["type"],
-                    subtype=row["subtype"],
-                )
-                for row in cursor
-            ]
+    def _get_stocks(
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, StockInvestments]:
+        cursor.execute(
+            f"SELECT * FROM stock_positions WHERE global_position_id IN ({_placeholders(global_position_ids)})",
+            tuple(global_position_ids),
+        )
 
-            if not details:
-                return None
+        details = _group_by_global_position(
+            cursor,
+            lambda row: StockDetail(
+                id=UUID(row["id"]),
+                name=row["name"],
+                ticker=row["ticker"],
+                isin=row["isin"],
+                market=row["market"],
+                shares=Dezimal(row["shares"]),
+                initial_investment=Dezimal(row["initial_investment"]),
+                average_buy_price=Dezimal(row["average_buy_price"]),
+                market_value=Dezimal(row["market_value"]),
+                currency=row["currency"],
+                type=row["type"],
+                subtype=row["subtype"],
+            ),
+        )
 
-            return StockInvestments(details)
+        return {gp_id: StockInvestments(entries) for gp_id, entries in details.items()}
 
     def _get_fund_portfolios(
-        self, global_position_id: UUID
-    ) -> Optional[FundPortfolios]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                "SELECT * FROM fund_portfolios WHERE global_position_id = ?",
-                (str(global_position_id),),
-            )
-
-            portfolios = []
-            for row in cursor:
-                portfolios.append(
-                    FundPortfolio(
-                        id=UUID(row["id"]),
-                        name=row["name"],
-                        currency=row["currency"],
-                        initial_investment=Dezimal(row["initial_investment"])
-                        if row["initial_investment"]
-                        else None,
-                        market_value=Dezimal(row["market_value"])
-                        if row["market_value"]
-                        else None,
-                    )
-                )
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, FundPortfolios]:
+        cursor.execute(
+            f"SELECT * FROM fund_portfolios WHERE global_position_id IN ({_placeholders(global_position_ids)})",
+            tuple(global_position_ids),
+        )
 
-            if not portfolios:
-                return None
+        portfolios = _group_by_global_position(
+            cursor,
+            lambda row: FundPortfolio(
+                id=UUID(row["id"]),
+                name=row["name"],
+                currency=row["currency"],
+                initial_investment=Dezimal(row["initial_investment"])
+                if row["initial_investment"]
+                else None,
+                market_value=Dezimal(row["market_value"])
+                if row["market_value"]
+                else None,
+            ),
+        )
 
-            return FundPortfolios(portfolios)
+        return {gp_id: FundPortfolios(entries) for gp_id, entries in portfolios.items()}
 
-    def _get_funds(self, global_position_id: UUID) -> Optional[FundInvestments]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                """
-                           SELECT f.*,
-                                  p.id                 AS portfolio_id,
-                                  p.name               AS portfolio_name,
-                                  p.currency           AS portfolio_currency,
-                                  p.initial_investment AS portfolio_investment,
-                                  p.market_value       AS portfolio_value
-                           FROM fund_positions f
-                                    LEFT JOIN fund_portfolios p ON p.id = f.portfolio_id
-                           WHERE f.global_position_id = ?
-                           """,
-                (str(global_position_id),),
-            )
+    def _get_funds(
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, FundInvestments]:
+        cursor.execute(
+            f"""
+                       SELECT f.*,
+                              p.id                 AS portfolio_id,
+                              p.name               AS portfolio_name,
+                              p.currency           AS portfolio_currency,
+                              p.initial_investment AS portfolio_investment,
+                              p.market_value       AS portfolio_value
+                       FROM fund_positions f
+                                LEFT JOIN fund_portfolios p ON p.id = f.portfolio_id
+                       WHERE f.global_position_id IN ({_placeholders(global_position_ids)})
+                       """,
+            tuple(global_position_ids),
+        )
 
-            details = [
-                FundDetail(
-                    id=UUID(row["id"]),
-                    name=row["name"],
-                    isin=row["isin"],
-                    market=row["market"],
-                    shares=Dezimal(row["shares"]),
-                    initial_investment=Dezimal(row["initial_investment"]),
-                    average_buy_price=Dezimal(row["average_buy_price"]),
-                    market_value=Dezimal(row["market_value"]),
-                    currency=row["currency"],
-                    portfolio=FundPortfolio(
-                        id=UUID(row["portfolio_id"]),
-                        name=row["portfolio_name"],
-                        currency=row["portfolio_currency"]
-                        if row["portfolio_currency"]
-                        else None,
-                        initial_investment=Dezimal(row["portfolio_investment"])
-                        if row["portfolio_investment"]
-                        else None,
-                        market_value=Dezimal(row["portfolio_value"])
-                        if row["portfolio_value"]
-                        else None,
-                    )
-                    if row["portfolio_id"]
+        details = _group_by_global_position(
+            cursor,
+            lambda row: FundDetail(
+                id=UUID(row["id"]),
+                name=row["name"],
+                isin=row["isin"],
+                market=row["market"],
+                shares=Dezimal(row["shares"]),
+                initial_investment=Dezimal(row["initial_investment"]),
+                average_buy_price=Dezimal(row["average_buy_price"]),
+                market_value=Dezimal(row["market_value"]),
+                currency=row["currency"],
+                portfolio=FundPortfolio(
+                    id=UUID(row["portfolio_id"]),
+                    name=row["portfolio_name"],
+                    currency=row["portfolio_currency"]
+                    if row["portfolio_currency"]
+                    else None,
+                    initial_investment=Dezimal(row["portfolio_investment"])
+                    if row["portfolio_investment"]
+                    else None,
+                    market_value=Dezimal(row["portfolio_value"])
+                    if row["portfolio_value"]
                     else None,
                 )
-                for row in cursor
-            ]
-
-            if not details:
-                return None
+                if row["portfolio_id"]
+                else None,
+            ),
+        )
 
-            return FundInvestments(details)
+        return {gp_id: FundInvestments(entries) for gp_id, entries in details.items()}
 
     def _get_factoring(
-        self, global_position_id: UUID
-    ) -> Optional[FactoringInvestments]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                "SELECT * FROM factoring_positions WHERE global_position_id = ?",
-                (str(global_position_id),),
-            )
-
-            details = [
-                FactoringDetail(
-                    id=UUID(row["id"]),
-                    name=row["name"],
-                    amount=Dezimal(row["amount"]),
-                    currency=row["currency"],
-                    interest_rate=Dezimal(row["interest_rate"]),
-                    gross_interest_rate=Dezimal(row["gross_interest_rate"]),
-                    last_invest_date=datetime.fromisoformat(row["last_invest_date"]),
-                    maturity=datetime.fromisoformat(row["maturity"]).date(),
-                    type=row["type"],
-                    state=row["state"],
-                )
-                for row in cursor
-            ]
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, FactoringInvestments]:
+        cursor.execute(
+            f"SELECT * FROM factoring_positions WHERE global_position_id IN ({_placeholders(global_position_ids)})",
+            tuple(global_position_ids),
+        )
 
-            if not details:
-                return None
+        details = _group_by_global_position(
+            cursor,
+            lambda row: FactoringDetail(
+                id=UUID(row["id"]),
+                name=row["name"],
+                amount=Dezimal(row["amount"]),
+                currency=row["currency"],
+                interest_rate=Dezimal(row["interest_rate"]),
+                gross_interest_rate=Dezimal(row["gross_interest_rate"]),
+                last_invest_date=datetime.fromisoformat(row["last_invest_date"]),
+                maturity=datetime.fromisoformat(row["maturity"]).date(),
+                type=row["type"],
+                state=row["state"],
+            ),
+        )
 
-            return FactoringInvestments(details)
+        return {
+            gp_id: FactoringInvestments(entries) for gp_id, entries in details.items()
+        }
 
     def _get_real_estate_cf(
-        self, global_position_id: UUID
-    ) -> Optional[RealEstateCFInvestments]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                "SELECT * FROM real_estate_cf_positions WHERE global_position_id = ?",
-                (str(global_position_id),),
-            )
-
-            details = [
-                RealEstateCFDetail(
-                    id=UUID(row["id"]),
-                    name=row["name"],
-                    amount=Dezimal(row["amount"]),
-                    pending_amount=Dezimal(row["pending_amount"]),
-                    currency=row["currency"],
-                    interest_rate=Dezimal(row["interest_rate"]),
-                    last_invest_date=datetime.fromisoformat(row["last_invest_date"]),
-                    maturity=row["maturity"],
-                    type=row["type"],
-                    business_type=row["business_type"],
-                    state=row["state"],
-                    extended_maturity=row["extended_maturity"],
-                )
-                for row in cursor
-            ]
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, RealEstateCFInvestments]:
+        cursor.execute(
+            f"SELECT * FROM real_estate_cf_positions WHERE global_position_id IN ({_placeholders(global_position_ids)})",
+            tuple(global_position_ids),
+        )
 
-            if not details:
-                return None
+        details = _group_by_global_position(
+            cursor,
+            lambda row: RealEstateCFDetail(
+                id=UUID(row["id"]),
+                name=row["name"],
+                amount=Dezimal(row["amount"]),
+                pending_amount=Dezimal(row["pending_amount"]),
+                currency=row["currency"],
+                interest_rate=Dezimal(row["interest_rate"]),
+                last_invest_date=datetime.fromisoformat(row["last_invest_date"]),
+                maturity=row["maturity"],
+                type=row["type"],
+                business_type=row["business_type"],
+                state=row["state"],
+                extended_maturity=row["extended_maturity"],
+            ),
+        )
 
-            return RealEstateCFInvestments(details)
+        return {
+            gp_id: RealEstateCFInvestments(entries)
+            for gp_id, entries in details.items()
+        }
 
-    def _get_deposits(self, global_position_id: UUID) -> Optional[Deposits]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                "SELECT * FROM deposit_positions WHERE global_position_id = ?",
-                (str(global_position_id),),
-            )
+    def _get_deposits(
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, Deposits]:
+        cursor.execute(
+            f"SELECT * FROM deposit_positions WHERE global_position_id IN ({_placeholders(global_position_ids)})",
+            tuple(global_position_ids),
+        )
 
-            details = [
-                Deposit(
-                    id=UUID(row["id"]),
-                    name=row["name"],
-                    amount=Dezimal(row["amount"]),
-                    currency=row["currency"],
-                    expected_interests=Dezimal(row["expected_interests"]),
-                    interest_rate=Dezimal(row["interest_rate"]),
-                    creation=datetime.fromisoformat(row["creation"]),
-                    maturity=datetime.fromisoformat(row["maturity"]).date(),
-                )
-                for row in cursor
-            ]
+        details = _group_by_global_position(
+            cursor,
+            lambda row: Deposit(
+                id=UUID(row["id"]),
+                name=row["name"],
+                amount=Dezimal(row["amount"]),
+                currency=row["currency"],
+                expected_interests=Dezimal(row["expected_interests"]),
+                interest_rate=Dezimal(row["interest_rate"]),
+                creation=datetime.fromisoformat(row["creation"]),
+                maturity=datetime.fromisoformat(row["maturity"]).date(),
+            ),
+        )
 
-            if not details:
-                return None
+        return {gp_id: Deposits(entries) for gp_id, entries in details.items()}
 
-            return Deposits(details)
+    def _get_crowdlending(
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, Crowdlending]:
+        cursor.execute(
+            f"SELECT * FROM crowdlending_positions WHERE global_position_id IN ({_placeholders(global_position_ids)})",
+            tuple(global_position_ids),
+        )
 
-    def _get_crowdlending(self, global_position_id: UUID) -> Optional[Crowdlending]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                "SELECT * FROM crowdlending_positions WHERE global_position_id = ?",
-                (str(global_position_id),),
-            )
-            row = cursor.fetchone()
-            if not row:
-                return None
+        crowdlending = {}
+        for row in cursor.fetchall():
+            if row["global_position_id"] in crowdlending:
+                continue
 
-            return Crowdlending(
+            crowdlending[row["global_position_id"]] = Crowdlending(
                 id=UUID(row["id"]),
                 total=Dezimal(row["total"]),
                 weighted_interest_rate=Dezimal(row["weighted_interest_rate"]),
@@ -858,26 +838,28 @@ class PositionSQLRepository(PositionPort):
                 entries=[],
             )
 
+        return crowdlending
+
     def _get_crypto_currency_token_positions(
-        self, wallet_id: UUID, wallet_connection_id: UUID
-    ) -> list[CryptoCurrencyToken]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                """
-                SELECT p.*,
-                       cii.currency AS investment_currency,
-                       cii.initial_investment,
-                       cii.average_buy_price
-                FROM crypto_currency_token_positions p
-                         LEFT JOIN crypto_initial_investments cii ON cii.wallet_connection_id = ? AND p.symbol = cii.symbol AND cii.type = 'TOKEN'
-                WHERE p.wallet_id = ?
-                """,
-                (
-                    str(wallet_connection_id),
-                    str(wallet_id),
-                ),
-            )
-            return [
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, list[CryptoCurrencyToken]]:
+        cursor.execute(
+            f"""
+            SELECT p.*,
+                   cii.currency AS investment_currency,
+                   cii.initial_investment,
+                   cii.average_buy_price
+            FROM crypto_currency_token_positions p
+                     JOIN crypto_currency_wallet_positions w ON p.wallet_id = w.id
+                     LEFT JOIN crypto_initial_investments cii ON cii.wallet_connection_id = w.wallet_connection_id AND p.symbol = cii.symbol AND cii.type = 'TOKEN'
+            WHERE w.global_position_id IN ({_placeholders(global_position_ids)})
+            """,
+            tuple(global_position_ids),
+        )
+
+        tokens_by_wallet = {}
+        for row in cursor.fetchall():
+            tokens_by_wallet.setdefault(row["wallet_id"], []).append(
                 CryptoCurrencyToken(
                     id=UUID(row["id"]),
                     token_id=row["token_id"],
@@ -898,134 +880,160 @@ class PositionSQLRepository(PositionPort):
                     currency=row["currency"],
                     type=row["type"],
                 )
-                for row in cursor
-            ]
+            )
+
+        return tokens_by_wallet
 
     def _get_cryptocurrency(
-        self, global_position_id: UUID
-    ) -> Optional[CryptoCurrencies]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                """
-                SELECT p.*,
-                       c.address,
-                       c.name,
-                       cii.currency AS investment_currency,
-                       cii.initial_investment,
-                       cii.average_buy_price
-                FROM crypto_currency_wallet_positions p
-                         JOIN crypto_wallet_connections c ON p.wallet_connection_id = c.id
-                         LEFT JOIN crypto_initial_investments cii ON cii.wallet_connection_id = c.id AND p.symbol = cii.symbol AND cii.type = 'CRYPTO'
-                WHERE global_position_id = ?
-                """,
-                (str(global_position_id),),
-            )
-            wallets = []
-            for row in cursor:
-                wallet_id = UUID(row["id"])
-                wallet_connection_id = UUID(row["wallet_connection_id"])
-                tokens = self._get_crypto_currency_token_positions(
-                    wallet_id, wallet_connection_id
-                )
-                wallets.append(
-                    CryptoCurrencyWallet(
-                        id=wallet_id,
-                        wallet_connection_id=wallet_connection_id,
-                        address=row["address"],
-                        name=row["name"],
-                        symbol=row["symbol"],
-                        amount=Dezimal(row["amount"]),
-                        initial_investment=Dezimal(row["initial_investment"])
-                        if row["initial_investment"]
-                        else None,
-                        average_buy_price=Dezimal(row["average_buy_price"])
-                        if row["average_buy_price"]
-                        else None,
-                        investment_currency=row["investment_currency"]
-                        if row["investment_currency"]
-                        else None,
-                        market_value=Dezimal(row["market_value"]),
-                        currency=row["currency"],
-                        crypto=CryptoCurrency(row["crypto"]),
-                        tokens=tokens,
-                    )
-                )
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, CryptoCurrencies]:
+        tokens_by_wallet = self._get_crypto_currency_token_positions(
+            cursor, global_position_ids
+        )
+
+        cursor.execute(
+            f"""
+            SELECT p.*,
+                   c.address,
+                   c.name,
+                   cii.currency AS investment_currency,
+                   cii.initial_investment,
+                   cii.average_buy_price
+            FROM crypto_currency_wallet_positions p
+                     JOIN crypto_wallet_connections c ON p.wallet_connection_id = c.id
+                     LEFT JOIN crypto_initial_investments cii ON cii.wallet_connection_id = c.id AND p.symbol = cii.symbol AND cii.type = 'CRYPTO'
+            WHERE global_position_id IN ({_placeholders(global_position_ids)})
+            """,
+            tuple(global_position_ids),
+        )
 
-            if not wallets:
-                return None
+        wallets = _group_by_global_position(
+            cursor,
+            lambda row: CryptoCurrencyWallet(
+                id=UUID(row["id"]),
+                wallet_connection_id=UUID(row["wallet_connection_id"]),
+                address=row["address"],
+                name=row["name"],
+                symbol=row["symbol"],
+                amount=Dezimal(row["amount"]),
+                initial_investment=Dezimal(row["initial_investment"])
+                if row["initial_investment"]
+                else None,
+                average_buy_price=Dezimal(row["average_buy_price"])
+                if row["average_buy_price"]
+                else None,
+                investment_currency=row["investment_currency"]
+                if row["investment_currency"]
+                else None,
+                market_value=Dezimal(row["market_value"]),
+                currency=row["currency"],
+                crypto=CryptoCurrency(row["crypto"]),
+                tokens=tokens_by_wallet.get(row["id"], []),
+            ),
+        )
 
-            return CryptoCurrencies(wallets)
+        return {gp_id: CryptoCurrencies(entries) for gp_id, entries in wallets.items()}
 
-    def _get_commodities(self, global_position_id: UUID) -> Optional[Commodities]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                "SELECT * FROM commodity_positions WHERE global_position_id = ?",
-                (str(global_position_id),),
-            )
+    def _get_commodities(
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, Commodities]:
+        cursor.execute(
+            f"SELECT * FROM commodity_positions WHERE global_position_id IN ({_placeholders(global_position_ids)})",
+            tuple(global_position_ids),
+        )
 
-            commodities = [
-                Commodity(
-                    id=UUID(row["id"]),
-                    name=row["name"],
-                    type=CommodityType(row["type"]),
-                    amount=Dezimal(row["amount"]),
-                    unit=WeightUnit(row["unit"]),
-                    market_value=Dezimal(row["market_value"]),
-                    currency=row["currency"],
-                    initial_investment=Dezimal(row["initial_investment"])
-                    if row["initial_investment"]
-                    else None,
-                    average_buy_price=Dezimal(row["average_buy_price"])
-                    if row["average_buy_price"]
-                    else None,
-                )
-                for row in cursor
-            ]
+        commodities = _group_by_global_position(
+            cursor,
+            lambda row: Commodity(
+                id=UUID(row["id"]),
+                name=row["name"],
+                type=CommodityType(row["type"]),
+                amount=Dezimal(row["amount"]),
+                unit=WeightUnit(row["unit"]),
+                market_value=Dezimal(row["market_value"]),
+                currency=row["currency"],
+                initial_investment=Dezimal(row["initial_investment"])
+                if row["initial_investment"]
+                else None,
+                average_buy_price=Dezimal(row["average_buy_price"])
+                if row["average_buy_price"]
+                else None,
+            ),
+        )
 
-            if not commodities:
-                return None
+        return {gp_id: Commodities(entries) for gp_id, entries in commodities.items()}
 
-            return Commodities(commodities)
+    def _get_product_positions(
+        self, cursor: DBCursor, global_position_ids: list[str]
+    ) -> dict[str, ProductPositions]:
+        if not global_position_ids:
+            return {}
 
-    def _get_product_positions(self, g_position_id: UUID) -> ProductPositions:
-        positions = {}
-        _store_position(
-            positions, g_position_id, ProductType.ACCOUNT, self._get_accounts
+        cursor.execute(
+            f"""
+            SELECT id, COALESCE(content_position_id, id) AS content_id
+            FROM global_positions
+            WHERE id IN ({_placeholders(global_position_ids)})
+            """,
+            tuple(global_position_ids),
         )
-        _store_position(positions, g_position_id, ProductType.CARD, self._get_cards)
-        _store_position(positions, g_position_id, ProductType.LOAN, self._get_loans)
-        _store_position(
-            positions, g_position_id, ProductType.STOCK_ETF, self._get_stocks
+        content_ids = {row["id"]: row["content_id"] for row in cursor.fetchall()}
+
+        positions = {content_id: {} for content_id in content_ids.values()}
+        g_position_ids = list(positions.keys())
+        _store_positions(
+            positions, ProductType.ACCOUNT, self._get_accounts(cursor, g_position_ids)
         )
-        _store_position(positions, g_position_id, ProductType.FUND, self._get_funds)
-        _store_position(
+        _store_positions(
+            positions, ProductType.CARD, self._get_cards(cursor, g_position_ids)
+        )
+        _store_positions(
+            positions, ProductType.LOAN, self._get_loans(cursor, g_position_ids)
+        )
+        _store_positions(
+            positions, ProductType.STOCK_ETF, self._get_stocks(cursor, g_position_ids)
+        )
+        _store_positions(
+            positions, ProductType.FUND, self._get_funds(cursor, g_position_ids)
+        )
+        _store_positions(
             positions,
-            g_position_id,
             ProductType.FUND_PORTFOLIO,
-            self._get_fund_portfolios,
+            self._get_fund_portfolios(cursor, g_position_ids),
         )
-        _store_position(
-            positions, g_position_id, ProductType.FACTORING, self._get_factoring
+        _store_positions(
+            positions,
+            ProductType.FACTORING,
+            self._get_factoring(cursor, g_position_ids),
         )
-        _store_position(
+        _store_positions(
             positions,
-            g_position_id,
             ProductType.REAL_ESTATE_CF,
-            self._get_real_estate_cf,
+            self._get_real_estate_cf(cursor, g_position_ids),
         )
-        _store_position(
-            positions, g_position_id, ProductType.DEPOSIT, self._get_deposits
+        _store_positions(
+            positions, ProductType.DEPOSIT, self._get_deposits(cursor, g_position_ids)
         )
-        _store_position(
-            positions, g_position_id, ProductType.CROWDLENDING, self._get_crowdlending
+        _store_positions(
+            positions,
+            ProductType.CROWDLENDING,
+            self._get_crowdlending(cursor, g_position_ids),
         )
-        _store_position(
-            positions, g_position_id, ProductType.CRYPTO, self._get_cryptocurrency
+        _store_positions(
+            positions,
+            ProductType.CRYPTO,
+            self._get_cryptocurrency(cursor, g_position_ids),
         )
-        _store_position(
-            positions, g_position_id, ProductType.COMMODITY, self._get_commodities
+        _store_positions(
+            positions,
+            ProductType.COMMODITY,
+            self._get_commodities(cursor, g_position_ids),
         )
-        return positions
+        return {
+            gp_id: dict(positions[content_ids[gp_id]])
+            for gp_id in global_position_ids
+            if gp_id in content_ids
+        }
 
     def _get_entity_id_from_global(self, global_position_id: UUID) -> int:
         with self._db_client.read() as cursor:
@@ -1041,7 +1049,7 @@ class PositionSQLRepository(PositionPort):
         with self._db_client.tx() as cursor:
             cursor.execute(
                 """
-                DELETE
+                SELECT id
                 FROM global_positions
                 WHERE entity_id = ?
                   AND DATE(date) = ?
@@ -1049,3 +1057,194 @@ class PositionSQLRepository(PositionPort):
                 """,
                 (str(entity_id), date.isoformat(), is_real),
             )
+            global_position_ids = [row["id"] for row in cursor.fetchall()]
+            if not global_position_ids:
+                return
+
+            release_content(cursor, global_position_ids)
+            cursor.execute(
+                f"DELETE FROM global_positions WHERE id IN ({_placeholders(global_position_ids)})",
+                tuple(global_position_ids),
+            )
+
+            if is_real:
+                latest_positions.refresh_real(cursor, [entity_id])
+            else:
+                latest_positions.refresh_virtual(cursor)
+
+            daily_aggregates.refresh_day(cursor, entity_id, is_real, date.isoformat())
+
+    def get_compactable(
+        self,
+        keep_all_from: datetime,
+        keep_daily_from: datetime,
+        limit: int,
+    ) -> list[UUID]:
+        with self._db_client.read() as cursor:
+            cursor.execute(
+                """
+                WITH latest_import_positions AS (SELECT vdi.global_position_id
+                                                 FROM virtual_data_imports vdi
+                                                 WHERE vdi.import_id = (SELECT import_id
+                                                                        FROM virtual_data_imports
+                                                                        ORDER BY date DESC
+                                                                        LIMIT 1)),
+                     ranked AS (SELECT id,
+                                       date,
+                                       ROW_NUMBER() OVER (PARTITION BY entity_id, is_real ORDER BY date DESC) AS entity_rank,
+                                       ROW_NUMBER() OVER (
+                                           PARTITION BY entity_id, is_real,
+                                               CASE
+                                                   WHEN date >= ? THEN DATE(date)
+                                                   ELSE STRFTIME('%Y-%W', date)
+                                                   END
+                                           ORDER BY date DESC) AS bucket_rank
+                                FROM global_positions)
+                SELECT r.id
+                FROM ranked r
+                WHERE r.date < ?
+                  AND r.entity_rank > 1
+                  AND r.bucket_rank > 1
+                  AND r.id NOT IN (SELECT global_position_id FROM latest_import_positions)
+                ORDER BY r.date
+                LIMIT ?
+                """,
+                (keep_daily_from.isoformat(), keep_all_from.isoformat(), limit),
+            )
+            return [UUID(row["id"]) for row in cursor.fetchall()]
+
+    def delete_positions(self, global_position_ids: list[UUID]):
+        if not global_position_ids:
+            return
+
+        ids = [str(gp_id) for gp_id in global_position_ids]
+        with self._db_client.tx() as cursor:
+            cursor.execute(
+                f"""
+                SELECT lp.entity_id, lp.is_real
+                FROM latest_positions lp
+                WHERE lp.global_position_id IN ({_placeholders(ids)})
+                """,
+                tuple(ids),
+            )
+            affected = cursor.fetchall()
+
+            release_content(cursor, ids)
+            cursor.execute(
+                f"DELETE FROM global_positions WHERE id IN ({_placeholders(ids)})",
+                tuple(ids),
+            )
+
+            real_entities = [
+                UUID(row["entity_id"]) for row in affected if row["is_real"]
+            ]
+            latest_positions.refresh_real(cursor, real_entities)
+            if any(not row["is_real"] for row in affected):
+                latest_positions.refresh_virtual(cursor)
+
+    def get_latest_totals(
+        self, query: Optional[PositionQueryRequest] = None
+    ) -> list[PositionTotal]:
+        params = []
+        conditions = []
+        if query and query.entities:
+            conditions.append(f"lp.entity_id IN ({_placeholders(query.entities)})")
+            params.extend([str(e) for e in query.entities])
+        if query and query.excluded_entities:
+            conditions.append(
+                f"lp.entity_id NOT IN ({_placeholders(query.excluded_entities)})"
+            )
+            params.extend([str(e) for e in query.excluded_entities])
+        if query and query.real is not None:
+            conditions.append("lp.is_real = ?")
+            params.append(query.real)
+
+        where = " AND ".join(conditions) if conditions else "TRUE"
+        with self._db_client.read() as cursor:
+            cursor.execute(
+                f"""
+                SELECT lp.entity_id,
+                       lp.is_real,
+                       v.product_type,
+                       v.currency,
+                       DEC_SUM(v.amount) AS total
+                FROM latest_positions lp
+                         JOIN global_positions gp ON gp.id = lp.global_position_id
+                         JOIN ({PRODUCT_VALUES_SQL}) v
+                              ON v.global_position_id = COALESCE(gp.content_position_id, gp.id)
+                WHERE {where}
+                  AND v.amount IS NOT NULL
+                GROUP BY lp.entity_id, lp.is_real, v.product_type, v.currency
+                """,
+                tuple(params),
+            )
+
+            return [
+                PositionTotal(
+                    entity_id=UUID(row["entity_id"]),
+                    is_real=bool(row["is_real"]),
+                    product_type=ProductType(row["product_type"]),
+                    currency=row["currency"],
+                    total=Dezimal(row["total"]),
+                )
+                for row in cursor.fetchall()
+            ]
+
+    def get_daily_aggregates(
+        self, query: PositionHistoryQuery
+    ) -> list[PositionAggregate]:
+        params = []
+        conditions = []
+        if query.entities:
+            conditions.append(f"entity_id IN ({_placeholders(query.entities)})")
+            params.extend([str(e) for e in query.entities])
+        if query.excluded_entities:
+            conditions.append(
+                f"entity_id NOT IN ({_placeholders(query.excluded_entities)})"
+            )
+            params.extend([str(e) for e in query.excluded_entities])
+        if query.to_date:
+            conditions.append("date <= ?")
+            params.append(query.to_date.isoformat())
+
+        # Days before the range are only needed to know the values carried into it
+        range_filter = ""
+        range_params = []
+        if query.from_date:
+            range_filter = """
+                AND (dpa.date >= ?
+                    OR dpa.date = (SELECT MAX(prev.date)
+                                   FROM daily_position_aggregates prev
+                                   WHERE prev.entity_id = dpa.entity_id
+                                     AND prev.is_real = dpa.is_real
+                                     AND prev.date < ?))
+                """
+            range_params = [query.from_date.isoformat()] * 2
+
+        where = " AND ".join(conditions) if conditions else "TRUE"
+        with self._db_client.read() as cursor:
+            cursor.execute(
+                f"""
+                SELECT dpa.*
+                FROM (SELECT * FROM daily_position_aggregates WHERE {where}) dpa
+                WHERE TRUE {range_filter}
+                ORDER BY dpa.date
+                """,
+                tuple(params + range_params),
+            )
+
+            return [
+                PositionAggregate(
+                    date=datetime.fromisoformat(row["date"]).date(),
+                    entity_id=UUID(row["entity_id"]),
+                    is_real=bool(row["is_real"]),
+                    product_type=ProductType(row["product_type"]),
+                    currency=row["currency"],
+                    amount=Dezimal(row["amount"]),
+                )
+                for row in cursor.fetchall()
+            ]
+
+    def rebuild_latest(self):
+        with self._db_client.tx() as cursor:
+            latest_positions.rebuild(cursor)
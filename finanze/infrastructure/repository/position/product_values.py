@@ -0,0 +1,31 @@
+from domain.global_position import ProductType
+
+# Value column of each product table, as accounted for in the total assets
+PRODUCT_VALUES = [
+    (ProductType.ACCOUNT, "account_positions", "total"),
+    (ProductType.STOCK_ETF, "stock_positions", "market_value"),
+    (ProductType.FUND, "fund_positions", "market_value"),
+    (ProductType.DEPOSIT, "deposit_positions", "amount"),
+    (ProductType.REAL_ESTATE_CF, "real_estate_cf_positions", "pending_amount"),
+    (ProductType.FACTORING, "factoring_positions", "amount"),
+    (ProductType.CROWDLENDING, "crowdlending_positions", "total"),
+    (ProductType.CRYPTO, "crypto_currency_wallet_positions", "market_value"),
+    (ProductType.COMMODITY, "commodity_positions", "market_value"),
+    (ProductType.LOAN, "loan_positions", "principal_outstanding"),
+]
+
+# Rows of (global_position_id, product_type, currency, amount), to be joined on
+# the content position id of each global position
+PRODUCT_VALUES_SQL = " UNION ALL ".join(
+    [
+        f"SELECT global_position_id, '{product_type.value}' AS product_type, currency, {column} AS amount FROM {table}"
+        for product_type, table, column in PRODUCT_VALUES
+    ]
+    + [
+        f"""
+        SELECT w.global_position_id, '{ProductType.CRYPTO.value}' AS product_type, t.currency, t.market_value AS amount
+        FROM crypto_currency_token_positions t
+                 JOIN crypto_currency_wallet_positions w ON t.wallet_id = w.id
+        """
+    ]
+)
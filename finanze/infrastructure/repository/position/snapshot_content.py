@@ -0,0 +1,269 @@
+import json
+from datetime import date
+from enum import Enum
+from hashlib import sha256
+from uuid import UUID
+
+from infrastructure.repository.db.client import DBCursor
+
+PRODUCT_COLUMNS = {
+    "account_positions": (
+        "type",
+        "currency",
+        "name",
+        "iban",
+        "total",
+        "interest",
+        "retained",
+        "pending_transfers",
+    ),
+    "card_positions": (
+        "type",
+        "name",
+        "currency",
+        "ending",
+        "card_limit",
+        "used",
+        "active",
+        "related_account",
+    ),
+    "loan_positions": (
+        "type",
+        "currency",
+        "name",
+        "current_installment",
+        "interest_rate",
+        "loan_amount",
+        "next_payment_date",
+        "principal_outstanding",
+        "principal_paid",
+    ),
+    "stock_positions": (
+        "name",
+        "ticker",
+        "isin",
+        "market",
+        "shares",
+        "initial_investment",
+        "average_buy_price",
+        "market_value",
+        "currency",
+        "type",
+        "subtype",
+    ),
+    "fund_portfolios": (
+        "name",
+        "currency",
+        "initial_investment",
+        "market_value",
+    ),
+    "fund_positions": (
+        "name",
+        "isin",
+        "market",
+        "shares",
+        "initial_investment",
+        "average_buy_price",
+        "market_value",
+        "currency",
+        "portfolio_id",
+    ),
+    "factoring_positions": (
+        "name",
+        "amount",
+        "currency",
+        "interest_rate",
+        "gross_interest_rate",
+        "last_invest_date",
+        "maturity",
+        "type",
+        "state",
+    ),
+    "real_estate_cf_positions": (
+        "name",
+        "amount",
+        "pending_amount",
+        "currency",
+        "interest_rate",
+        "last_invest_date",
+        "maturity",
+        "type",
+        "business_type",
+        "state",
+        "extended_maturity",
+    ),
+    "deposit_positions": (
+        "name",
+        "amount",
+        "currency",
+        "expected_interests",
+        "interest_rate",
+        "creation",
+        "maturity",
+    ),
+    "crowdlending_positions": (
+        "total",
+        "weighted_interest_rate",
+        "currency",
+        "distribution",
+    ),
+    "crypto_currency_wallet_positions": (
+        "wallet_connection_id",
+        "symbol",
+        "amount",
+        "market_value",
+        "currency",
+        "crypto",
+    ),
+    "crypto_currency_token_positions": (
+        "token_id",
+        "name",
+        "symbol",
+        "token",
+        "amount",
+        "market_value",
+        "currency",
+        "type",
+    ),
+    "commodity_positions": (
+        "name",
+        "type",
+        "amount",
+        "unit",
+        "market_value",
+        "currency",
+        "initial_investment",
+        "average_buy_price",
+    ),
+}
+
+TOKEN_TABLE = "crypto_currency_token_positions"
+WALLET_TABLE = "crypto_currency_wallet_positions"
+
+# Columns holding ids of rows from the same snapshot, hashed by the referenced
+# row content as ids are regenerated on every fetch
+REFERENCE_COLUMNS = {
+    "card_positions": ("related_account", "account_positions"),
+    "fund_positions": ("portfolio_id", "fund_portfolios"),
+}
+
+PRODUCT_TABLES = [table for table in PRODUCT_COLUMNS if table != TOKEN_TABLE]
+
+ProductRows = dict[str, list[tuple]]
+
+
+def insert_statement(table: str) -> str:
+    parent_column = "wallet_id" if table == TOKEN_TABLE else "global_position_id"
+    columns = ("id", parent_column) + PRODUCT_COLUMNS[table]
+    placeholders = ", ".join("?" for _ in columns)
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+def _normalize(value):
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def content_hash(rows: ProductRows) -> str:
+    content_by_id = {}
+    for table, table_rows in rows.items():
+        for row in table_rows:
+            content_by_id[str(row[0])] = [_normalize(v) for v in row[2:]]
+
+    tokens_by_wallet = {}
+    for row in rows.get(TOKEN_TABLE, []):
+        tokens_by_wallet.setdefault(str(row[1]), []).append(content_by_id[str(row[0])])
+
+    content = {}
+    for table in PRODUCT_TABLES:
+        reference = REFERENCE_COLUMNS.get(table)
+        entries = []
+        for row in rows.get(table, []):
+            entry = list(content_by_id[str(row[0])])
+            if reference:
+                index = PRODUCT_COLUMNS[table].index(reference[0])
+                entry[index] = content_by_id.get(entry[index])
+            if table == WALLET_TABLE:
+                tokens = tokens_by_wallet.get(str(row[0]), [])
+                entry.append(sorted(tokens, key=lambda t: json.dumps(t, default=str)))
+            entries.append(json.dumps(entry, default=str))
+
+        if entries:
+            content[table] = sorted(entries)
+
+    return sha256(json.dumps(content, sort_keys=True).encode("UTF-8")).hexdigest()
+
+
+def load_product_rows(
+    cursor: DBCursor, global_position_ids: list[str]
+) -> dict[str, ProductRows]:
+    rows_by_position = {gp_id: {} for gp_id in global_position_ids}
+    if not global_position_ids:
+        return rows_by_position
+
+    placeholders = ", ".join("?" for _ in global_position_ids)
+    for table in PRODUCT_TABLES:
+        columns = ", ".join(PRODUCT_COLUMNS[table])
+        cursor.execute(
+            f"SELECT id, global_position_id, {columns} FROM {table} WHERE global_position_id IN ({placeholders})",
+            tuple(global_position_ids),
+        )
+        for row in cursor.fetchall():
+            rows_by_position[row[1]].setdefault(table, []).append(tuple(row))
+
+    columns = ", ".join(f"t.{c}" for c in PRODUCT_COLUMNS[TOKEN_TABLE])
+    cursor.execute(
+        f"""
+        SELECT w.global_position_id, t.id, t.wallet_id, {columns}
+        FROM crypto_currency_token_positions t
+                 JOIN crypto_currency_wallet_positions w ON t.wallet_id = w.id
+        WHERE w.global_position_id IN ({placeholders})
+        """,
+        tuple(global_position_ids),
+    )
+    for row in cursor.fetchall():
+        rows_by_position[row[0]].setdefault(TOKEN_TABLE, []).append(tuple(row)[1:])
+
+    return rows_by_position
+
+
+def release_content(cursor: DBCursor, global_position_ids: list[str]):
+    # Hand the product rows owned by the given positions over to a surviving
+    # position sharing them, so deleting them doesn't lose any other snapshot
+    if not global_position_ids:
+        return
+
+    placeholders = ", ".join("?" for _ in global_position_ids)
+    cursor.execute(
+        f"""
+        SELECT gp.content_position_id AS owner_id, MIN(gp.id) AS heir_id
+        FROM global_positions gp
+        WHERE gp.content_position_id IN ({placeholders})
+          AND gp.id NOT IN ({placeholders})
+        GROUP BY gp.content_position_id
+        """,
+        tuple(global_position_ids) * 2,
+    )
+    handovers = [(row["owner_id"], row["heir_id"]) for row in cursor.fetchall()]
+
+    for owner_id, heir_id in handovers:
+        for table in PRODUCT_TABLES:
+            cursor.execute(
+                f"UPDATE {table} SET global_position_id = ? WHERE global_position_id = ?",
+                (heir_id, owner_id),
+            )
+        cursor.execute(
+            "UPDATE global_positions SET content_position_id = NULL WHERE id = ?",
+            (heir_id,),
+        )
+        cursor.execute(
+            "UPDATE global_positions SET content_position_id = ? WHERE content_position_id = ?",
+            (heir_id, owner_id),
+        )
@@ -0,0 +1,74 @@
+import json
+from datetime import datetime
+from uuid import UUID
+
+from application.ports.movement_cache_port import MovementCachePort
+from dateutil.tz import tzlocal
+from infrastructure.repository.db.client import DBClient
+
+
+class MovementCacheRepository(MovementCachePort):
+    def __init__(self, client: DBClient):
+        self._db_client = client
+
+    def get(self, entity_id: UUID) -> list[dict]:
+        with self._db_client.read() as cursor:
+            cursor.execute(
+                "SELECT payload FROM entity_movements WHERE entity_id = ? ORDER BY seq",
+                (str(entity_id),),
+            )
+            return [json.loads(row["payload"]) for row in cursor.fetchall()]
+
+    def append(
+        self,
+        entity_id: UUID,
+        scope: str,
+        movements: list[tuple[str, dict]],
+        clear: bool = False,
+    ):
+        # Cached movements and the sync cursor pointing to the newest of them
+        # are written together, so an interrupted sync can neither lose nor
+        # duplicate movements
+        with self._db_client.tx() as cursor:
+            if clear:
+                cursor.execute(
+                    "DELETE FROM entity_movements WHERE entity_id = ?",
+                    (str(entity_id),),
+                )
+
+            if not movements:
+                if clear:
+                    cursor.execute(
+                        "DELETE FROM sync_cursors WHERE entity_id = ? AND scope = ?",
+                        (str(entity_id), scope),
+                    )
+                return
+
+            cursor.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM entity_movements WHERE entity_id = ?",
+                (str(entity_id),),
+            )
+            last_seq = cursor.fetchone()[0]
+
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO entity_movements (entity_id, ref, seq, payload)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (str(entity_id), ref, last_seq + i, json.dumps(movement))
+                    for i, (ref, movement) in enumerate(movements, start=1)
+                ],
+            )
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO sync_cursors (entity_id, scope, cursor, updated_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    str(entity_id),
+                    scope,
+                    movements[-1][0],
+                    datetime.now(tzlocal()).isoformat(),
+                ),
+            )
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from application.ports.sync_cursor_port import SyncCursorPort
+from dateutil.tz import tzlocal
+from infrastructure.repository.db.client import DBClient
+
+
+class SyncCursorRepository(SyncCursorPort):
+    def __init__(self, client: DBClient):
+        self._db_client = client
+
+    def get(self, entity_id: UUID, scope: str) -> Optional[str]:
+        with self._db_client.read() as cursor:
+            cursor.execute(
+                "SELECT cursor FROM sync_cursors WHERE entity_id = ? AND scope = ?",
+                (str(entity_id), scope),
+            )
+            row = cursor.fetchone()
+            return row["cursor"] if row else None
+
+    def save(self, entity_id: UUID, scope: str, cursor: str):
+        with self._db_client.tx() as db_cursor:
+            db_cursor.execute(
+                """
+                INSERT OR REPLACE INTO sync_cursors (entity_id, scope, cursor, updated_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (str(entity_id), scope, cursor, datetime.now(tzlocal()).isoformat()),
+            )
+
+    def delete(self, entity_id: UUID, scope: str):
+        with self._db_client.tx() as cursor:
+            cursor.execute(
+                "DELETE FROM sync_cursors WHERE entity_id = ? AND scope = ?",
+                (str(entity_id), scope),
+            )
@@ -0,0 +1,29 @@
+import math
+from hashlib import blake2b
+from typing import Iterator
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self._size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, value: str) -> Iterator[int]:
+        # Double hashing, two 64 bit halves of one digest give all the positions
+        digest = blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._hashes):
+            yield (first + i * second) % self._size
+
+    def add(self, value: str):
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
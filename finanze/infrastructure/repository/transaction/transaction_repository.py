@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional, Set
+from typing import Container, List, Optional, Set
 from uuid import UUID
 
 from application.ports.transaction_port import TransactionPort
@@ -20,7 +20,8 @@ from domain.transactions import (
     Transactions,
     TxType,
 )
-from infrastructure.repository.db.client import DBClient
+from infrastructure.repository.db.client import DBClient, DBCursor
+from infrastructure.repository.transaction.bloom_filter import BloomFilter
 
 
 def _map_account_row(row) -> AccountTx:
@@ -128,6 +129,73 @@ def _map_investment_row(row) -> BaseInvestmentTx:
         raise ValueError(f"Unknown product type: {row['product_type']}")
 
 
+def _investment_row(tx: BaseInvestmentTx, created_at: str) -> tuple:
+    isin = ticker = market = shares = price = net_amount = None
+    fees = retentions = order_date = linked_tx = interests = None
+
+    if isinstance(tx, (StockTx, FundTx)):
+        isin = tx.isin
+        market = tx.market
+        shares = str(tx.shares)
+        price = str(tx.price)
+        net_amount = str(tx.net_amount)
+        fees = str(tx.fees)
+        retentions = str(tx.retentions) if tx.retentions else None
+        order_date = tx.order_date.isoformat() if tx.order_date else None
+        if isinstance(tx, StockTx):
+            ticker = tx.ticker
+            linked_tx = tx.linked_tx
+    elif isinstance(tx, (FactoringTx, RealEstateCFTx, DepositTx)):
+        net_amount = str(tx.net_amount)
+        fees = str(tx.fees)
+        retentions = str(tx.retentions)
+        interests = str(tx.interests)
+
+    return (
+        str(tx.id),
+        tx.ref,
+        tx.name,
+        str(tx.amount),
+        tx.currency,
+        tx.type.value,
+        tx.date.isoformat(),
+        str(tx.entity.id),
+        tx.is_real,
+        tx.product_type.value,
+        created_at,
+        isin,
+        ticker,
+        market,
+        shares,
+        price,
+        net_amount,
+        fees,
+        retentions,
+        order_date,
+        linked_tx,
+        interests,
+    )
+
+
+def _account_row(tx: AccountTx, created_at: str) -> tuple:
+    return (
+        str(tx.id),
+        tx.ref,
+        tx.name,
+        str(tx.amount),
+        tx.currency,
+        tx.type.value,
+        tx.date.isoformat(),
+        str(tx.entity.id),
+        tx.is_real,
+        created_at,
+        str(tx.fees),
+        str(tx.retentions),
+        str(tx.interest_rate) if tx.interest_rate else None,
+        str(tx.avg_balance) if tx.avg_balance else None,
+    )
+
+
 class TransactionSQLRepository(TransactionPort):
     def __init__(self, client: DBClient):
         self._db_client = client
@@ -139,116 +207,70 @@ class TransactionSQLRepository(TransactionPort):
             self._save_account(data.account)
 
     def _save_investment(self, txs: List[BaseInvestmentTx]):
+        created_at = datetime.now(tzlocal()).isoformat()
+        rows = [_investment_row(tx, created_at) for tx in txs]
         with self._db_client.tx() as cursor:
-            for tx in txs:
-                entry = {
-                    "id": str(tx.id),
-                    "ref": tx.ref,
-                    "name": tx.name,
-                    "amount": str(tx.amount),
-                    "currency": tx.currency,
-                    "type": tx.type.value,
-                    "date": tx.date.isoformat(),
-                    "entity_id": str(tx.entity.id),
-                    "is_real": tx.is_real,
-                    "product_type": tx.product_type.value,
-                    "created_at": datetime.now(tzlocal()).isoformat(),
-                    "isin": None,
-                    "ticker": None,
-                    "market": None,
-                    "shares": None,
-                    "price": None,
-                    "net_amount": None,
-                    "fees": None,
-                    "retentions": None,
-                    "order_date": None,
-                    "linked_tx": None,
-                    "interests": None,
-                }
-
-                if isinstance(tx, StockTx):
-                    entry.update(
-                        {
-                            "isin": tx.isin,
-                            "ticker": tx.ticker,
-                            "market": tx.market,
-                            "shares": str(tx.shares),
-                            "price": str(tx.price),
-                            "net_amount": str(tx.net_amount),
-                            "fees": str(tx.fees),
-                            "retentions": str(tx.retentions) if tx.retentions else None,
-                            "order_date": tx.order_date.isoformat()
-                            if tx.order_date
-                            else None,
-                            "linked_tx": tx.linked_tx,
-                        }
-                    )
-                elif isinstance(tx, FundTx):
-                    entry.update(
-                        {
-                            "isin": tx.isin,
-                            "market": tx.market,
-                            "shares": str(tx.shares),
-                            "price": str(tx.price),
-                            "net_amount": str(tx.net_amount),
-                            "fees": str(tx.fees),
-                            "retentions": str(tx.retentions) if tx.retentions else None,
-                            "order_date": tx.order_date.isoformat()
-                            if tx.order_date
-                            else None,
-                        }
-                    )
-                elif isinstance(tx, (FactoringTx, RealEstateCFTx, DepositTx)):
-                    entry.update(
-                        {
-                            "net_amount": str(tx.net_amount),
-                            "fees": str(tx.fees),
-                            "retentions": str(tx.retentions),
-                            "interests": str(tx.interests),
-                        }
-                    )
-
-                cursor.execute(
-                    """
-                    INSERT INTO investment_transactions (id, ref, name, amount, currency, type, date,
-                                                         entity_id, is_real, product_type, created_at,
-                                                         isin, ticker, market, shares, price, net_amount,
-                                                         fees, retentions, order_date, linked_tx, interests)
-                    VALUES (:id, :ref, :name, :amount, :currency, :type, :date,
-                            :entity_id, :is_real, :product_type, :created_at,
-                            :isin, :ticker, :market, :shares, :price, :net_amount,
-                            :fees, :retentions, :order_date, :linked_tx, :interests)
-                    """,
-                    entry,
-                )
+            cursor.executemany(
+                """
+                INSERT INTO investment_transactions (id, ref, name, amount, currency, type, date,
+                                                     entity_id, is_real, product_type, created_at,
+                                                     isin, ticker, market, shares, price, net_amount,
+                                                     fees, retentions, order_date, linked_tx, interests)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (entity_id, ref) WHERE is_real DO UPDATE SET name         = excluded.name,
+                                                                        amount       = excluded.amount,
+                                                                        currency     = excluded.currency,
+                                                                        type         = excluded.type,
+                                                                        date         = excluded.date,
+                                                                        product_type = excluded.product_type,
+                                                                        isin         = excluded.isin,
+                                                                        ticker       = excluded.ticker,
+                                                                        market       = excluded.market,
+                                                                        shares       = excluded.shares,
+                                                                        price        = excluded.price,
+                                                                        net_amount   = excluded.net_amount,
+                                                                        fees         = excluded.fees,
+                                                                        retentions   = excluded.retentions,
+                                                                        order_date   = excluded.order_date,
+                                                                        linked_tx    = excluded.linked_tx,
+                                                                        interests    = excluded.interests
+                WHERE (name, amount, currency, type, date, product_type, isin, ticker, market,
+                       shares, price, net_amount, fees, retentions, order_date, linked_tx, interests)
+                          IS NOT (excluded.name, excluded.amount, excluded.currency, excluded.type,
+                                  excluded.date, excluded.product_type, excluded.isin, excluded.ticker,
+                                  excluded.market, excluded.shares, excluded.price, excluded.net_amount,
+                                  excluded.fees, excluded.retentions, excluded.order_date,
+                                  excluded.linked_tx, excluded.interests)
+                """,
+                rows,
+            )
 
     def _save_account(self, txs: List[AccountTx]):
+        created_at = datetime.now(tzlocal()).isoformat()
+        rows = [_account_row(tx, created_at) for tx in txs]
         with self._db_client.tx() as cursor:
-            for tx in txs:
-                cursor.execute(
-                    """
-                    INSERT INTO account_transactions (id, ref, name, amount, currency, type, date,
-                                                      entity_id, is_real, created_at,
-                                                      fees, retentions, interest_rate, avg_balance)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        str(tx.id),
-                        tx.ref,
-                        tx.name,
-                        str(tx.amount),
-                        tx.currency,
-                        tx.type.value,
-                        tx.date.isoformat(),
-                        str(tx.entity.id),
-                        tx.is_real,
-                        datetime.now(tzlocal()).isoformat(),
-                        str(tx.fees),
-                        str(tx.retentions),
-                        str(tx.interest_rate) if tx.interest_rate else None,
-                        str(tx.avg_balance) if tx.avg_balance else None,
-                    ),
-                )
+            cursor.executemany(
+                """
+                INSERT INTO account_transactions (id, ref, name, amount, currency, type, date,
+                                                  entity_id, is_real, created_at,
+                                                  fees, retentions, interest_rate, avg_balance)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (entity_id, ref) WHERE is_real DO UPDATE SET name          = excluded.name,
+                                                                        amount        = excluded.amount,
+                                                                        currency      = excluded.currency,
+                                                                        type          = excluded.type,
+                                                                        date          = excluded.date,
+                                                                        fees          = excluded.fees,
+                                                                        retentions    = excluded.retentions,
+                                                                        interest_rate = excluded.interest_rate,
+                                                                        avg_balance   = excluded.avg_balance
+                WHERE (name, amount, currency, type, date, fees, retentions, interest_rate, avg_balance)
+                          IS NOT (excluded.name, excluded.amount, excluded.currency, excluded.type,
+                                  excluded.date, excluded.fees, excluded.retentions,
+                                  excluded.interest_rate, excluded.avg_balance)
+                """,
+                rows,
+            )
 
     def get_all(self, real: Optional[bool] = None) -> Transactions:
         return Transactions(
@@ -319,21 +341,8 @@ class TransactionSQLRepository(TransactionPort):
             )
             return [_map_account_row(row) for row in cursor.fetchall()]
 
-    def get_refs_by_entity(self, entity_id: UUID) -> Set[str]:
-        with self._db_client.read() as cursor:
-            cursor.execute(
-                """
-                           SELECT ref
-                           FROM investment_transactions
-                           WHERE entity_id = ?
-                           UNION
-                           SELECT ref
-                           FROM account_transactions
-                           WHERE entity_id = ?
-                           """,
-                (str(entity_id), str(entity_id)),
-            )
-            return {row[0] for row in cursor.fetchall()}
+    def get_refs_by_entity(self, entity_id: UUID) -> Container[str]:
+        return EntityTxRefs(self._db_client, entity_id)
 
     def get_by_entity(self, entity_id: UUID) -> Transactions:
         return Transactions(
@@ -341,6 +350,26 @@ class TransactionSQLRepository(TransactionPort):
             account=self._get_account_txs_by_entity(entity_id),
         )
 
+    def get_investment_by_names(
+        self, entity_id: UUID, names: list[str]
+    ) -> List[BaseInvestmentTx]:
+        if not names:
+            return []
+
+        placeholders = ", ".join("?" for _ in names)
+        with self._db_client.read() as cursor:
+            cursor.execute(
+                f"""
+                SELECT it.*, e.name AS entity_name, e.id AS entity_id, e.type as entity_type, e.is_real AS entity_is_real
+                FROM investment_transactions it
+                         JOIN entities e ON it.entity_id = e.id
+                WHERE it.entity_id = ?
+                  AND it.name IN ({placeholders})
+                """,
+                (str(entity_id), *names),
+            )
+            return [_map_investment_row(row) for row in cursor.fetchall()]
+
     def get_refs_by_source_type(self, real: bool) -> Set[str]:
         with self._db_client.read() as cursor:
             cursor.execute(
@@ -359,116 +388,199 @@ class TransactionSQLRepository(TransactionPort):
 
     def get_by_filters(self, query: TransactionQueryRequest) -> list[BaseTx]:
         params = []
-        base_sql = """
-                   SELECT tx.*, e.name AS entity_name, e.type as entity_type, e.is_real AS entity_is_real
-                   FROM (SELECT id,
-                                ref,
-                                name,
-                                amount,
-                                currency,
-                                type,
-                                date,
-                                entity_id,
-                                is_real,
-                                product_type,
-                                fees,
-                                retentions,
-                                NULL AS interest_rate,
-                                NULL AS avg_balance,
-                                isin,
-                                ticker,
-                                market,
-                                shares,
-                                price,
-                                net_amount,
-                                order_date,
-                                linked_tx,
-                                interests
-                         FROM investment_transactions
-                         UNION ALL
-                         SELECT id,
-                                ref,
-                                name,
-                                amount,
-                                currency,
-                                type,
-                                date,
-                                entity_id,
-                                is_real,
-                                'ACCOUNT' AS product_type,
-                                fees,
-                                retentions,
-                                interest_rate,
-                                avg_balance,
-                                NULL      AS isin,
-                                NULL      AS ticker,
-                                NULL      AS market,
-                                NULL      AS shares,
-                                NULL      AS price,
-                                NULL      AS net_amount,
-                                NULL      AS order_date,
-                                NULL      AS linked_tx,
-                                NULL      AS interests
-                         FROM account_transactions) tx
-                            JOIN entities e ON tx.entity_id = e.id
-                   """
-
         conditions = []
         if query.entities:
             placeholders = ", ".join("?" for _ in query.entities)
-            conditions.append(f"tx.entity_id IN ({placeholders})")
+            conditions.append(f"ti.entity_id IN ({placeholders})")
             params.extend([str(e) for e in query.entities])
         if query.excluded_entities:
             placeholders = ", ".join("?" for _ in query.excluded_entities)
-            conditions.append(f"tx.entity_id NOT IN ({placeholders})")
+            conditions.append(f"ti.entity_id NOT IN ({placeholders})")
             params.extend([str(e) for e in query.excluded_entities])
         if query.product_types:
             placeholders = ", ".join("?" for _ in query.product_types)
-            conditions.append(f"tx.product_type IN ({placeholders})")
+            conditions.append(f"ti.product_type IN ({placeholders})")
             params.extend([pt.value for pt in query.product_types])
         if query.types:
             placeholders = ", ".join("?" for _ in query.types)
-            conditions.append(f"tx.type IN ({placeholders})")
+            conditions.append(f"ti.type IN ({placeholders})")
             params.extend([t.value for t in query.types])
         if query.from_date:
-            conditions.append("tx.date >= ?")
+            conditions.append("ti.date >= ?")
             params.append(query.from_date.isoformat())
         if query.to_date:
-            conditions.append("tx.date <= ?")
+            conditions.append("ti.date <= ?")
             params.append(query.to_date.isoformat())
+        if query.cursor:
+            conditions.append("(ti.date, ti.id) < (?, ?)")
+            params.extend([query.cursor.date.isoformat(), str(query.cursor.id)])
 
         where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        order_pagination = "ORDER BY tx.date DESC LIMIT ? OFFSET ?"
-        offset = (query.page - 1) * query.limit
-        params.extend([query.limit, offset])
-        sql = f"{base_sql} {where_clause} {order_pagination}"
+        pagination = "LIMIT ?"
+        params.append(query.limit)
+        if not query.cursor:
+            pagination += " OFFSET ?"
+            params.append((query.page - 1) * query.limit)
+
+        sql = f"""
+              SELECT ti.id, ti.source
+              FROM transaction_index ti
+              {where_clause}
+              ORDER BY ti.date DESC, ti.id DESC
+              {pagination}
+              """
 
         with self._db_client.read() as cursor:
             cursor.execute(sql, tuple(params))
-            rows = cursor.fetchall()
+            page = [(row["id"], row["source"]) for row in cursor.fetchall()]
 
-        tx_list = []
-        for row in rows:
-            if row["product_type"] == "ACCOUNT":
-                tx = _map_account_row(row)
-            else:
-                tx = _map_investment_row(row)
-            tx_list.append(tx)
+            investment_ids = [tx_id for tx_id, source in page if source == "INVESTMENT"]
+            account_ids = [tx_id for tx_id, source in page if source == "ACCOUNT"]
 
-        return tx_list
+            txs_by_id = {}
+            if investment_ids:
+                placeholders = ", ".join("?" for _ in investment_ids)
+                cursor.execute(
+                    f"""
+                    SELECT it.*, e.name AS entity_name, e.type as entity_type, e.is_real AS entity_is_real
+                    FROM investment_transactions it
+                             JOIN entities e ON it.entity_id = e.id
+                    WHERE it.id IN ({placeholders})
+                    """,
+                    tuple(investment_ids),
+                )
+                for row in cursor.fetchall():
+                    txs_by_id[row["id"]] = _map_investment_row(row)
+
+            if account_ids:
+                placeholders = ", ".join("?" for _ in account_ids)
+                cursor.execute(
+                    f"""
+                    SELECT at.*, e.name AS entity_name, e.type as entity_type, e.is_real AS entity_is_real
+                    FROM account_transactions at
+                             JOIN entities e ON at.entity_id = e.id
+                    WHERE at.id IN ({placeholders})
+                    """,
+                    tuple(account_ids),
+                )
+                for row in cursor.fetchall():
+                    txs_by_id[row["id"]] = _map_account_row(row)
+
+        return [txs_by_id[tx_id] for tx_id, _ in page if tx_id in txs_by_id]
 
     def delete_non_real(self):
         with self._db_client.tx() as cursor:
             cursor.execute("DELETE FROM investment_transactions WHERE NOT is_real")
             cursor.execute("DELETE FROM account_transactions WHERE NOT is_real")
 
-    def delete_for_real_entity(self, entity_id: UUID):
+    def delete_stale_for_real_entity(self, entity_id: UUID, fetched: Transactions):
         with self._db_client.tx() as cursor:
+            self._delete_stale(
+                cursor,
+                "investment_transactions",
+                entity_id,
+                {tx.ref for tx in fetched.investment or []},
+            )
+            self._delete_stale(
+                cursor,
+                "account_transactions",
+                entity_id,
+                {tx.ref for tx in fetched.account or []},
+            )
+
+    @staticmethod
+    def _delete_stale(cursor: DBCursor, table: str, entity_id: UUID, refs: set[str]):
+        cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS fetched_tx_refs (ref TEXT PRIMARY KEY)"
+        )
+        cursor.execute("DELETE FROM fetched_tx_refs")
+        cursor.executemany(
+            "INSERT OR IGNORE INTO fetched_tx_refs (ref) VALUES (?)",
+            [(ref,) for ref in refs],
+        )
+        cursor.execute(
+            f"""
+            DELETE
+            FROM {table}
+            WHERE entity_id = ?
+              AND is_real
+              AND ref NOT IN (SELECT ref FROM fetched_tx_refs)
+            """,
+            (str(entity_id),),
+        )
+        cursor.execute("DELETE FROM fetched_tx_refs")
+
+
+class EntityTxRefs(Container[str]):
+    """Membership check against the refs of an entity's real transactions.
+
+    Refs are scanned once into a bloom filter, so most new transactions are
+    ruled out without a query and without holding every ref in memory. Hits
+    are confirmed against the partial unique indexes, as they can be false
+    positives.
+    """
+
+    def __init__(self, client: DBClient, entity_id: UUID):
+        self._db_client = client
+        self._entity_id = str(entity_id)
+        self._confirmed: dict[str, bool] = {}
+
+        with self._db_client.read() as cursor:
             cursor.execute(
-                "DELETE FROM investment_transactions WHERE entity_id = ? AND is_real",
-                (str(entity_id),),
+                """
+                SELECT (SELECT COUNT(*)
+                        FROM investment_transactions
+                        WHERE entity_id = ?
+                          AND is_real)
+                           + (SELECT COUNT(*)
+                              FROM account_transactions
+                              WHERE entity_id = ?
+                                AND is_real)
+                """,
+                (self._entity_id, self._entity_id),
+            )
+            self._filter = BloomFilter(cursor.fetchone()[0])
+
+            cursor.execute(
+                """
+                SELECT ref
+                FROM investment_transactions
+                WHERE entity_id = ?
+                  AND is_real
+                UNION ALL
+                SELECT ref
+                FROM account_transactions
+                WHERE entity_id = ?
+                  AND is_real
+                """,
+                (self._entity_id, self._entity_id),
             )
+            for row in cursor:
+                self._filter.add(row[0])
+
+    def __contains__(self, ref) -> bool:
+        if ref not in self._filter:
+            return False
+
+        if ref not in self._confirmed:
+            self._confirmed[ref] = self._exists(ref)
+        return self._confirmed[ref]
+
+    def _exists(self, ref: str) -> bool:
+        with self._db_client.read() as cursor:
             cursor.execute(
-                "DELETE FROM account_transactions WHERE entity_id = ? AND is_real",
-                (str(entity_id),),
+                """
+                SELECT EXISTS(SELECT 1
+                              FROM investment_transactions
+                              WHERE entity_id = ?
+                                AND ref = ?
+                                AND is_real)
+                           OR EXISTS(SELECT 1
+                                     FROM account_transactions
+                                     WHERE entity_id = ?
+                                       AND ref = ?
+                                       AND is_real)
+                """,
+                (self._entity_id, ref, self._entity_id, ref),
             )
+            return bool(cursor.fetchone()[0])
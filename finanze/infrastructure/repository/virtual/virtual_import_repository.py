@@ -5,6 +5,7 @@ from application.ports.virtual_import_registry import VirtualImportRegistry
 from domain.entity import Feature
 from domain.virtual_fetch import VirtualDataImport, VirtualDataSource
 from infrastructure.repository.db.client import DBClient
+from infrastructure.repository.position import latest_positions
 
 
 class VirtualImportRepository(VirtualImportRegistry):
@@ -30,6 +31,8 @@ class VirtualImportRepository(VirtualImportRegistry):
                     ),
                 )
 
+            latest_positions.refresh_virtual(cursor)
+
     def get_last_import_records(self) -> list[VirtualDataImport]:
         with self._db_client.tx() as cursor:
             cursor.execute(
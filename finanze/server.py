@@ -4,22 +4,31 @@ import logging
 import domain.native_entities
 from application.use_cases.add_entity_credentials import AddEntityCredentialsImpl
 from application.use_cases.change_user_password import ChangeUserPasswordImpl
+from application.use_cases.compact_positions import CompactPositionsImpl
 from application.use_cases.connect_crypto_wallet import ConnectCryptoWalletImpl
 from application.use_cases.connect_etherscan import ConnectEtherscanImpl
 from application.use_cases.connect_google import ConnectGoogleImpl
 from application.use_cases.delete_crypto_wallet import DeleteCryptoWalletConnectionImpl
 from application.use_cases.disconnect_entity import DisconnectEntityImpl
+from application.use_cases.fetch_all_financial_data import FetchAllFinancialDataImpl
 from application.use_cases.fetch_crypto_data import FetchCryptoDataImpl
 from application.use_cases.fetch_financial_data import FetchFinancialDataImpl
 from application.use_cases.get_available_entities import GetAvailableEntitiesImpl
 from application.use_cases.get_contributions import GetContributionsImpl
 from application.use_cases.get_exchange_rates import GetExchangeRatesImpl
 from application.use_cases.get_external_integrations import GetExternalIntegrationsImpl
+from application.use_cases.get_fetch_run import GetFetchRunImpl
+from application.use_cases.get_fetch_run_trends import GetFetchRunTrendsImpl
 from application.use_cases.get_login_status import GetLoginStatusImpl
 from application.use_cases.get_position import GetPositionImpl
+from application.use_cases.get_position_history import GetPositionHistoryImpl
+from application.use_cases.get_position_totals import GetPositionTotalsImpl
 from application.use_cases.get_settings import GetSettingsImpl
+from application.use_cases.get_slowest_fetch_runs import GetSlowestFetchRunsImpl
 from application.use_cases.get_transactions import GetTransactionsImpl
+from application.use_cases.rebuild_latest_positions import RebuildLatestPositionsImpl
 from application.use_cases.register_user import RegisterUserImpl
+from application.use_cases.run_scheduled_fetches import RunScheduledFetchesImpl
 from application.use_cases.save_commodities import SaveCommoditiesImpl
 from application.use_cases.update_crypto_wallet import UpdateCryptoWalletConnectionImpl
 from application.use_cases.update_settings import UpdateSettingsImpl
@@ -55,13 +64,23 @@ from infrastructure.client.entity.financial.urbanitae.urbanitae_fetcher import (
     UrbanitaeFetcher,
 )
 from infrastructure.client.entity.financial.wecity.wecity_fetcher import WecityFetcher
+from infrastructure.client.http.http_session import http_metrics
 from infrastructure.client.rates.crypto_price_client import CryptoPriceClient
 from infrastructure.client.rates.exchange_rate_client import ExchangeRateClient
 from infrastructure.client.rates.metal.metal_price_client import MetalPriceClient
 from infrastructure.config.config_loader import ConfigLoader
 from infrastructure.controller.config import flask
 from infrastructure.controller.controllers import register_routes
+from infrastructure.controller.exception_handler import map_job_error
 from infrastructure.credentials.credentials_reader import CredentialsReader
+from infrastructure.jobs.fetch_progress_broker import FetchProgressBroker
+from infrastructure.jobs.fetch_scheduler import FetchScheduler
+from infrastructure.jobs.job_runner import JobRunner
+from infrastructure.maintenance.position_retention_worker import (
+    PositionRetentionWorker,
+)
+from infrastructure.metrics.fetch_trace_recorder import FetchTraceRecorder
+from infrastructure.metrics.metrics_registry import MetricsRegistry
 from infrastructure.repository import (
     AutoContributionsRepository,
     EntityRepository,
@@ -76,15 +95,24 @@ from infrastructure.repository.crypto_wallets.crypto_wallet_connection_repositor
     CryptoWalletConnectionRepository,
 )
 from infrastructure.repository.db.client import DBClient
+from infrastructure.repository.db.instrumentation import DBInstrumentation
+from infrastructure.repository.db.maintenance import DBMaintenance
 from infrastructure.repository.db.manager import DBManager
 from infrastructure.repository.db.transaction_handler import TransactionHandler
 from infrastructure.repository.external_integration.external_integration_repository import (
     ExternalIntegrationRepository,
 )
+from infrastructure.repository.fetch.fetch_trace_repository import (
+    FetchTraceRepository,
+)
 from infrastructure.repository.fetch.last_fetches_repository import (
     LastFetchesRepository,
 )
 from infrastructure.repository.sessions.sessions_repository import SessionsRepository
+from infrastructure.repository.sync.movement_cache_repository import (
+    MovementCacheRepository,
+)
+from infrastructure.repository.sync.sync_cursor_repository import SyncCursorRepository
 from infrastructure.repository.virtual.virtual_import_repository import (
     VirtualImportRepository,
 )
@@ -92,7 +120,7 @@ from infrastructure.sheets.exporter.sheets_exporter import SheetsExporter
 from infrastructure.sheets.importer.sheets_importer import SheetsImporter
 from infrastructure.sheets.sheets_service_loader import SheetsServiceLoader
 from infrastructure.user_files.user_data_manager import UserDataManager
-from waitress import serve
+from waitress.server import create_server
 
 
 class FinanzeServer:
@@ -102,7 +130,13 @@ class FinanzeServer:
 
         self._log.info("Initializing components...")
 
-        self.db_client = DBClient()
+        db_instrumentation = (
+            DBInstrumentation(self.args.slow_query_ms)
+            if self.args.db_instrumentation
+            else None
+        )
+        self.db_client = DBClient(instrumentation=db_instrumentation)
+        self.metrics = MetricsRegistry(self.db_client)
         self.db_manager = DBManager(self.db_client)
         self.data_manager = UserDataManager(self.args.data_dir)
 
@@ -110,13 +144,18 @@ class FinanzeServer:
         self.sheets_initiator = SheetsServiceLoader()
         self.etherscan_client = EtherscanClient()
 
+        self.sync_cursor_repository = SyncCursorRepository(client=self.db_client)
+        self.movement_cache_repository = MovementCacheRepository(client=self.db_client)
+
         self.financial_entity_fetchers = {
             domain.native_entities.MY_INVESTOR: MyInvestorScraper(),
             domain.native_entities.TRADE_REPUBLIC: TradeRepublicFetcher(),
             domain.native_entities.UNICAJA: UnicajaFetcher(),
             domain.native_entities.URBANITAE: UrbanitaeFetcher(),
             domain.native_entities.WECITY: WecityFetcher(),
-            domain.native_entities.SEGO: SegoFetcher(),
+            domain.native_entities.SEGO: SegoFetcher(
+                self.sync_cursor_repository, self.movement_cache_repository
+            ),
             domain.native_entities.MINTOS: MintosFetcher(),
             domain.native_entities.F24: F24Fetcher(),
             domain.native_entities.INDEXA_CAPITAL: IndexaCapitalFetcher(),
@@ -127,7 +166,9 @@ class FinanzeServer:
             domain.native_entities.ETHEREUM: EthereumFetcher(),
             domain.native_entities.LITECOIN: LitecoinFetcher(),
             domain.native_entities.TRON: TronFetcher(),
-            domain.native_entities.BSC: BSCFetcher(self.etherscan_client),
+            domain.native_entities.BSC: BSCFetcher(
+                self.etherscan_client, self.sync_cursor_repository
+            ),
         }
 
         self.virtual_fetcher = SheetsImporter(self.sheets_initiator)
@@ -144,9 +185,11 @@ class FinanzeServer:
             client=self.db_client
         )
         last_fetches_repository = LastFetchesRepository(client=self.db_client)
+        fetch_trace_repository = FetchTraceRepository(client=self.db_client)
         external_integration_repository = ExternalIntegrationRepository(
             client=self.db_client
         )
+        db_maintenance = DBMaintenance(client=self.db_client)
         exchange_rate_client = ExchangeRateClient()
         crypto_price_client = CryptoPriceClient()
         metal_price_client = MetalPriceClient()
@@ -162,6 +205,14 @@ class FinanzeServer:
             )
 
         transaction_handler = TransactionHandler(client=self.db_client)
+        fetch_trace_recorder = FetchTraceRecorder(fetch_trace_repository)
+        http_metrics.add_listener(fetch_trace_recorder.record_http_request)
+        fetch_progress_broker = FetchProgressBroker(
+            [
+                self.metrics.record_fetch_progress,
+                fetch_trace_recorder.record_fetch_progress,
+            ]
+        )
 
         user_login = UserLoginImpl(
             self.db_manager,
@@ -201,6 +252,10 @@ class FinanzeServer:
             sessions_repository,
             last_fetches_repository,
             transaction_handler,
+            fetch_progress_broker,
+        )
+        fetch_all_financial_data = FetchAllFinancialDataImpl(
+            fetch_financial_data, self.config_loader, fetch_progress_broker
         )
         fetch_crypto_data = FetchCryptoDataImpl(
             position_repository,
@@ -210,6 +265,7 @@ class FinanzeServer:
             self.config_loader,
             last_fetches_repository,
             transaction_handler,
+            fetch_progress_broker,
         )
         update_sheets = UpdateSheetsImpl(
             position_repository,
@@ -230,6 +286,7 @@ class FinanzeServer:
             self.config_loader,
             virtual_import_repository,
             transaction_handler,
+            fetch_progress_broker,
         )
         add_entity_credentials = AddEntityCredentialsImpl(
             self.financial_entity_fetchers,
@@ -278,6 +335,34 @@ class FinanzeServer:
             external_integration_repository, self.config_loader, self.etherscan_client
         )
 
+        rebuild_latest_positions = RebuildLatestPositionsImpl(position_repository)
+        get_position_history = GetPositionHistoryImpl(
+            position_repository, exchange_rate_client
+        )
+        get_position_totals = GetPositionTotalsImpl(position_repository)
+        get_slowest_fetch_runs = GetSlowestFetchRunsImpl(fetch_trace_repository)
+        get_fetch_run_trends = GetFetchRunTrendsImpl(fetch_trace_repository)
+        get_fetch_run = GetFetchRunImpl(fetch_trace_repository)
+        compact_positions = CompactPositionsImpl(
+            position_repository, db_maintenance, self.config_loader
+        )
+        self.position_retention_worker = PositionRetentionWorker(
+            compact_positions, self.config_loader
+        )
+        self.job_runner = JobRunner(map_job_error)
+        run_scheduled_fetches = RunScheduledFetchesImpl(
+            fetch_financial_data,
+            fetch_crypto_data,
+            save_commodities,
+            position_repository,
+            credentials_port,
+            crypto_wallet_connections_repository,
+            last_fetches_repository,
+            self.config_loader,
+            self.job_runner,
+        )
+        self.fetch_scheduler = FetchScheduler(run_scheduled_fetches, self.job_runner)
+
         self._log.info("Initial component setup completed.")
 
         if args.logged_username and args.logged_password:
@@ -304,6 +389,7 @@ class FinanzeServer:
             change_user_password,
             get_available_entities,
             fetch_financial_data,
+            fetch_all_financial_data,
             fetch_crypto_data,
             update_sheets,
             virtual_fetch,
@@ -324,13 +410,32 @@ class FinanzeServer:
             get_external_integrations,
             connect_google,
             connect_etherscan,
+            rebuild_latest_positions,
+            get_position_history,
+            get_position_totals,
+            db_instrumentation,
+            self.job_runner,
+            fetch_progress_broker,
+            self.metrics,
+            get_slowest_fetch_runs,
+            get_fetch_run_trends,
+            get_fetch_run,
         )
         self._log.info("Completed.")
 
     def run(self):
         self._log.info(f"Starting Finanze server on port {self.args.port}...")
+        self.position_retention_worker.start()
+        self.job_runner.start()
+        self.fetch_scheduler.start()
         try:
-            serve(self.flask_app, host="0.0.0.0", port=self.args.port)
+            # Each open fetch event stream holds a worker thread
+            server = create_server(
+                self.flask_app, host="0.0.0.0", port=self.args.port, threads=8
+            )
+            self.metrics.bind_server(server)
+            server.print_listen("Serving on http://{}:{}")
+            server.run()
         except OSError as e:
             self._log.error(f"Could not start server on port {self.args.port}: {e}")
             raise
@@ -341,6 +446,8 @@ class FinanzeServer:
             raise
         finally:
             self._log.info("Finanze server shutting down.")
+            self.fetch_scheduler.stop()
+            self.job_runner.stop()
             if self.db_client:
                 if self.db_client.silent_close():
                     self._log.info("Database connection closed.")
@@ -16,6 +16,8 @@ import type {
   ExternalIntegrations,
   GoogleIntegrationCredentials,
   EtherscanIntegrationData,
+  Job,
+  JobStatus,
 } from "@/types"
 import {
   EntityContributions,
@@ -26,7 +28,7 @@ import {
   TransactionQueryRequest,
   TransactionsResult,
 } from "../types/transactions"
-import { handleApiError } from "@/utils/apiErrors"
+import { ApiErrorException, handleApiError } from "@/utils/apiErrors"
 
 import { BASE_URL } from "@/env"
 
@@ -107,78 +109,74 @@ export async function disconnectEntity(entityId: string): Promise<void> {
   }
 }
 
-export async function fetchFinancialEntity(
-  request: FetchRequest,
-): Promise<FetchResponse> {
+const JOB_POLL_INTERVAL_MS = 1000
+
+// Fetches and exports run as jobs, the POST returns the job right away and it
+// is polled until it finishes
+async function runJob<T>(path: string, body?: object): Promise<Job<T>> {
   const baseUrl = await ensureApiUrlInitialized()
-  const response = await fetch(`${baseUrl}/fetch/financial`, {
+  const response = await fetch(`${baseUrl}${path}`, {
     method: "POST",
     headers: {
       "Content-Type": "application/json",
     },
-    body: JSON.stringify(request),
+    body: body ? JSON.stringify(body) : undefined,
   })
+  if (!response.ok) {
+    await handleApiError(response)
+  }
 
-  // Even if the response is not OK, we want to get the error code
-  const data = await response.json()
+  let job: Job<T> = await response.json()
+  while (job.status === JobStatus.PENDING || job.status === JobStatus.RUNNING) {
+    await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS))
+    const jobResponse = await fetch(`${baseUrl}/jobs/${job.id}`)
+    if (!jobResponse.ok) {
+      await handleApiError(jobResponse)
+    }
+    job = await jobResponse.json()
+  }
 
-  if (!response.ok && !data.code) {
-    throw new Error("Fetch failed")
+  return job
+}
+
+// Failed jobs carry the same error code the endpoint used to answer with
+function jobResponse<T>(job: Job<T>, errorMessage: string): T {
+  if (job.status === JobStatus.FAILED) {
+    if (!job.error?.code) {
+      throw new Error(errorMessage)
+    }
+    return job.error as T
   }
 
-  return data
+  return job.result as T
 }
 
-export async function fetchCryptoEntity(
+export async function fetchFinancialEntity(
   request: FetchRequest,
 ): Promise<FetchResponse> {
-  const baseUrl = await ensureApiUrlInitialized()
-  const response = await fetch(`${baseUrl}/fetch/crypto`, {
-    method: "POST",
-    headers: {
-      "Content-Type": "application/json",
-    },
-    body: JSON.stringify(request),
-  })
-
-  // Even if the response is not OK, we want to get the error code
-  const data = await response.json()
-
-  if (!response.ok && !data.code) {
-    throw new Error("Fetch failed")
-  }
+  const job = await runJob<FetchResponse>("/fetch/financial", request)
+  return jobResponse(job, "Fetch failed")
+}
 
-  return data
+export async function fetchCryptoEntity(
+  request: FetchRequest,
+): Promise<FetchResponse> {
+  const job = await runJob<FetchResponse>("/fetch/crypto", request)
+  return jobResponse(job, "Fetch failed")
 }
 
 export async function virtualFetch(): Promise<VirtualFetchResponse> {
-  const baseUrl = await ensureApiUrlInitialized()
-  const response = await fetch(`${baseUrl}/fetch/virtual`, {
-    method: "POST",
-    headers: {
-      "Content-Type": "application/json",
-    },
-  })
-
-  // Even if the response is not OK, we want to get the error code
-  const data = await response.json()
-
-  if (!response.ok && !data.code) {
-    throw new Error("Virtual fetch failed")
-  }
-
-  return data
+  const job = await runJob<VirtualFetchResponse>("/fetch/virtual")
+  return jobResponse(job, "Virtual fetch failed")
 }
 
 export async function updateSheets(request: ExportRequest): Promise<void> {
-  const baseUrl = await ensureApiUrlInitialized()
-  const response = await fetch(`${baseUrl}/export`, {
-    method: "POST",
-    headers: { "Content-Type": "application/json" },
-    body: JSON.stringify(request),
-  })
-  if (!response.ok) {
-    await handleApiError(response)
+  const job = await runJob<void>("/export", request)
+  if (job.status === JobStatus.FAILED) {
+    throw new ApiErrorException(
+      job.error?.code || "UNEXPECTED_ERROR",
+      job.error?.message,
+    )
   }
 }
 
@@ -131,6 +131,27 @@ export interface VirtualFetchResponse {
   errors?: VirtualFetchError[]
 }
 
+export enum JobStatus {
+  PENDING = "PENDING",
+  RUNNING = "RUNNING",
+  COMPLETED = "COMPLETED",
+  FAILED = "FAILED",
+}
+
+export interface Job<T = any> {
+  id: string
+  type: string
+  status: JobStatus
+  created_at: string
+  started_at?: string
+  finished_at?: string
+  result?: T
+  error?: {
+    code: string
+    message?: string
+  }
+}
+
 export interface EntitiesResponse {
   entities: Entity[]
 }